@@ -0,0 +1,74 @@
+"""
+Compares the streaming circle() generator against the original set-based
+circle algorithm, which collected all eight octants into a set before
+returning any points.
+
+Run it from the root of the repository with:
+
+    python benchmarks/benchmark_circle.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pybresenham
+
+
+def setBasedCircle(centerx, centery, radius):
+    # This is the circle() algorithm that PyBresenham used before circle() became a streaming generator.
+    switch = 3 - (2 * radius)
+    cx = 0
+    cy = radius
+    points = set()
+    while cx <= cy:
+        points.add((cx + centerx, -cy + centery))
+        points.add((cy + centerx, -cx + centery))
+        points.add((cy + centerx, cx + centery))
+        points.add((cx + centerx, cy + centery))
+        points.add((-cx + centerx, cy + centery))
+        points.add((-cy + centerx, cx + centery))
+        points.add((-cy + centerx, -cx + centery))
+        points.add((-cx + centerx, -cy + centery))
+        if switch < 0:
+            switch = switch + (4 * cx) + 6
+        else:
+            switch = switch + (4 * (cx - cy)) + 10
+            cy = cy - 1
+        cx = cx + 1
+    return iter(points)
+
+
+def measure(circleFunction, radius):
+    """Returns the seconds until the first point, the total seconds to
+    produce every point, and the peak number of bytes allocated."""
+    # Time the function without tracemalloc, since tracing slows down every allocation.
+    startTime = time.perf_counter()
+    points = circleFunction(0, 0, radius)
+    next(points)
+    firstPointTime = time.perf_counter() - startTime
+    for point in points:
+        pass
+    totalTime = time.perf_counter() - startTime
+
+    # Then run it again to measure the memory.
+    tracemalloc.start()
+    for point in circleFunction(0, 0, radius):
+        pass
+    peakMemory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return firstPointTime, totalTime, peakMemory
+
+
+def main():
+    print('%8s  %-10s %14s %12s %14s' % ('radius', 'algorithm', 'first point', 'total', 'peak memory'))
+    for radius in (100, 1000, 10000, 100000):
+        for name, circleFunction in (('set-based', setBasedCircle), ('streaming', pybresenham.circle)):
+            firstPointTime, totalTime, peakMemory = measure(circleFunction, radius)
+            print('%8s  %-10s %12.3fms %10.3fms %12.1fKB' % (radius, name, firstPointTime * 1000, totalTime * 1000, peakMemory / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
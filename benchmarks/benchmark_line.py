@@ -0,0 +1,111 @@
+"""
+Compares the points per second of line() against the original line()
+algorithm, which checked which of its four cases it was in and whether to
+skip the first point on every point, and lines() against the same.
+
+Run it from the root of the repository with:
+
+    python benchmarks/benchmark_line.py
+"""
+
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pybresenham
+
+
+def originalLine(x1, y1, x2, y2, _skipFirst=False):
+    # This is the line() algorithm that PyBresenham used before line() had
+    # a separate loop for each case.
+    pybresenham._checkForIntOrFloat(x1)
+    pybresenham._checkForIntOrFloat(y1)
+    pybresenham._checkForIntOrFloat(x2)
+    pybresenham._checkForIntOrFloat(y2)
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+
+    isSteep = abs(y2-y1) > abs(x2-x1)
+    if isSteep:
+        x1, y1 = y1, x1
+        x2, y2 = y2, x2
+    isReversed = x1 > x2
+
+    if isReversed:
+        x1, x2 = x2, x1
+        y1, y2 = y2, y1
+
+        deltax = x2 - x1
+        deltay = abs(y2-y1)
+        error = int(deltax / 2)
+        y = y2
+        ystep = 1 if y1 < y2 else (-1 if y1 > y2 else 0)
+        for x in range(x2, x1 - 1, -1):
+            if isSteep:
+                if not (_skipFirst and (x, y) == (x2, y2)):
+                    yield (y, x)
+            else:
+                if not (_skipFirst and (x, y) == (x2, y2)):
+                    yield (x, y)
+            error -= deltay
+            if error <= 0:
+                y -= ystep
+                error += deltax
+    else:
+        deltax = x2 - x1
+        deltay = abs(y2-y1)
+        error = int(deltax / 2)
+        y = y1
+        ystep = 1 if y1 < y2 else (-1 if y1 > y2 else 0)
+        for x in range(x1, x2 + 1):
+            if isSteep:
+                if not (_skipFirst and (x, y) == (x1, y1)):
+                    yield (y, x)
+            else:
+                if not (_skipFirst and (x, y) == (x1, y1)):
+                    yield (x, y)
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
+
+
+def originalLines(points):
+    # lines() validates its points and then calls line() on every segment.
+    return itertools.chain([points[0]], itertools.chain.from_iterable([originalLine(points[i][0], points[i][1], points[i+1][0], points[i+1][1], _skipFirst=True) for i in range(len(points) - 1)]))
+
+
+def pointsPerSecond(makePoints, repeat):
+    startTime = time.perf_counter()
+    numPoints = 0
+    for i in range(repeat):
+        for point in makePoints():
+            numPoints += 1
+    return numPoints / (time.perf_counter() - startTime)
+
+
+def main():
+    polyline = [((i * 37) % 200, (i * 91) % 150) for i in range(2000)]
+    cases = [
+        ('long shallow line', lambda: originalLine(0, 0, 100000, 371), lambda: pybresenham.line(0, 0, 100000, 371), 5),
+        ('long reversed line', lambda: originalLine(100000, 371, 0, 0), lambda: pybresenham.line(100000, 371, 0, 0), 5),
+        ('long steep line', lambda: originalLine(0, 0, 371, 100000), lambda: pybresenham.line(0, 0, 371, 100000), 5),
+        ('long diagonal line', lambda: originalLine(0, 0, 100000, -70000), lambda: pybresenham.line(0, 0, 100000, -70000), 5),
+        ('short lines', lambda: itertools.chain.from_iterable(originalLine(0, 0, i % 7, i % 5) for i in range(10000)),
+                        lambda: itertools.chain.from_iterable(pybresenham.line(0, 0, i % 7, i % 5) for i in range(10000)), 5),
+        ('short lines, validate=False', lambda: itertools.chain.from_iterable(originalLine(0, 0, i % 7, i % 5) for i in range(10000)),
+                                        lambda: itertools.chain.from_iterable(pybresenham.line(0, 0, i % 7, i % 5, validate=False) for i in range(10000)), 5),
+        ('lines() with 2000 points', lambda: originalLines(polyline), lambda: pybresenham.lines(polyline), 5),
+    ]
+
+    print('%-28s %16s %16s %8s' % ('case', 'before (pts/s)', 'after (pts/s)', 'speedup'))
+    for name, before, after, repeat in cases:
+        assert list(before()) == list(after())
+        beforeRate = pointsPerSecond(before, repeat)
+        afterRate = pointsPerSecond(after, repeat)
+        print('%-28s %16.0f %16.0f %7.2fx' % (name, beforeRate, afterRate, afterRate / beforeRate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares rendering a large Scene in one process against rendering its tiles
+in a pool of worker processes. The parallel image is checked to be exactly
+the same as the serial one.
+
+Run it from the root of the repository with:
+
+    python benchmarks/benchmark_scene.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pybresenham
+
+
+def makeScene(width, height, numShapes):
+    # A map-like scene of many small shapes, with the same shapes on every run.
+    random.seed(42)
+    scene = pybresenham.Scene(width, height)
+    for i in range(numShapes):
+        x, y = random.randint(0, width), random.randint(0, height)
+        value = random.randint(1, 255)
+        kind = i % 3
+        if kind == 0:
+            scene.polygon(x, y, random.randint(5, 40), random.randint(3, 8), random.randint(0, 90), filled=True, value=value)
+        elif kind == 1:
+            points = [(x + random.randint(-60, 60), y + random.randint(-60, 60)) for j in range(5)]
+            scene.lines(points, value=value)
+        else:
+            scene.circle(x, y, random.randint(2, 30), filled=random.random() < 0.5, value=value)
+    return scene
+
+
+def main():
+    scene = makeScene(4096, 4096, 100000)
+    print('%d shapes on a %dx%d image, %d CPUs' % (len(scene), scene.width, scene.height, os.cpu_count() or 1))
+
+    startTime = time.perf_counter()
+    serialImage = scene.render(processes=1)
+    print('%-12s %10.3fs' % ('serial', time.perf_counter() - startTime))
+
+    for processes in (2, 4, 8):
+        startTime = time.perf_counter()
+        image = scene.render(processes=processes)
+        print('%-12s %10.3fs' % ('%d processes' % (processes), time.perf_counter() - startTime))
+        assert image == serialImage
+
+
+if __name__ == '__main__':
+    main()
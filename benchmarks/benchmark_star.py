@@ -0,0 +1,62 @@
+"""
+Draws 100,000 star markers into an image, as a map or chart with many point
+markers would, and compares filling stars with the scanline fill that star()
+uses against flood filling each star's outline.
+
+Run it from the root of the repository with:
+
+    python benchmarks/benchmark_star.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pybresenham
+
+
+def makeMarkers(width, height, numMarkers):
+    # Random marker positions and sizes, with the same markers on every run.
+    random.seed(42)
+    return [(random.randint(0, width - 1), random.randint(0, height - 1), random.randint(3, 12)) for i in range(numMarkers)]
+
+
+def floodFilledStar(centerx, centery, radius):
+    # The workaround before star() could be filled: flood fill the outline from the center.
+    return pybresenham.floodFill(list(pybresenham.star(centerx, centery, radius)), centerx, centery)
+
+
+def main():
+    width = height = 4096
+    markers = makeMarkers(width, height, 100000)
+    print('%d star markers on a %dx%d image' % (len(markers), width, height))
+
+    pybresenham.clearPolygonTableCache()
+    pybresenham.clearStarSpansCache()
+    for name, filled in (('outline', False), ('filled', True)):
+        image = bytearray(width * height)
+        startTime = time.perf_counter()
+        numPoints = 0
+        for x, y, radius in markers:
+            numPoints += pybresenham.drawStar(image, x, y, radius, filled=filled, width=width)
+        totalTime = time.perf_counter() - startTime
+        print('%-20s %10.3fs %12d points %12.0f markers/sec' % ('drawStar() ' + name, totalTime, numPoints, len(markers) / totalTime))
+    print('vertex table cache: %s' % (pybresenham.polygonTableCacheInfo(),))
+    print('star spans cache:   %s' % (pybresenham.starSpansCacheInfo(),))
+
+    # Compare the two ways of filling a star on a smaller set of markers.
+    markers = markers[:10000]
+    for name, fillFunction in (('scanline fill', lambda x, y, radius: list(pybresenham.star(x, y, radius, filled=True))),
+                               ('flood fill', floodFilledStar)):
+        startTime = time.perf_counter()
+        numPoints = 0
+        for x, y, radius in markers:
+            numPoints += len(fillFunction(x, y, radius))
+        totalTime = time.perf_counter() - startTime
+        print('%-20s %10.3fs %12d points %12.0f markers/sec' % (name, totalTime, numPoints, len(markers) / totalTime))
+
+
+if __name__ == '__main__':
+    main()
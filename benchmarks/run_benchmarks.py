@@ -0,0 +1,271 @@
+"""
+Runs a fixed set of PyBresenham benchmarks and reports the throughput (points
+per second) and peak memory of each one. The results can be written to a JSON
+file and compared against an earlier results file, so that a slowdown shows up
+before a new version of PyBresenham is adopted.
+
+Run it from the root of the repository with:
+
+    python benchmarks/run_benchmarks.py
+
+Save a baseline, then compare a later run (for example, after upgrading) with:
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json
+
+When comparing, the exit status is 1 if any benchmark is slower (or uses more
+memory) than the baseline by more than --tolerance, which is 0.25 (25%) by
+default. Pass --quick for a fast run with smaller inputs, and --filter to only
+run the benchmarks whose names contain the given text.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pybresenham
+
+# Peak memory differences smaller than this many bytes are ignored when
+# comparing against a baseline, since small allocations vary from run to run.
+MEMORY_SLACK = 64 * 1024
+
+
+def countPoints(points):
+    """Consumes the iterable of points and returns how many there were."""
+    count = 0
+    for count, point in enumerate(points, 1):
+        pass
+    return count
+
+
+def lineOctantBenchmark(octant, length):
+    # The (dx, dy) direction of a line that lies in the middle of each octant,
+    # going clockwise from the positive x axis.
+    directions = ((3, 1), (1, 3), (-1, 3), (-3, 1), (-3, -1), (-1, -3), (1, -3), (3, -1))
+    dx, dy = directions[octant]
+    x2, y2 = dx * length // 3, dy * length // 3
+
+    def run():
+        return countPoints(pybresenham.line(0, 0, x2, y2))
+    return run
+
+
+def linesBenchmark(numVertices):
+    # A random walk, with the same vertices on every run.
+    random.seed(42)
+    points = [(0, 0)]
+    for i in range(numVertices - 1):
+        x, y = points[-1]
+        points.append((x + random.randint(-3, 3), y + random.randint(-3, 3)))
+
+    def run():
+        return countPoints(pybresenham.lines(points))
+    return run
+
+
+def circleBenchmark(radius, filled):
+    def run():
+        return countPoints(pybresenham.circle(0, 0, radius, filled=filled))
+    return run
+
+
+def arcBenchmark(radius, degrees, filled):
+    def run():
+        return countPoints(pybresenham.arc(0, 0, radius, 40, 40 + degrees, filled=filled))
+    return run
+
+
+def filledPolygonBenchmark(radius, sides):
+    def run():
+        return countPoints(pybresenham.polygon(0, 0, radius, sides, rotationDegrees=10, filled=True))
+    return run
+
+
+def starMarkersBenchmark(numMarkers, filled):
+    # Many small stars of a few sizes, as markers on a map or chart are drawn.
+    random.seed(42)
+    markers = [(random.randint(0, 1000), random.randint(0, 1000), random.randint(3, 12)) for i in range(numMarkers)]
+
+    def run():
+        numPoints = 0
+        for x, y, radius in markers:
+            numPoints += countPoints(pybresenham.star(x, y, radius, filled=filled))
+        return numPoints
+    return run
+
+
+def bezierBenchmark(size):
+    def run():
+        return countPoints(pybresenham.bezier([(0, 0), (size, 0), (0, size), (size, size)]))
+    return run
+
+
+def floodFillBenchmark(radius):
+    boundary = set(pybresenham.circle(0, 0, radius))
+
+    def run():
+        return countPoints(pybresenham.floodFill(boundary, 0, 0))
+    return run
+
+
+def gridBenchmark(numBoxes, boxSize):
+    def run():
+        return countPoints(pybresenham.grid(0, 0, numBoxes, numBoxes, boxSize, boxSize))
+    return run
+
+
+def rotatePointsBenchmark(numPoints):
+    random.seed(42)
+    points = [(random.randint(-1000, 1000), random.randint(-1000, 1000)) for i in range(numPoints)]
+
+    def run():
+        return countPoints(pybresenham.rotatePoints(points, 0, 0, 30))
+    return run
+
+
+def drawPointsBenchmark(radius):
+    points = list(pybresenham.circle(0, 0, radius))
+
+    def run():
+        # drawPoints() prints its output, so send it somewhere other than the terminal.
+        with contextlib.redirect_stdout(io.StringIO()):
+            pybresenham.drawPoints(points)
+        return len(points)
+    return run
+
+
+def makeBenchmarks(quick=False):
+    """Returns a list of (name, loops, setup) tuples, where calling setup()
+    prepares any input data and returns a function that draws the shape once
+    and returns the number of points it produced. Each timing calls that
+    function `loops` times, so that small shapes still take a measurable time."""
+    scale = 10 if quick else 1
+    benchmarks = []
+    for octant in range(8):
+        benchmarks.append(('line octant %d' % (octant), 100 // scale, lambda octant=octant: lineOctantBenchmark(octant, 10000)))
+    benchmarks.append(('lines %d vertices' % (1000000 // scale), 1, lambda: linesBenchmark(1000000 // scale)))
+    for radius in (10, 100, 1000, 10000):
+        benchmarks.append(('circle radius %d' % (radius), max(1, 100000 // radius // scale), lambda radius=radius: circleBenchmark(radius, False)))
+    benchmarks.append(('filled circle radius %d' % (1000 // scale), 1, lambda: circleBenchmark(1000 // scale, True)))
+    benchmarks.append(('arc 10 degrees', max(1, 100 // scale), lambda: arcBenchmark(100000 // scale, 10, False)))
+    benchmarks.append(('filled pie 90 degrees', 1, lambda: arcBenchmark(1000 // scale, 90, True)))
+    benchmarks.append(('filled polygon', 1, lambda: filledPolygonBenchmark(1000 // scale, 7)))
+    benchmarks.append(('star markers', 1, lambda: starMarkersBenchmark(10000 // scale, False)))
+    benchmarks.append(('filled star markers', 1, lambda: starMarkersBenchmark(10000 // scale, True)))
+    benchmarks.append(('bezier', max(1, 10 // scale), lambda: bezierBenchmark(10000 // scale)))
+    benchmarks.append(('floodFill', 1, lambda: floodFillBenchmark(500 // scale)))
+    benchmarks.append(('grid', 1, lambda: gridBenchmark(100 // scale, 20)))
+    benchmarks.append(('rotatePoints', 1, lambda: rotatePointsBenchmark(1000000 // scale)))
+    benchmarks.append(('drawPoints', 1, lambda: drawPointsBenchmark(1000 // scale)))
+    return benchmarks
+
+
+def measure(run, loops, repeat):
+    """Returns the number of points, the fastest seconds out of `repeat`
+    timings of `loops` calls to run(), and the peak number of bytes allocated
+    during a single call."""
+    # Time the function without tracemalloc, since tracing slows down every allocation.
+    bestTime = None
+    for i in range(repeat):
+        numPoints = 0
+        startTime = time.perf_counter()
+        for j in range(loops):
+            numPoints += run()
+        totalTime = time.perf_counter() - startTime
+        if bestTime is None or totalTime < bestTime:
+            bestTime = totalTime
+
+    # Then run it again to measure the memory. Drawing the same shape again
+    # doesn't change the peak, so one call is enough.
+    tracemalloc.start()
+    run()
+    peakMemory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return numPoints, bestTime, peakMemory
+
+
+def runBenchmarks(quick=False, repeat=3, nameFilter=None, verbose=True):
+    """Runs the benchmarks and returns the results as a JSON-compatible dict."""
+    results = {}
+    if verbose:
+        print('%-24s %12s %12s %16s %14s' % ('benchmark', 'points', 'seconds', 'points/sec', 'peak memory'))
+    for name, loops, setup in makeBenchmarks(quick):
+        if nameFilter is not None and nameFilter not in name:
+            continue
+        numPoints, bestTime, peakMemory = measure(setup(), loops, repeat)
+        pointsPerSecond = numPoints / bestTime if bestTime > 0 else float(numPoints)
+        results[name] = {'points': numPoints, 'seconds': bestTime, 'pointsPerSecond': pointsPerSecond, 'peakMemory': peakMemory}
+        if verbose:
+            print('%-24s %12d %12.4f %16.0f %12.1fKB' % (name, numPoints, bestTime, pointsPerSecond, peakMemory / 1024.0))
+
+    return {
+        'pybresenham': pybresenham.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': quick,
+        'benchmarks': results,
+    }
+
+
+def compareResults(baseline, current, tolerance=0.25):
+    """Returns a list of (name, description) tuples for every benchmark in
+    `current` whose throughput or peak memory is worse than the same benchmark
+    in `baseline` by more than `tolerance` (a fraction, so 0.25 is 25%)."""
+    regressions = []
+    for name, result in current['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        base = baseline['benchmarks'][name]
+        if result['points'] != base['points']:
+            regressions.append((name, 'produced %d points instead of %d' % (result['points'], base['points'])))
+        if result['pointsPerSecond'] < base['pointsPerSecond'] / (1 + tolerance):
+            regressions.append((name, 'throughput fell from %.0f to %.0f points/sec' % (base['pointsPerSecond'], result['pointsPerSecond'])))
+        if result['peakMemory'] > base['peakMemory'] * (1 + tolerance) + MEMORY_SLACK:
+            regressions.append((name, 'peak memory rose from %.1fKB to %.1fKB' % (base['peakMemory'] / 1024.0, result['peakMemory'] / 1024.0)))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Runs the PyBresenham benchmark suite.')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results against this JSON file from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='the allowed slowdown as a fraction (default 0.25)')
+    parser.add_argument('--repeat', type=int, default=3, help='time each benchmark this many times and keep the fastest (default 3)')
+    parser.add_argument('--filter', help='only run benchmarks whose names contain this text')
+    parser.add_argument('--quick', action='store_true', help='use smaller inputs for a fast run')
+    args = parser.parse_args(args)
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as baselineFile:
+            baseline = json.load(baselineFile)
+        if baseline.get('quick') != args.quick:
+            parser.error('the baseline was %s with --quick' % ('made' if baseline.get('quick') else 'not made'))
+
+    results = runBenchmarks(quick=args.quick, repeat=args.repeat, nameFilter=args.filter)
+    if args.output is not None:
+        with open(args.output, 'w') as outputFile:
+            json.dump(results, outputFile, indent=2, sort_keys=True)
+
+    if baseline is None:
+        return 0
+    regressions = compareResults(baseline, results, args.tolerance)
+    print()
+    if not regressions:
+        print('No regressions against %s (pybresenham %s).' % (args.compare, baseline.get('pybresenham')))
+        return 0
+    for name, description in regressions:
+        print('REGRESSION %-24s %s' % (name, description))
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
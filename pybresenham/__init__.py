@@ -1,8 +1,6 @@
 
 # NOTE: This module is under development and the API could rapidly change with no deprecation warning period.
 
-# TODO - circle() has a problem where it doesn't send off the point for the leftmost side.
-
 
 
 # NOTE: Many of these functions are just aliases for the polygon() function.
@@ -18,7 +16,8 @@
 
 __version__ = '0.0.7'
 
-import doctest
+import array
+import functools
 import itertools
 import math
 
@@ -27,6 +26,29 @@ import math
 ROUNDED_CAP = 1
 SQUARE_CAP = 2
 
+# Constants for the corner join styles of thick lines.
+MITER_JOIN = 3
+ROUNDED_JOIN = 4
+
+# Miter joins longer than this many times the line thickness are beveled instead.
+MITER_LIMIT = 4
+
+# The number of regular polygon vertex tables that polygonVertices() keeps
+# cached. The cache is made when pybresenham is imported, so changing this
+# afterwards doesn't change its size.
+POLYGON_TABLE_CACHE_SIZE = 1024
+
+# The number of stars whose spans starSpans() keeps cached, and the largest
+# radius of a cached star. Bigger stars have too many spans to be worth keeping.
+# The cache is made when pybresenham is imported, so changing the size
+# afterwards doesn't change it, but the radius is checked on every call.
+STAR_SPANS_CACHE_SIZE = 1024
+STAR_SPANS_CACHE_MAX_RADIUS = 64
+
+# Constants for the fill rules of self-intersecting polygons.
+EVEN_ODD = 1
+NONZERO = 2
+
 
 class PyBresenhamException(Exception):
     """
@@ -46,6 +68,70 @@ def _checkForIntOrFloat(arg, minVal=None, maxVal=None):
         raise PyBresenhamException('argument must be at most %s or less' % (maxVal))
 
 
+def _checkClip(clip):
+    # Validates a clip argument and returns it as a (left, top, right, bottom)
+    # tuple of ints, or None if there's no clip rectangle.
+    if clip is None:
+        return None
+    try:
+        left, top, right, bottom = clip
+        _checkForIntOrFloat(left)
+        _checkForIntOrFloat(top)
+        _checkForIntOrFloat(right)
+        _checkForIntOrFloat(bottom)
+    except:
+        raise PyBresenhamException('clip argument must be a (left, top, right, bottom) tuple of int/float values')
+    return (int(left), int(top), int(right), int(bottom))
+
+
+def _importNumpy():
+    # NumPy is an optional dependency, only needed by the batch functions.
+    try:
+        import numpy
+    except ImportError:
+        raise PyBresenhamException('this function requires NumPy, which can be installed with `pip install numpy`')
+    return numpy
+
+
+# The names that are defined in submodules instead of here, so that importing
+# pybresenham only loads the core rasterizers. Each submodule is imported by
+# __getattr__() the first time one of its names is used.
+_LAZY_NAMES = {
+    'linesBatch': '_arrays', 'lineArray': '_arrays', 'rectangleArray': '_arrays', 'diamondArray': '_arrays',
+    'floodFillArray': '_arrays', 'rasterize': '_arrays', 'rasterizeAsync': '_arrays',
+    'Scene': '_scene',
+    'ShapeCache': '_cache', 'CachedShape': '_cache', 'ShapeCacheInfo': '_cache',
+    'INSTRUMENTED_FUNCTIONS': '_instrumentation', 'InstrumentationStats': '_instrumentation',
+    'enableInstrumentation': '_instrumentation', 'disableInstrumentation': '_instrumentation',
+    'instrumentationStats': '_instrumentation', 'clearInstrumentationStats': '_instrumentation',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_NAMES:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    import importlib
+    value = getattr(importlib.import_module('pybresenham.' + _LAZY_NAMES[name]), name)
+    globals()[name] = value # Later uses of the name don't need to call __getattr__().
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+def _cosSin(rotationDegrees):
+    # Returns the cosine and sine of the angle. Quarter turns are exact, since
+    # something like math.cos(math.radians(90)) is slightly more than 0, which
+    # makes rotated points that should land on an int get truncated to the
+    # int before it.
+    rotationDegrees %= 360
+    if rotationDegrees % 90 == 0:
+        return ((1, 0), (0, 1), (-1, 0), (0, -1))[int(rotationDegrees) // 90]
+    rotationRadians = math.radians(rotationDegrees)
+    return math.cos(rotationRadians), math.sin(rotationRadians)
+
+
 def rotatePoint(x, y, rotationDegrees, pivotx=0, pivoty=0):
     """
     Rotates the point at `x` and `y` by `rotationDegrees`. The point is rotated
@@ -81,18 +167,20 @@ def rotatePoints(points, rotationDegrees, pivotx=0, pivoty=0):
 
     Returns a generator that produces an x and y tuple for each point in `points`.
 
+    (To rotate, move, and scale many points at once, use a `Transform` object.)
+
     >>> list(rotatePoints([(10, 0), (7, 7)], 45))
     [(7, 7), (0, 9)]
     """
 
-    rotationRadians = math.radians(rotationDegrees % 360)
+    cos, sin = _cosSin(rotationDegrees)
 
     for x, y in points:
         _checkForIntOrFloat(x)
         _checkForIntOrFloat(y)
         x -= pivotx
         y -= pivoty
-        x, y = x * math.cos(rotationRadians) - y * math.sin(rotationRadians), x * math.sin(rotationRadians) + y * math.cos(rotationRadians)
+        x, y = x * cos - y * sin, x * sin + y * cos
         x += pivotx
         y += pivoty
 
@@ -120,11 +208,167 @@ def translatePoints(points, movex, movey):
         raise PyBresenhamException('`points` argument must be an iterable of (x, y) points.')
 
 
-def line(x1, y1, x2, y2, thickness=1, endcap=None, _skipFirst=False):
+class Transform(object):
+    """
+    A 2D affine transformation made by chaining rotations, translations,
+    scales, and shears. The chain is combined into a single 2x3 matrix, so
+    applying a long chain to a point costs the same as applying one step.
+
+    Each method returns a new Transform that applies its step after the
+    steps already in this one. The rotate(), scale(), and shear() steps
+    happen around the origin, or around `pivotx` and `pivoty` if given.
+
+    Like `rotatePoints()`, the points are rotated counterclockwise, and the
+    transformed coordinates are truncated to ints unless `asFloat` is `True`.
+
+    >>> spin = Transform().rotate(90).translate(5, 0)
+    >>> list(spin.apply([(10, 0), (0, 10)]))
+    [(5, 10), (-5, 0)]
+    >>> list(Transform().scale(2, 3, pivotx=1, pivoty=1).apply([(2, 2)], asFloat=True))
+    [(3.0, 4.0)]
+    """
+
+    def __init__(self, matrix=(1, 0, 0, 0, 1, 0)):
+        # The matrix (a, b, c, d, e, f) maps x, y to (a*x + b*y + c, d*x + e*y + f).
+        if len(matrix) != 6:
+            raise PyBresenhamException('matrix argument must be a tuple of six int/float values')
+        for value in matrix:
+            _checkForIntOrFloat(value)
+        self.matrix = tuple([float(value) for value in matrix])
+
+        # apply() subtracts _origin from each point before multiplying it by the
+        # matrix, and then adds _offsets instead of c and f. The pivot steps put
+        # their pivot in _origin, so that the points are rounded the same way
+        # as by rotatePoints(), which also moves the pivot to the origin first.
+        self._origin = (0.0, 0.0)
+        self._offsets = (self.matrix[2], self.matrix[5])
+
+    @staticmethod
+    def _fromParts(a, b, d, e, origin, offsets):
+        # Returns the Transform that maps x, y to (a*(x - ox) + b*(y - oy) + c, d*(x - ox) + e*(y - oy) + f),
+        # where origin is (ox, oy) and offsets is (c, f).
+        (originx, originy), (c, f) = origin, offsets
+        transform = Transform((a, b, c - a * originx - b * originy, d, e, f - d * originx - e * originy))
+        transform._origin, transform._offsets = (float(originx), float(originy)), (float(c), float(f))
+        return transform
+
+    def __repr__(self):
+        return 'Transform(%r)' % (self.matrix,)
+
+    def __eq__(self, other):
+        return isinstance(other, Transform) and self.matrix == other.matrix
+
+    def then(self, other):
+        """Returns a new Transform that applies this Transform and then `other`."""
+        if not isinstance(other, Transform):
+            raise PyBresenhamException('other argument must be a Transform')
+        if self.matrix == (1.0, 0.0, 0.0, 0.0, 1.0, 0.0):
+            return other # (Transforms can't be changed, so `other` can be shared.)
+        a, b, c, d, e, f = self.matrix
+        c, f = self._offsets
+        na, nb, nc, nd, ne, nf = other.matrix
+        nc, nf = other._offsets
+        movex, movey = c - other._origin[0], f - other._origin[1]
+        return Transform._fromParts(na * a + nb * d, na * b + nb * e, nd * a + ne * d, nd * b + ne * e, self._origin,
+                                    (na * movex + nb * movey + nc, nd * movex + ne * movey + nf))
+
+    def _aroundPivot(self, a, b, d, e, pivotx, pivoty):
+        # Returns this Transform followed by the linear map (a, b, d, e) around the pivot point.
+        _checkForIntOrFloat(pivotx)
+        _checkForIntOrFloat(pivoty)
+        return self.then(Transform._fromParts(a, b, d, e, (pivotx, pivoty), (pivotx, pivoty)))
+
+    def rotate(self, rotationDegrees, pivotx=0, pivoty=0):
+        """Returns a new Transform that also rotates counterclockwise by `rotationDegrees`."""
+        _checkForIntOrFloat(rotationDegrees)
+        cos, sin = _cosSin(rotationDegrees)
+        return self._aroundPivot(cos, -sin, sin, cos, pivotx, pivoty)
+
+    def translate(self, movex, movey):
+        """Returns a new Transform that also moves the points over by `movex` and `movey`."""
+        _checkForIntOrFloat(movex)
+        _checkForIntOrFloat(movey)
+        return self.then(Transform((1, 0, movex, 0, 1, movey)))
+
+    def scale(self, scalex, scaley=None, pivotx=0, pivoty=0):
+        """Returns a new Transform that also scales by `scalex` and `scaley`, which defaults to `scalex`."""
+        if scaley is None:
+            scaley = scalex
+        _checkForIntOrFloat(scalex)
+        _checkForIntOrFloat(scaley)
+        return self._aroundPivot(scalex, 0, 0, scaley, pivotx, pivoty)
+
+    def shear(self, shearx, sheary=0, pivotx=0, pivoty=0):
+        """Returns a new Transform that also shears, moving x by `shearx` times y and y by `sheary` times x."""
+        _checkForIntOrFloat(shearx)
+        _checkForIntOrFloat(sheary)
+        return self._aroundPivot(1, shearx, sheary, 1, pivotx, pivoty)
+
+    def apply(self, points, asFloat=False):
+        """
+        Returns a generator that produces the transformed (x, y) tuple of each
+        point in `points`.
+        """
+        a, b, c, d, e, f = self.matrix
+        originx, originy = self._origin
+        c, f = self._offsets
+        try:
+            if originx == originy == 0:
+                if asFloat:
+                    for x, y in points:
+                        yield (a * x + b * y + c, d * x + e * y + f)
+                else:
+                    for x, y in points:
+                        yield (int(a * x + b * y + c), int(d * x + e * y + f))
+            else:
+                for x, y in points:
+                    x, y = x - originx, y - originy
+                    x, y = a * x + b * y + c, d * x + e * y + f
+                    yield (x, y) if asFloat else (int(x), int(y))
+        except (TypeError, ValueError):
+            raise PyBresenhamException('`points` argument must be an iterable of (x, y) points.')
+
+    def applyArray(self, points, asFloat=False):
+        """
+        Transforms all of the points in `points` at once. This method requires NumPy.
+
+        `points` is an N x 2 NumPy array (or anything that can be converted
+        into one) of x, y coordinates. Returns a new N x 2 array of int64
+        values, or of float64 values if `asFloat` is `True`.
+
+        >>> Transform().rotate(90).translate(5, 0).applyArray([(10, 0), (0, 10)]).tolist()
+        [[5, 10], [-5, 0]]
+        """
+        numpy = _importNumpy()
+        points = numpy.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 2 or points.dtype.kind not in 'iuf':
+            raise PyBresenhamException('points argument must be an N x 2 array of int or float values')
+        a, b, c, d, e, f = self.matrix
+        c, f = self._offsets
+        xs, ys = points[:, 0].astype(numpy.float64) - self._origin[0], points[:, 1].astype(numpy.float64) - self._origin[1]
+        result = numpy.empty(points.shape, dtype=numpy.float64)
+        result[:, 0] = a * xs + b * ys + c
+        result[:, 1] = d * xs + e * ys + f
+        if asFloat:
+            return result
+        return numpy.trunc(result).astype(numpy.int64)
+
+
+def line(x1, y1, x2, y2, thickness=1, endcap=None, validate=True, clip=None, _skipFirst=False):
     """
     Returns a generator that produces all of the points in a line between `x1`, `y1` and `x2`, `y2`.
 
-    (Note: The `thickness` and `endcap` parameters are not yet implemented.)
+    If `thickness` is more than 1, the points of a thick line are produced
+    row by row instead, with the end caps given by `endcap` (see `strokeSpans()`).
+
+    If `validate` is `False`, the arguments aren't checked, which saves time
+    when drawing many short lines. The coordinates must then be ints.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle (including its edges) are produced. They are the same
+    points that the unclipped line has there, but the line skips straight to
+    the part inside the rectangle, so a huge line that is mostly outside of
+    it costs no more than its visible part.
 
     >>> list(line(0, 0, 10, 3))
     [(0, 0), (1, 0), (2, 1), (3, 1), (4, 1), (5, 1), (6, 2), (7, 2), (8, 2), (9, 3), (10, 3)]
@@ -133,80 +377,263 @@ def line(x1, y1, x2, y2, thickness=1, endcap=None, _skipFirst=False):
     ,,,,OOOOOOO,,,,,,,,,,
     ,,,,,,,,,,,OOOOOO,,,,
     ,,,,,,,,,,,,,,,,,OOOO
+    >>> drawPoints(line(0, 0, 10, 3, thickness=3))
+    OO,,,,,,,,,
+    OOOOOO,,,,,
+    OOOOOOOOO,,
+    ,,OOOOOOOOO
+    ,,,,,OOOOOO
+    ,,,,,,,,,OO
+    >>> list(line(0, 0, 10, 3, clip=(3, 0, 7, 10)))
+    [(3, 1), (4, 1), (5, 1), (6, 2), (7, 2)]
     """
 
-    if (thickness != 1) or (endcap is not None):
-        raise NotImplementedError('The pybresenham module is under development and the filled and thickness parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    if validate:
+        _checkForIntOrFloat(x1)
+        _checkForIntOrFloat(y1)
+        _checkForIntOrFloat(x2)
+        _checkForIntOrFloat(y2)
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2) # TODO - Do we want this line?
+        clip = _checkClip(clip)
+
+        if not isinstance(_skipFirst, bool):
+            raise PyBresenhamException('_skipFirst argument must be a bool')
+        if thickness == 1 and endcap not in (None, ROUNDED_CAP, SQUARE_CAP):
+            raise PyBresenhamException('endcap argument must be None, ROUNDED_CAP, or SQUARE_CAP')
+
+    if thickness != 1:
+        return spansToPoints(strokeSpans([(x1, y1), (x2, y2)], thickness, endcap, clip=clip))
+    if abs(y2-y1) > abs(x2-x1):
+        return _steepLinePoints(x1, y1, x2, y2, _skipFirst, clip)
+    return _shallowLinePoints(x1, y1, x2, y2, _skipFirst, clip)
+
+
+def _shallowLinePoints(x1, y1, x2, y2, skipFirst, clip=None):
+    # This is the Bresenham line algorithm for lines that are at least as wide
+    # as they are tall, with one x per point. The lines that go left step y
+    # when the error drops to 0 or below instead of below 0, so that they have
+    # the same points as the line drawn from the other end. Starting their
+    # error one lower lets both directions share the `error < 0` check.
+    deltax = abs(x2 - x1)
+    deltay = abs(y2 - y1)
+    xstep = 1 if x1 <= x2 else -1
+    ystep = 1 if y1 < y2 else (-1 if y1 > y2 else 0)
+    error = deltax // 2 if xstep == 1 else deltax // 2 - 1
+    y = y1
+    if clip is not None:
+        left, top, right, bottom = clip
+        if deltax < 2:
+            # Lines this short can start with a negative error, which the
+            # skipping below doesn't handle, and they only have two points anyway.
+            for x, y in _shallowLinePoints(x1, y1, x2, y2, skipFirst):
+                if left <= x <= right and top <= y <= bottom:
+                    yield (x, y)
+            return
+        steps = _clipLineSteps(x1, xstep, y1, ystep, deltax, deltay, error, left, right, top, bottom)
+        if steps is None:
+            return
+        first, last = steps
+        if skipFirst:
+            first = max(first, 1)
+        if first > last:
+            return
+        error, ysteps = _lineErrorAt(first, deltax, deltay, error)
+        y += ystep * ysteps
+        x1, x2 = x1 + xstep * first, x1 + xstep * last
+    elif skipFirst:
+        # Do the first point's error update here, instead of checking for it on every point.
+        error -= deltay
+        if error < 0:
+            y += ystep
+            error += deltax
+        x1 += xstep
+    for x in range(x1, x2 + xstep, xstep):
+        yield (x, y)
+        error -= deltay
+        if error < 0:
+            y += ystep
+            error += deltax
+
+
+def _steepLinePoints(x1, y1, x2, y2, skipFirst, clip=None):
+    # This is the same as _shallowLinePoints() with the axes swapped, for
+    # lines that are taller than they are wide, with one y per point.
+    deltay = abs(y2 - y1)
+    deltax = abs(x2 - x1)
+    ystep = 1 if y1 <= y2 else -1
+    xstep = 1 if x1 < x2 else (-1 if x1 > x2 else 0)
+    error = deltay // 2 if ystep == 1 else deltay // 2 - 1
+    x = x1
+    if clip is not None:
+        left, top, right, bottom = clip
+        if deltay < 2:
+            for x, y in _steepLinePoints(x1, y1, x2, y2, skipFirst):
+                if left <= x <= right and top <= y <= bottom:
+                    yield (x, y)
+            return
+        steps = _clipLineSteps(y1, ystep, x1, xstep, deltay, deltax, error, top, bottom, left, right)
+        if steps is None:
+            return
+        first, last = steps
+        if skipFirst:
+            first = max(first, 1)
+        if first > last:
+            return
+        error, xsteps = _lineErrorAt(first, deltay, deltax, error)
+        x += xstep * xsteps
+        y1, y2 = y1 + ystep * first, y1 + ystep * last
+    elif skipFirst:
+        error -= deltax
+        if error < 0:
+            x += xstep
+            error += deltay
+        y1 += ystep
+    for y in range(y1, y2 + ystep, ystep):
+        yield (x, y)
+        error -= deltax
+        if error < 0:
+            x += xstep
+            error += deltay
+
+
+def _clipLineSteps(majorStart, majorStep, minorStart, minorStep, majorDelta, minorDelta, error, majorLow, majorHigh, minorLow, minorHigh):
+    # Returns the (first, last) range of the points of a line that are inside
+    # a clip rectangle, counting the line's first point as 0, or None if none
+    # of them are. This is Liang-Barsky clipping done on the line's integer
+    # error term instead of on the real line, so that the range matches
+    # exactly the points that the Bresenham loop produces. The major axis is
+    # the one with a point per step. `error` is the loop's starting error,
+    # which must be at least 0.
+    first, last = 0, majorDelta
+    if majorStep == 1:
+        first, last = max(first, majorLow - majorStart), min(last, majorHigh - majorStart)
+    else:
+        first, last = max(first, majorStart - majorHigh), min(last, majorStart - majorLow)
+
+    if minorStep == 0:
+        if not minorLow <= minorStart <= minorHigh:
+            return None
+        return (first, last) if first <= last else None
+    if minorStep == 1:
+        lowSteps, highSteps = minorLow - minorStart, minorHigh - minorStart
+    else:
+        lowSteps, highSteps = minorStart - minorHigh, minorStart - minorLow
+    if highSteps < 0:
+        return None
+
+    # After k points, the minor axis has stepped ceil((k * minorDelta - error) / majorDelta)
+    # times (see _lineErrorAt()). Solving for the first k that has at least
+    # lowSteps steps and the last k that has at most highSteps steps:
+    if lowSteps > 0:
+        first = max(first, ((lowSteps - 1) * majorDelta + error) // minorDelta + 1)
+    last = min(last, (highSteps * majorDelta + error) // minorDelta)
+    return (first, last) if first <= last else None
+
+
+def _lineErrorAt(k, majorDelta, minorDelta, error):
+    # Returns the error and the number of minor axis steps that the Bresenham
+    # loop has after k points, without running the loop. Each point subtracts
+    # minorDelta from the error and adds majorDelta back whenever the error
+    # went below 0, which keeps it in the range [0, majorDelta).
+    error -= k * minorDelta
+    if error >= 0:
+        return error, 0
+    steps = -(error // majorDelta)
+    return error + steps * majorDelta, steps
+
+
+def lineRuns(x1, y1, x2, y2):
+    """
+    Returns a generator that produces the points of `line(x1, y1, x2, y2)` as
+    runs instead of individual points. Each run is an `(x, y, length)` tuple.
+    The runs are horizontal if the line is more wide than tall, and vertical
+    otherwise. `x` and `y` are the run's leftmost or topmost point, and the
+    runs are in the same order as the points that `line()` produces.
+
+    Each run's length is calculated in one step instead of one point at a
+    time, so long lines that are nearly horizontal or vertical are much
+    cheaper to produce as runs.
+
+    >>> list(lineRuns(0, 0, 10, 3))
+    [(0, 0, 2), (2, 1, 4), (6, 2, 3), (9, 3, 2)]
+    >>> list(lineRuns(3, 10, 0, 0))
+    [(3, 9, 2), (2, 6, 3), (1, 2, 4), (0, 0, 2)]
+    """
 
     _checkForIntOrFloat(x1)
     _checkForIntOrFloat(y1)
     _checkForIntOrFloat(x2)
     _checkForIntOrFloat(y2)
-    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2) # TODO - Do we want this line?
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    return _lineRuns(x1, y1, x2, y2)
 
-    if not isinstance(_skipFirst, bool):
-        raise PyBresenhamException('_skipFirst argument must be a bool')
 
+def _lineRuns(x1, y1, x2, y2):
+    # This follows the same error term as line(), but instead of subtracting
+    # deltay once per point, it divides the error by deltay to find how many
+    # points are left before the minor axis steps.
     isSteep = abs(y2-y1) > abs(x2-x1)
     if isSteep:
         x1, y1 = y1, x1
         x2, y2 = y2, x2
     isReversed = x1 > x2
-
     if isReversed:
         x1, x2 = x2, x1
         y1, y2 = y2, y1
 
-        deltax = x2 - x1
-        deltay = abs(y2-y1)
-        error = int(deltax / 2)
-        y = y2
-        ystep = None
-        if y1 < y2:
-            ystep = 1
-        else:
-            ystep = -1
-        for x in range(x2, x1 - 1, -1):
+    deltax = x2 - x1
+    deltay = abs(y2-y1)
+    error = deltax // 2
+    ystep = 1 if y1 < y2 else -1
+    remaining = deltax + 1
+
+    if isReversed:
+        # line() steps the minor axis when the error is <= 0 on this branch.
+        x, y = x2, y2
+        while remaining > 0:
+            runLength = remaining if deltay == 0 else min(remaining, max(1, -(-error // deltay)))
             if isSteep:
-                if not (_skipFirst and (x, y) == (x2, y2)):
-                    yield (y, x)
+                yield (y, x - runLength + 1, runLength)
             else:
-                if not (_skipFirst and (x, y) == (x2, y2)):
-                    yield (x, y)
-            error -= deltay
-            if error <= 0:
-                y -= ystep
-                error += deltax
+                yield (x - runLength + 1, y, runLength)
+            remaining -= runLength
+            x -= runLength
+            y -= ystep
+            error += deltax - runLength * deltay
     else:
-        deltax = x2 - x1
-        deltay = abs(y2-y1)
-        error = int(deltax / 2)
-        y = y1
-        ystep = None
-        if y1 < y2:
-            ystep = 1
-        else:
-            ystep = -1
-        for x in range(x1, x2 + 1):
+        # line() steps the minor axis when the error is < 0 on this branch.
+        x, y = x1, y1
+        while remaining > 0:
+            runLength = remaining if deltay == 0 else min(remaining, error // deltay + 1)
             if isSteep:
-                if not (_skipFirst and (x, y) == (x1, y1)):
-                    yield (y, x)
+                yield (y, x, runLength)
             else:
-                if not (_skipFirst and (x, y) == (x1, y1)):
-                    yield (x, y)
-            error -= deltay
-            if error < 0:
-                y += ystep
-                error += deltax
+                yield (x, y, runLength)
+            remaining -= runLength
+            x += runLength
+            y += ystep
+            error += deltax - runLength * deltay
 
 
-def lines(points, closed=False, thickness=1, endcap=None, _skipFirst=False):
+def lines(points, closed=False, thickness=1, endcap=None, join=None, clip=None, _skipFirst=False):
     """
     Returns a generator that produces all of the points in the lines connecting the (x, y) tuples in `points`.
 
     If `closed` is `True`, then the last point will connect to the first point.
 
-    (Note: The `thickness` and `endcap` parameters are not yet implemented.)
+    `points` can be any iterable, including an iterator or generator that
+    produces millions of points. It is only read once, and the lines' points
+    are produced as `points` is read. (Invalid points raise an exception when
+    they are reached, not when lines() is called. If `points` has a length,
+    too few points raise an exception right away.)
+
+    If `thickness` is more than 1, the points of a thick stroke are produced
+    row by row instead, with the end caps and corners given by `endcap` and
+    `join` (see `strokeSpans()`). Each point is produced only once, even where
+    the lines overlap.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced, the same way as for `line()`.
 
     >>> list(lines([(0, 0), (10, 3), (5, 5)]))
     [(0, 0), (1, 0), (2, 1), (3, 1), (4, 1), (5, 1), (6, 2), (7, 2), (8, 2), (9, 3), (10, 3), (9, 4), (8, 4), (7, 4), (6, 5), (5, 5)]
@@ -219,8 +646,11 @@ def lines(points, closed=False, thickness=1, endcap=None, _skipFirst=False):
     ,,,,,OO,,,,
     """
 
-    if thickness != 1 or endcap is not None:
-        raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    if endcap not in (None, ROUNDED_CAP, SQUARE_CAP):
+        raise PyBresenhamException('endcap argument must be None, ROUNDED_CAP, or SQUARE_CAP')
+    if join not in (None, MITER_JOIN, ROUNDED_JOIN):
+        raise PyBresenhamException('join argument must be None, MITER_JOIN, or ROUNDED_JOIN')
+    clip = _checkClip(clip)
 
     # Validate points argument
     try:
@@ -228,42 +658,73 @@ def lines(points, closed=False, thickness=1, endcap=None, _skipFirst=False):
     except TypeError:
         raise PyBresenhamException('points must be an iterable')
 
-    # Check that all the xy coordinates are either ints or floats.
-    for i, point in enumerate(points):
+    if thickness != 1:
+        # The stroke's outline needs all of the points before any can be produced.
+        points = list(points)
+
+    try:
+        numPoints = len(points)
+    except TypeError:
+        # `points` is an iterator, so the number of points is checked as lines() reads it instead.
+        pass
+    else:
+        # The points themselves are checked once each, as they're read.
+        if closed and numPoints < 3:
+            raise PyBresenhamException('points argument must have at least three points if closed==True')
+        if numPoints < 2:
+            raise PyBresenhamException('points argument must have at least two points')
+
+    if thickness != 1:
+        return spansToPoints(strokeSpans(points, thickness, endcap, closed, join, clip))
+
+    # We are using itertools.chain() to create one iterator from the line()
+    # iterators of each line segment. ("Line segment" means the line between
+    # two adjacent points in the points parameter.) The line() iterators are
+    # created one at a time as the points are read.
+    return itertools.chain.from_iterable(_linesSegments(points, closed, _skipFirst, clip))
+
+
+def _linesSegments(points, closed, skipFirst, clip):
+    # Yields an iterable of points for each line segment between the points
+    # in `points`, which is only read once. Since lines() skips the first
+    # point of each line segment (it was the last point of the previous one),
+    # the first point is yielded on its own.
+    firstx = firsty = prevx = prevy = None
+    numPoints = 0
+    isOnePoint = True # True while every point is the same as the first point.
+    for point in points:
         try:
             _checkForIntOrFloat(point[0])
             _checkForIntOrFloat(point[1])
         except:
-            raise PyBresenhamException('point at index %s is not a tuple of two int/float values' % (i))
+            raise PyBresenhamException('point at index %s is not a tuple of two int/float values' % (numPoints))
+        x, y = int(point[0]), int(point[1])
+
+        if numPoints == 0:
+            firstx, firsty = x, y
+            if not (closed or skipFirst):
+                # A closed shape's first point is produced last, by the line back to it.
+                if clip is None or (clip[0] <= x <= clip[2] and clip[1] <= y <= clip[3]):
+                    yield ((x, y),)
+        else:
+            # The points were validated above, so line() doesn't need to check them again.
+            yield line(prevx, prevy, x, y, validate=False, clip=clip, _skipFirst=True)
+            if isOnePoint and (x != firstx or y != firsty):
+                isOnePoint = False
+        prevx, prevy = x, y
+        numPoints += 1
 
     if closed:
-        # Validate the points argument for a closed multi-line shape.
-        try:
-            points[2] # Make sure there are at least three points for this closed irregular polygon.
-            points = list(points)
-            points.append(points[0]) # The final point connects back to the starting point.
-        except:
+        if numPoints < 3:
             raise PyBresenhamException('points argument must have at least three points if closed==True')
-        _skipFirst=True
-    else:
-        # Validate that there are at least two points.
-        try:
-            points[1]
-        except:
-            raise PyBresenhamException('points argument must have at least two points')
-
-    # Technically, we're allocating all of the iterators for each line segment
-    # at once, which isn't the most efficient way to do it but is the most
-    # direct. And even this direct way still produces kind of unreadable code.
-    # ("Line segment" means the line between two adjacent points in the points
-    # parameter.)
-    # We are using itertools.chain() to create one iterator from several
-    # iterables (one iterable per line segment).
-    if _skipFirst:
-        return itertools.chain.from_iterable([line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], _skipFirst=True) for i in range(len(points) - 1)])
-    else:
-        return itertools.chain([(points[0][0], points[0][1])], # the first point in points
-                               itertools.chain.from_iterable([line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], _skipFirst=True) for i in range(len(points) - 1)]))
+        if isOnePoint and not skipFirst:
+            # Every line skips its only point, so the shape's one point is produced on its own.
+            if clip is None or (clip[0] <= firstx <= clip[2] and clip[1] <= firsty <= clip[3]):
+                yield ((firstx, firsty),)
+        else:
+            yield line(prevx, prevy, firstx, firsty, validate=False, clip=clip, _skipFirst=True) # The final point connects back to the starting point.
+    elif numPoints < 2:
+        raise PyBresenhamException('points argument must have at least two points')
 
 
 '''
@@ -292,7 +753,7 @@ def segments(segments, thickness=1, endcap=None):
 '''
 
 
-def polygon(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False, thickness=1):
+def polygon(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False, thickness=1, clip=None):
     """
     Returns a generator that produces the (x, y) points of a regular polygon.
     `centerx` and `centery` mark the center of the polygon, `radius` indicates the size,
@@ -307,7 +768,12 @@ def polygon(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizonta
     width of the polygon.
 
     If `filled` is set to `True`, the generator will also produce the interior
-    (x, y) points.
+    (x, y) points. Filled polygons are scan converted with `fillSpans()`, so
+    their points are produced row by row, from top to bottom.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced. The sides are clipped the same way as
+    `lines()`, and filled polygons skip the rows outside of the rectangle.
 
     (Note: The `thickness` parameter is not yet implemented.)
 
@@ -354,14 +820,40 @@ def polygon(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizonta
     if sides < 3:
         raise PyBresenhamException('sides argument must be at least 3')
 
-    vertices = list(polygonVertices(x, y, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical))
+    vertices = list(polygonVertices(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical))
+
+    if filled:
+        # Scan convert the vertices directly instead of flood filling the border.
+        return spansToPoints(fillSpans(vertices, clip=clip))
+    else:
+        return lines(vertices, closed=True, thickness=thickness, endcap=None, clip=clip)
+
+
+def polygonSpans(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans of
+    the same regular polygon that `polygon()` produces. Each span covers the
+    points from `xStart` to `xEnd`, inclusive. The spans are produced from top
+    to bottom, and from left to right within each row.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
+
+    >>> list(polygonSpans(5, 5, 4, 4, filled=True))
+    [(3, 3, 7), (4, 3, 7), (5, 3, 7), (6, 3, 7), (7, 3, 7)]
+    """
+
+    # Validate sides (x, y, radius, and rotationDegrees are validated in polygonVertices())
+    _checkForIntOrFloat(sides)
+    if sides < 3:
+        raise PyBresenhamException('sides argument must be at least 3')
+
+    vertices = list(polygonVertices(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical))
 
     if filled:
-        # Run flood fill on the shape, starting from the center.
-        borderPoints = list(lines(vertices, closed=True, thickness=thickness, endcap=None))
-        return iter(floodFill(borderPoints, x, y))
+        return fillSpans(vertices, clip=clip)
     else:
-        return lines(vertices, closed=True, thickness=thickness, endcap=None)
+        return pointsToSpans(lines(vertices, closed=True, clip=clip))
 
 
 def polygonVertices(centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0):
@@ -419,7 +911,28 @@ def polygonVertices(centerx, centery, radius, sides, rotationDegrees=0, stretchH
     ,,,,,O,,,,,,,,
     """
 
-    # TODO - validate x, y, radius, sides
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius)
+    _checkForIntOrFloat(rotationDegrees)
+    _checkForIntOrFloat(stretchHorizontal)
+    _checkForIntOrFloat(stretchVertical)
+    _checkForIntOrFloat(sides)
+    if sides < 3:
+        raise PyBresenhamException('sides argument must be at least 3')
+
+    for cos, sin in _unitPolygonTable(sides, rotationDegrees):
+        yield (  int(cos * radius  * stretchHorizontal) + centerx,
+               -(int(sin * radius) * stretchVertical)   + centery)
+
+
+@functools.lru_cache(maxsize=POLYGON_TABLE_CACHE_SIZE)
+def _unitPolygonTable(sides, rotationDegrees):
+    # Returns the (cos, sin) of the angle of each of the polygon's vertices,
+    # which are the vertices of the polygon with radius 1 before flipping y.
+    # The same polygons tend to be drawn over and over, so the tables are
+    # cached and polygonVertices() only has to scale and move them.
 
     # Setting the start point like this guarantees a flat side will be on the "bottom" of the polygon.
     if sides % 2 == 1:
@@ -427,22 +940,607 @@ def polygonVertices(centerx, centery, radius, sides, rotationDegrees=0, stretchH
     else:
         angleOfStartPointDegrees = 90 + rotationDegrees - (180 / sides)
 
+    table = []
     for sideNum in range(sides):
         angleOfPointRadians = math.radians(angleOfStartPointDegrees + (360 / sides * sideNum))
+        table.append((math.cos(angleOfPointRadians), math.sin(angleOfPointRadians)))
+    return tuple(table)
+
+
+def polygonTableCacheInfo():
+    """
+    Returns the hits, misses, maxsize, and currsize statistics of the cache of
+    vertex tables used by `polygonVertices()`, and so by `polygon()` and the
+    other functions that draw regular polygons. The tables are keyed by the
+    polygon's sides and rotation, and at most `POLYGON_TABLE_CACHE_SIZE` (as
+    it was when pybresenham was imported) of them are kept, discarding the
+    least recently used ones.
+
+    >>> clearPolygonTableCache()
+    >>> vertices = list(polygonVertices(10, 10, 8, 6)) + list(polygonVertices(50, 20, 4, 6))
+    >>> polygonTableCacheInfo()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+    return _unitPolygonTable.cache_info()
 
-        yield (  int(math.cos(angleOfPointRadians) * radius  * stretchHorizontal) + x,
-               -(int(math.sin(angleOfPointRadians) * radius) * stretchVertical)   + y)
 
+def clearPolygonTableCache():
+    """Empties the cache of vertex tables used by `polygonVertices()` and resets its statistics."""
+    _unitPolygonTable.cache_clear()
 
-def floodFill(points, startx, starty):
+
+def fillSpans(vertices, fillRule=EVEN_ODD, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans of
+    a filled polygon whose corners are the (x, y) tuples in `vertices`. Each
+    span covers the points from `xStart` to `xEnd`, inclusive. The spans are
+    produced from top to bottom, and from left to right within each row.
+
+    The polygon doesn't have to be convex, and its sides can cross each other.
+    `fillRule` decides which parts of a self-intersecting polygon are inside
+    of it: `EVEN_ODD` (the default) or `NONZERO`.
+
+    The filled area always includes the border produced by `lines(vertices, closed=True)`.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle. The rows above and below it are skipped
+    without being scanned, so the cost depends on the number of visible rows.
+
+    >>> list(fillSpans([(0, 0), (4, 0), (4, 2), (0, 2)]))
+    [(0, 0, 4), (1, 0, 4), (2, 0, 4)]
+    >>> star = [(4, 0), (7, 8), (0, 3), (8, 3), (1, 8)]
+    >>> drawPoints(spansToPoints(fillSpans(star)))
+    ,,,,O,,,,
+    ,,,,O,,,,
+    ,,,OOO,,,
+    OOOOOOOOO
+    ,OOO,OOO,
+    ,,OO,OO,,
+    ,,OOOOO,,
+    ,OOO,,OO,
+    ,O,,,,,O,
+    >>> drawPoints(spansToPoints(fillSpans(star, NONZERO)))
+    ,,,,O,,,,
+    ,,,,O,,,,
+    ,,,OOO,,,
+    OOOOOOOOO
+    ,OOOOOOO,
+    ,,OOOOO,,
+    ,,OOOOO,,
+    ,OOO,,OO,
+    ,O,,,,,O,
     """
-    Returns a set of the (x, y) points of a filled in area.
+
+    # Validate arguments.
+    if fillRule not in (EVEN_ODD, NONZERO):
+        raise PyBresenhamException('fillRule must be EVEN_ODD or NONZERO')
+    clip = _checkClip(clip)
+    try:
+        vertices = [(int(x), int(y)) for x, y in vertices]
+    except:
+        raise PyBresenhamException('vertices argument must be an iterable of (x, y) tuples of int/float values')
+    if len(vertices) < 3:
+        raise PyBresenhamException('vertices argument must have at least three points')
+
+    # The vertices are truncated to integers above, the same way line() does
+    # it, so that the edges' border points match lines(vertices, closed=True).
+    return _fillSpans([vertices], fillRule, includeEdges=True, clip=clip)
+
+
+def _fillSpans(contours, fillRule, includeEdges, clip=None):
+    # This is a scanline fill with an active edge table. Each row's interior
+    # comes from the x coordinates where the row's pixel centers cross the
+    # polygon's edges. If includeEdges is True, the points of each edge's
+    # line() are also included, so that the fill covers the polygon's border.
+    # `contours` is a list of vertex lists, each one a closed shape. If `clip`
+    # isn't None, only the rows inside it are scanned, and the spans are cut
+    # to fit inside it.
+
+    # Build the edge table. Each crossing edge is active on the rows with
+    # centers in the half-open range [ymin, ymax), so that a vertex shared by
+    # two edges isn't counted twice.
+    crossingEdges = []
+    edgeRuns = []
+    for vertices in contours:
+        for i in range(len(vertices)):
+            ax, ay = vertices[i - 1]
+            bx, by = vertices[i]
+            if includeEdges:
+                runs = _lineRowRuns(ax, ay, bx, by, clip)
+                edgeRuns.append((min(ay, by), runs))
+            if ay == by:
+                continue # Horizontal edges never cross a row's pixel centers.
+            direction = 1 if by > ay else -1
+            if ay > by:
+                ax, ay, bx, by = bx, by, ax, ay
+            firstRow = int(math.ceil(ay))
+            lastRow = int(math.ceil(by)) - 1
+            if firstRow <= lastRow:
+                crossingEdges.append((firstRow, lastRow, ax, ay, (bx - ax) / float(by - ay), direction))
+    if not crossingEdges and not edgeRuns:
+        return
+
+    crossingEdges.sort(key=lambda edge: edge[0])
+    edgeRuns.sort(key=lambda edgeRun: edgeRun[0])
+
+    rows = [edge[0] for edge in crossingEdges] + [edge[1] for edge in crossingEdges]
+    rows.extend([int(math.floor(y)) for vertices in contours for x, y in vertices])
+    topRow, bottomRow = min(rows), max(rows)
+    if clip is not None:
+        # The active edge table is rebuilt from each edge's first and last
+        # row, so it can start on any row without scanning the ones above it.
+        clipLeft, clipTop, clipRight, clipBottom = clip
+        topRow, bottomRow = max(topRow, clipTop), min(bottomRow, clipBottom)
+
+    activeEdges = []
+    activeRuns = [] # A list of [nextRun, runIterator] lists.
+    nextEdge = nextRunEdge = 0
+    for y in range(topRow, bottomRow + 1):
+        # Update the active edge table for this row.
+        while nextEdge < len(crossingEdges) and crossingEdges[nextEdge][0] <= y:
+            activeEdges.append(crossingEdges[nextEdge])
+            nextEdge += 1
+        activeEdges = [edge for edge in activeEdges if edge[1] >= y]
+        while nextRunEdge < len(edgeRuns) and edgeRuns[nextRunEdge][0] <= y:
+            runIterator = edgeRuns[nextRunEdge][1]
+            activeRuns.append([next(runIterator, None), runIterator]) # (Clipped edges can have no runs.)
+            nextRunEdge += 1
+
+        intervals = []
+
+        # Find the interior intervals of this row.
+        crossings = sorted([(ax + (y - ay) * slope, direction) for firstRow, lastRow, ax, ay, slope, direction in activeEdges])
+        winding = 0
+        for i, (crossingx, direction) in enumerate(crossings[:-1]):
+            if fillRule == EVEN_ODD:
+                winding ^= 1
+            else:
+                winding += direction
+            if winding != 0:
+                start = int(math.ceil(crossingx))
+                end = int(math.ceil(crossings[i + 1][0])) - 1
+                if start <= end:
+                    intervals.append((start, end))
+
+        # Add the border points of the edges that are on this row.
+        if activeRuns:
+            for activeRun in activeRuns:
+                run = activeRun[0]
+                if run is not None and run[0] == y:
+                    intervals.append((run[1], run[2]))
+                    activeRun[0] = next(activeRun[1], None)
+            activeRuns = [activeRun for activeRun in activeRuns if activeRun[0] is not None]
+
+        if clip is not None:
+            intervals = [(max(start, clipLeft), min(end, clipRight)) for start, end in intervals]
+            intervals = [(start, end) for start, end in intervals if start <= end]
+
+        # Merge the overlapping and adjacent intervals into spans.
+        intervals.sort()
+        spanStart = spanEnd = None
+        for start, end in intervals:
+            if spanStart is None:
+                spanStart, spanEnd = start, end
+            elif start <= spanEnd + 1:
+                spanEnd = max(spanEnd, end)
+            else:
+                yield (y, spanStart, spanEnd)
+                spanStart, spanEnd = start, end
+        if spanStart is not None:
+            yield (y, spanStart, spanEnd)
+
+
+def _lineRowRuns(x1, y1, x2, y2, clip=None):
+    # Yields the (y, xStart, xEnd) runs of the points of line(x1, y1, x2, y2),
+    # from top to bottom. The line is always drawn in the given direction,
+    # since drawing it backwards could produce slightly different points.
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    if clip is not None:
+        # Only the clipped part of the line is drawn, and its points are grouped into runs.
+        points = list(line(x1, y1, x2, y2, validate=False, clip=clip))
+        if y1 > y2:
+            points.reverse()
+        runy = None
+        for x, y in points:
+            if y != runy:
+                if runy is not None:
+                    yield (runy, runStart, runEnd)
+                runy, runStart, runEnd = y, x, x
+            runStart, runEnd = min(runStart, x), max(runEnd, x)
+        if runy is not None:
+            yield (runy, runStart, runEnd)
+        return
+    runs = _lineRuns(x1, y1, x2, y2)
+    if y1 > y2:
+        runs = reversed(list(runs))
+
+    if abs(y2-y1) > abs(x2-x1):
+        # Vertical runs have one point on each row.
+        for x, y, length in runs:
+            for y in range(y, y + length):
+                yield (y, x, x)
+    else:
+        for x, y, length in runs:
+            yield (y, x, x + length - 1)
+
+
+def spansToPoints(spans):
+    """
+    Returns a generator that produces the (x, y) points covered by the
+    (y, xStart, xEnd) horizontal spans in `spans`.
+
+    >>> list(spansToPoints([(0, 2, 4), (1, 3, 3)]))
+    [(2, 0), (3, 0), (4, 0), (3, 1)]
+    """
+    for y, xStart, xEnd in spans:
+        for x in range(xStart, xEnd + 1):
+            yield (x, y)
+
+
+def pointsToSpans(points):
+    """
+    Returns a list of the (y, xStart, xEnd) horizontal spans that cover the
+    (x, y) tuples in `points`. Each span covers the points from `xStart` to
+    `xEnd`, inclusive. The spans are sorted from top to bottom, and from left
+    to right within each row. Duplicate points are ignored.
+
+    This is the opposite of `spansToPoints()`.
+
+    >>> pointsToSpans([(3, 1), (2, 0), (3, 0), (4, 0), (0, 1)])
+    [(0, 2, 4), (1, 0, 0), (1, 3, 3)]
+    """
+
+    rows = {}
+    try:
+        for x, y in points:
+            rows.setdefault(int(y), []).append(int(x))
+    except:
+        raise PyBresenhamException('points must only contains (x, y) numeric tuples')
+
+    spans = []
+    for y in sorted(rows):
+        xs = sorted(rows[y])
+        spanStart = spanEnd = xs[0]
+        for x in xs:
+            if x > spanEnd + 1:
+                spans.append((y, spanStart, spanEnd))
+                spanStart = x
+            spanEnd = x
+        spans.append((y, spanStart, spanEnd))
+    return spans
+
+
+class PointSet(object):
+    """
+    A set of integer (x, y) points that uses far less memory than a Python
+    set of tuples. Each row of points is stored as the bits of one Python
+    int, so a filled shape takes about one bit per point of its bounding box
+    instead of over a hundred bytes per point.
+
+    PointSet supports the `in` and `len()` operators, iteration (from top to
+    bottom and left to right), union (`|`), intersection (`&`), and
+    difference (`-`), and can export its points as spans.
+
+    >>> points = PointSet([(0, 0), (1, 0), (2, 0), (1, 1)])
+    >>> (1, 1) in points, (2, 1) in points, len(points)
+    (True, False, 4)
+    >>> list(points - PointSet([(1, 0)]))
+    [(0, 0), (2, 0), (1, 1)]
+    >>> list((points | PointSet.fromSpans([(1, -3, -1)])).spans())
+    [(0, 0, 2), (1, -3, -1), (1, 1, 1)]
+    """
+
+    def __init__(self, points=()):
+        self._rows = {} # Maps each y to an int whose bit (x - self._originx) is set for each point in the row.
+        self._originx = None
+        self.update(points)
+
+    @classmethod
+    def fromSpans(cls, spans):
+        """Returns a new PointSet of the points covered by the (y, xStart, xEnd) spans in `spans`."""
+        pointSet = cls()
+        for y, xStart, xEnd in spans:
+            pointSet.addSpan(y, xStart, xEnd)
+        return pointSet
+
+    def _moveOrigin(self, x):
+        # Moves the origin to the left so that it's at or left of x. The origin
+        # moves by at least twice as far as it needs to, so that adding points
+        # from right to left only moves it a few times.
+        if self._originx is None:
+            self._originx = x
+            return
+        shift = self._originx - x
+        shift += max(shift, 64)
+        for y in self._rows:
+            self._rows[y] <<= shift
+        self._originx -= shift
+
+    def add(self, point):
+        """Adds the (x, y) tuple `point` to this PointSet."""
+        self.update((point,))
+
+    def update(self, points):
+        """Adds all of the (x, y) tuples in `points` to this PointSet."""
+        rows = self._rows
+        try:
+            for x, y in points:
+                x, y = int(x), int(y)
+                if self._originx is None or x < self._originx:
+                    self._moveOrigin(x)
+                rows[y] = rows.get(y, 0) | (1 << (x - self._originx))
+        except (TypeError, ValueError):
+            raise PyBresenhamException('points must only contains (x, y) numeric tuples')
+
+    def addSpan(self, y, xStart, xEnd):
+        """Adds the points from `xStart` to `xEnd`, inclusive, on row `y` to this PointSet."""
+        if xStart > xEnd:
+            return
+        if self._originx is None or xStart < self._originx:
+            self._moveOrigin(xStart)
+        self._rows[y] = self._rows.get(y, 0) | (((1 << (xEnd - xStart + 1)) - 1) << (xStart - self._originx))
+
+    def discard(self, point):
+        """Removes the (x, y) tuple `point` from this PointSet, if it's in it."""
+        if point in self:
+            x, y = point
+            self._rows[y] &= ~(1 << (x - self._originx))
+            if not self._rows[y]:
+                del self._rows[y]
+
+    def __contains__(self, point):
+        try:
+            x, y = point
+            row = self._rows.get(y)
+            return bool(row) and x >= self._originx and bool((row >> (x - self._originx)) & 1)
+        except (TypeError, ValueError):
+            return False
+
+    def __len__(self):
+        return sum([bin(row).count('1') for row in self._rows.values()])
+
+    def __bool__(self):
+        return bool(self._rows) # (Empty rows are never stored.)
+
+    def __iter__(self):
+        return spansToPoints(self.spans())
+
+    def spans(self):
+        """
+        Returns a generator that produces the (y, xStart, xEnd) spans of the
+        points in this PointSet, from top to bottom and left to right, in the
+        same format as `pointsToSpans()`.
+        """
+        for y in sorted(self._rows):
+            row, x = self._rows[y], self._originx
+            while row:
+                # Skip to the lowest set bit, then measure how many set bits are in a row there.
+                skip = (row & -row).bit_length() - 1
+                row >>= skip
+                x += skip
+                runLength = (~row & (row + 1)).bit_length() - 1
+                yield (y, x, x + runLength - 1)
+                row >>= runLength
+                x += runLength
+
+    def copy(self):
+        """Returns a new PointSet with the same points."""
+        pointSet = PointSet()
+        pointSet._rows = dict(self._rows)
+        pointSet._originx = self._originx
+        return pointSet
+
+    def _alignedRows(self, other):
+        # Returns an origin and the rows of self and other shifted to use it.
+        if not isinstance(other, PointSet):
+            other = PointSet(other)
+        if self._originx is None or other._originx is None:
+            return (self._originx if other._originx is None else other._originx), dict(self._rows), dict(other._rows)
+        originx = min(self._originx, other._originx)
+        selfShift, otherShift = self._originx - originx, other._originx - originx
+        return (originx, dict([(y, row << selfShift) for y, row in self._rows.items()]),
+                         dict([(y, row << otherShift) for y, row in other._rows.items()]))
+
+    def _fromRows(self, originx, rows):
+        pointSet = PointSet()
+        pointSet._rows = dict([(y, row) for y, row in rows.items() if row])
+        pointSet._originx = originx if pointSet._rows else None
+        return pointSet
+
+    def union(self, other):
+        """Returns a new PointSet of the points in this PointSet or in `other`."""
+        originx, rows, otherRows = self._alignedRows(other)
+        for y, row in otherRows.items():
+            rows[y] = rows.get(y, 0) | row
+        return self._fromRows(originx, rows)
+
+    def intersection(self, other):
+        """Returns a new PointSet of the points in both this PointSet and `other`."""
+        originx, rows, otherRows = self._alignedRows(other)
+        return self._fromRows(originx, dict([(y, row & otherRows[y]) for y, row in rows.items() if y in otherRows]))
+
+    def difference(self, other):
+        """Returns a new PointSet of the points in this PointSet that aren't in `other`."""
+        originx, rows, otherRows = self._alignedRows(other)
+        return self._fromRows(originx, dict([(y, row & ~otherRows.get(y, 0)) for y, row in rows.items()]))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __eq__(self, other):
+        if isinstance(other, PointSet):
+            return list(self.spans()) == list(other.spans())
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all([point in self for point in other])
+        return NotImplemented
+
+    __hash__ = None # PointSets are mutable, like sets.
+
+    def __repr__(self):
+        return 'PointSet(%s)' % (list(self),)
+
+
+def strokeSpans(points, thickness, endcap=None, closed=False, join=None, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) spans of a thick
+    stroke along the lines connecting the (x, y) tuples in `points`.
+
+    The stroke's outline is built as a set of polygons (one per line segment,
+    cap, and join) which are scan-converted together, so each point of the
+    stroke is covered by exactly one span. The spans are in the same format
+    as `fillSpans()`.
+
+    `endcap` can be `None` (the stroke ends at the end points), `SQUARE_CAP`
+    (the stroke extends past the end points by half its thickness), or
+    `ROUNDED_CAP`. `join` can be `None` (beveled corners), `MITER_JOIN`, or
+    `ROUNDED_JOIN`. If `closed` is `True`, then the last point connects to the
+    first point and the stroke has joins instead of end caps.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
+
+    >>> list(strokeSpans([(0, 0), (5, 0)], 3))
+    [(-1, 0, 5), (0, 0, 5), (1, 0, 5)]
+    >>> list(strokeSpans([(0, 0), (5, 0)], 3, endcap=SQUARE_CAP))
+    [(-1, -1, 6), (0, -1, 6), (1, -1, 6)]
+    """
+
+    _checkForIntOrFloat(thickness, minVal=1)
+    if endcap not in (None, ROUNDED_CAP, SQUARE_CAP):
+        raise PyBresenhamException('endcap argument must be None, ROUNDED_CAP, or SQUARE_CAP')
+    if join not in (None, MITER_JOIN, ROUNDED_JOIN):
+        raise PyBresenhamException('join argument must be None, MITER_JOIN, or ROUNDED_JOIN')
+    clip = _checkClip(clip)
+
+    try:
+        points = list(points)
+    except TypeError:
+        raise PyBresenhamException('points must be an iterable')
+    for i, point in enumerate(points):
+        try:
+            _checkForIntOrFloat(point[0])
+            _checkForIntOrFloat(point[1])
+        except:
+            raise PyBresenhamException('point at index %s is not a tuple of two int/float values' % (i))
+        points[i] = (int(point[0]), int(point[1]))
+    # Consecutive duplicate points don't change the stroke, but they have no direction.
+    points = [point for i, point in enumerate(points) if i == 0 or point != points[i - 1]]
+    if closed and len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    if closed and len(points) < 3:
+        raise PyBresenhamException('points argument must have at least three distinct points if closed==True')
+    if len(points) == 0:
+        raise PyBresenhamException('points argument must have at least one point')
+
+    return _fillSpans(_strokeContours(points, thickness / 2.0, endcap, closed, join), NONZERO, includeEdges=False, clip=clip)
+
+
+def _strokeContours(points, halfWidth, endcap, closed, join):
+    # Returns the polygons that make up the outline of a stroke, all with the
+    # same orientation so that their nonzero fill is their union. Each line
+    # segment is a rectangle that extends half a point past its end points,
+    # which is where the end point's pixel ends. At the corners, the gap on
+    # the outside is filled by a join polygon.
+    contours = []
+
+    if len(points) == 1:
+        # A stroke along a single point is a square or a disc.
+        x, y = points[0]
+        if endcap == ROUNDED_CAP:
+            contours.append(_strokeDisc(x, y, halfWidth))
+        else:
+            contours.append([(x - halfWidth, y - halfWidth), (x + halfWidth, y - halfWidth), (x + halfWidth, y + halfWidth), (x - halfWidth, y + halfWidth)])
+        return contours
+
+    segmentCount = len(points) if closed else len(points) - 1
+    directions = []
+    for i in range(segmentCount):
+        (ax, ay), (bx, by) = points[i], points[(i + 1) % len(points)]
+        length = math.hypot(bx - ax, by - ay)
+        directions.append(((bx - ax) / length, (by - ay) / length))
+
+    for i in range(segmentCount):
+        (ax, ay), (bx, by) = points[i], points[(i + 1) % len(points)]
+        dx, dy = directions[i]
+        startExtension = endExtension = 0.5
+        if endcap == SQUARE_CAP and not closed:
+            if i == 0:
+                startExtension = max(halfWidth, 0.5)
+            if i == segmentCount - 1:
+                endExtension = max(halfWidth, 0.5)
+        ax, ay = ax - dx * startExtension, ay - dy * startExtension
+        bx, by = bx + dx * endExtension, by + dy * endExtension
+        nx, ny = -dy * halfWidth, dx * halfWidth # The normal, scaled to half of the thickness.
+        contours.append([(ax + nx, ay + ny), (bx + nx, by + ny), (bx - nx, by - ny), (ax - nx, ay - ny)])
+
+    if endcap == ROUNDED_CAP and not closed:
+        contours.append(_strokeDisc(points[0][0], points[0][1], halfWidth))
+        contours.append(_strokeDisc(points[-1][0], points[-1][1], halfWidth))
+
+    # Fill in the wedge on the outside of each corner.
+    for i in range(len(points) if closed else len(points) - 2):
+        x, y = points[(i + 1) % len(points)]
+        (adx, ady), (bdx, bdy) = directions[i], directions[(i + 1) % segmentCount]
+        if join == ROUNDED_JOIN:
+            contours.append(_strokeDisc(x, y, halfWidth))
+            continue
+        cross = adx * bdy - ady * bdx
+        if cross == 0 and adx * bdx + ady * bdy > 0:
+            continue # The segments are collinear, so there's no corner.
+        side = -halfWidth if cross > 0 else halfWidth # The corner's outside is away from the turn.
+        ax, ay = x - ady * side, y + adx * side
+        bx, by = x - bdy * side, y + bdx * side
+        corner = [(x, y), (ax, ay), (bx, by)]
+        if join == MITER_JOIN:
+            # The miter's tip is where the outside edges of the two segments meet.
+            cosAngle = 1 + (adx * bdx + ady * bdy)
+            if cosAngle > 2.0 / (MITER_LIMIT * MITER_LIMIT): # Otherwise the miter is too long, and this stays beveled.
+                mx, my = x - (ady + bdy) * side / cosAngle, y + (adx + bdx) * side / cosAngle
+                corner = [(x, y), (ax, ay), (mx, my), (bx, by)]
+        contours.append(corner)
+
+    # Orient every contour the same way.
+    for i, contour in enumerate(contours):
+        area = sum([contour[j - 1][0] * contour[j][1] - contour[j][0] * contour[j - 1][1] for j in range(len(contour))])
+        if area < 0:
+            contours[i] = contour[::-1]
+    return contours
+
+
+def _strokeDisc(x, y, radius):
+    # Returns a polygon close enough to a circle with this radius that no
+    # point centers are lost along its edges.
+    sides = max(8, int(math.ceil(math.pi * radius * 2)))
+    return [(x + radius * math.cos(2 * math.pi * i / sides), y + radius * math.sin(2 * math.pi * i / sides)) for i in range(sides)]
+
+
+def floodFill(points, startx, starty, asPointSet=False, connectivity=4, isBoundary=None, maxPixels=None):
+    """
+    Returns a set of the (x, y) points of a filled in area. If `asPointSet` is
+    `True`, a `PointSet` is returned instead of a set.
 
     `points` is an iterable of (x, y) tuples of an arbitrary shape.
 
     `startx` and `starty` mark the starting point (likely inside the
     arbitrary shape) to begin filling from.
 
+    The fill spreads up, down, left, and right from the starting point until
+    it reaches one of the points in `points`. If `connectivity` is 8, it also
+    spreads diagonally. The fill never reaches the edges of the rectangle
+    around `points`, so it can't spread out forever. The returned area
+    includes the points in `points`.
+
+    `isBoundary` is an optional function that takes an x and y argument and
+    returns `True` if the fill should stop at that point, as if it were in
+    `points`. It is called at most once for each point that the fill reaches.
+
+    If `maxPixels` is given and the fill would cover more than `maxPixels`
+    points, a `PyBresenhamException` is raised instead. This only limits the
+    points that are filled, not the memory used: the fill still marks the
+    points in a bitmap of the whole rectangle around `points`, one byte per
+    point, before it starts.
+
     >>> drawPoints(polygon(5, 5, 4, 5))
     ,,,O,,,
     ,,O,O,,
@@ -453,8 +1551,8 @@ def floodFill(points, startx, starty):
     ,O,,,O,
     ,OOOOO,
     >>> pentagonOutline = list(polygon(5, 5, 4, 5))
-    >>> floodFill(pentagonOutline, 5, 5)
-    {(7, 3), (4, 7), (4, 8), (5, 6), (6, 6), (7, 7), (6, 2), (5, 1), (3, 7), (2, 5), (8, 5), (5, 8), (6, 7), (3, 3), (5, 5), (7, 6), (4, 4), (6, 3), (3, 6), (3, 4), (8, 6), (6, 4), (5, 4), (2, 6), (4, 5), (5, 2), (7, 5), (4, 2), (6, 5), (5, 3), (3, 5), (6, 8), (4, 6), (5, 7), (3, 8), (7, 4), (4, 3), (7, 8), (2, 4), (8, 4)}
+    >>> sorted(floodFill(pentagonOutline, 5, 5))
+    [(2, 4), (2, 5), (2, 6), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (5, 1), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (7, 3), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (8, 4), (8, 5), (8, 6)]
     >>> drawPoints(floodFill(pentagonOutline, 5, 5))
     ,,,O,,,
     ,,OOO,,
@@ -466,65 +1564,173 @@ def floodFill(points, startx, starty):
     ,OOOOO,
     """
 
-    # Note: We're not going to use recursion here because 1) recursion is
-    # overrated 2) on a large enough shape it would cause a stackoverflow
-    # 3) flood fill doesn't strictly need recursion because it doesn't require
-    # a stack and 4) recursion is overrated.
+    # This is a span flood fill. Instead of spreading one point at a time, it
+    # fills the whole horizontal run of open points around each seed point,
+    # then adds a seed for each open run in the rows above and below. The
+    # points are marked in a bitmap of the rectangle around `points`, so that
+    # the runs can be found with bytearray.find() and a regex instead of
+    # checking each point in Python code.
+    if connectivity not in (4, 8):
+        raise PyBresenhamException('connectivity argument must be 4 or 8')
+    if maxPixels is not None:
+        _checkForIntOrFloat(maxPixels, minVal=0)
+    _checkForIntOrFloat(startx)
+    _checkForIntOrFloat(starty)
+    startx, starty = int(startx), int(starty)
 
-    allPoints = set(points) # Use a set because the look ups will be faster.
+    try:
+        points = [(int(x), int(y)) for x, y in points]
+    except:
+        raise PyBresenhamException('points must only contains (x, y) numeric tuples')
+    if not points:
+        raise PyBresenhamException('points argument must have at least one point')
 
     # Find the min/max x/y values to get the "boundaries" of this shape, to
     # prevent an infinite loop.
-    minx = miny = maxx = maxy = None
-    for bpx, bpy in points:
-        if minx is None:
-            # This is the first point, so set all the min/max to it.
-            minx = maxx = bpx
-            miny = maxy = bpy
+    minx = min([x for x, y in points])
+    maxx = max([x for x, y in points])
+    miny = min([y for x, y in points])
+    maxy = max([y for x, y in points])
+    width = maxx - minx + 1
+
+    # Each byte in the bitmap is _OPEN, _BORDER (a point from `points`),
+    # _FILLED, _BLOCKED (a point where isBoundary() returned True), or
+    # _CHECKED (an open point where isBoundary() returned False).
+    bitmap = bytearray((maxy - miny + 1) * width)
+    for x, y in points:
+        bitmap[(y - miny) * width + x - minx] = _BORDER
+
+    filledSpans = []
+    numFilled = 0
+    reach = 1 if connectivity == 8 else 0 # How far past the ends of a run the next row's runs can touch it.
+    findOpenRuns = _openRunRegex().finditer
+    seeds = [(startx, starty)]
+    while seeds:
+        x, y = seeds.pop()
+        if not (minx < x < maxx and miny < y < maxy):
             continue
-        if bpx < minx:
-            minx = bpx
-        if bpx > maxx:
-            maxx = bpx
-        if bpy < miny:
-            miny = bpy
-        if bpy > maxy:
-            maxy = bpy
-
-    pointsToProcess = [(startx, starty)]
-    while pointsToProcess:
-        x, y = pointsToProcess.pop()
-
-        # Process point to right left of x, y.
-        if x + 1 < maxx and (x + 1, y) not in allPoints:
-            pointsToProcess.append((x + 1, y))
-            allPoints.add((x + 1, y))
-        # Process point to the left of x, y.
-        if x - 1 > minx and (x - 1, y) not in allPoints:
-            pointsToProcess.append((x - 1, y))
-            allPoints.add((x - 1, y))
-        # Process point below x, y.
-        if y + 1 < maxy and (x, y + 1) not in allPoints:
-            pointsToProcess.append((x, y + 1))
-            allPoints.add((x, y + 1))
-        # Process point above x, y.
-        if y - 1 > miny and (x, y - 1) not in allPoints:
-            pointsToProcess.append((x, y - 1))
-            allPoints.add((x, y - 1))
-    return allPoints
-
-
-
-def circle(centerx, centery, radius, filled=False, thickness=1):
+        rowStart = (y - miny) * width - minx # Add x to this to get x's index in the bitmap.
+        if not _isOpen(bitmap, rowStart + x, x, y, isBoundary):
+            continue
+
+        # Find the run of open points on this row that x, y is in.
+        if isBoundary is None:
+            left = _rfindClosed(bitmap, rowStart + minx + 1, rowStart + x) - rowStart + 1
+            right = _findClosed(bitmap, rowStart + x, rowStart + maxx) - rowStart - 1
+        else:
+            left = right = x
+            while left - 1 > minx and _isOpen(bitmap, rowStart + left - 1, left - 1, y, isBoundary):
+                left -= 1
+            while right + 1 < maxx and _isOpen(bitmap, rowStart + right + 1, right + 1, y, isBoundary):
+                right += 1
+
+        bitmap[rowStart + left:rowStart + right + 1] = _FILLED_BYTE * (right - left + 1)
+        filledSpans.append((y, left, right))
+        numFilled += right - left + 1
+        if maxPixels is not None and numFilled > maxPixels:
+            raise PyBresenhamException('the flood fill covers more than maxPixels (%s) points' % (maxPixels))
+
+        # Add a seed for each open run in the rows above and below this run.
+        for nexty in (y - 1, y + 1):
+            if not (miny < nexty < maxy):
+                continue
+            nextRowStart = (nexty - miny) * width - minx
+            scanStart = nextRowStart + max(left - reach, minx + 1)
+            scanEnd = nextRowStart + min(right + reach, maxx - 1) + 1
+            for run in findOpenRuns(bitmap, scanStart, scanEnd):
+                if isBoundary is None:
+                    seeds.append((run.start() - nextRowStart, nexty))
+                    continue
+                # isBoundary() can split the run into several runs.
+                inRun = False
+                for index in range(run.start(), run.end()):
+                    isOpen = _isOpen(bitmap, index, index - nextRowStart, nexty, isBoundary)
+                    if isOpen and not inRun:
+                        seeds.append((index - nextRowStart, nexty))
+                    inRun = isOpen
+
+    if asPointSet:
+        result = PointSet(points)
+        for y, left, right in filledSpans:
+            result.addSpan(y, left, right)
+        return result
+    result = set(points)
+    result.update(spansToPoints(filledSpans))
+    return result
+
+
+# The values of the points in floodFill()'s bitmap.
+_OPEN, _BORDER, _FILLED, _BLOCKED, _CHECKED = 0, 1, 2, 3, 4
+_BORDER_BYTE, _FILLED_BYTE = bytes(bytearray([_BORDER])), bytes(bytearray([_FILLED]))
+@functools.lru_cache(maxsize=None)
+def _openRunRegex():
+    # Returns the regex that finds runs of _OPEN points in floodFill()'s
+    # bitmap. The re module is imported here, the first time floodFill()
+    # needs it, instead of each time pybresenham is imported.
+    import re
+    return re.compile(b'[\x00\x04]+')
+
+
+def _findClosed(bitmap, start, end):
+    # Returns the index of the first point from start up to end that isn't
+    # _OPEN, or end if they're all open. (There are only _BLOCKED and
+    # _CHECKED points when floodFill() has an isBoundary function, and then
+    # floodFill() doesn't use this.)
+    index = end
+    for closedByte in (_BORDER_BYTE, _FILLED_BYTE):
+        found = bitmap.find(closedByte, start, index)
+        if found != -1:
+            index = found
+    return index
+
+
+def _rfindClosed(bitmap, start, end):
+    # Returns the index of the last point from start up to end that isn't
+    # _OPEN, or start - 1 if they're all open.
+    return max(start - 1, bitmap.rfind(_BORDER_BYTE, start, end), bitmap.rfind(_FILLED_BYTE, start, end))
+
+
+def _isOpen(bitmap, index, x, y, isBoundary):
+    # Returns True if the fill can spread to the point, calling isBoundary()
+    # the first time the point is checked and recording the answer.
+    value = bitmap[index]
+    if value == _OPEN:
+        if isBoundary is not None:
+            if isBoundary(x, y):
+                bitmap[index] = _BLOCKED
+                return False
+            bitmap[index] = _CHECKED
+        return True
+    return value == _CHECKED
+
+
+
+def circle(centerx, centery, radius, filled=False, thickness=1, asPointSet=False, clip=None):
     """
     Returns a generator that produces the (x, y) tuples for the outline of a circle.
 
     `centerx` and `centery` are the center of the circle, `radius` is the size.
 
-    (Note: The `filled` and `thickness` parameter is not yet implemented.)
+    The points are produced in clockwise order (as drawn on the screen, where
+    y increases going down), starting from the topmost point at 12 o'clock.
+    The points are generated one at a time, so even huge circles use a
+    constant amount of memory.
+
+    If `filled` is `True`, the interior points are also returned. The points of
+    a filled circle are produced row by row, from top to bottom.
+
+    If `asPointSet` is `True`, a `PointSet` of the points is returned instead
+    of a generator, which is a compact way to keep a large filled circle.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced. The octants (or, for filled circles, the
+    rows) outside of it are skipped without being traced, so a huge circle
+    costs about as much as its visible part.
+
+    (Note: The `thickness` parameter is not yet implemented.)
 
     >>> list(circle(0, 0, 7))
-    [(-6, 3), (0, 7), (4, -6), (-7, 0), (7, -1), (7, -2), (2, -7), (5, -5), (-5, 5), (-1, -7), (-2, -7), (-4, 6), (7, 2), (5, 5), (-5, -5), (6, -4), (6, 3), (-6, 4), (3, 6), (-3, 6), (6, 4), (1, -7), (6, -3), (7, 1), (-6, -4), (-7, 2), (-4, -6), (-2, 7), (-1, 7), (2, 7), (7, 0), (-7, -1), (-7, -2), (4, 6), (0, -7), (-6, -3), (-7, 1), (1, 7), (3, -6), (-3, -6)]
+    [(0, -7), (1, -7), (2, -7), (3, -6), (4, -6), (5, -5), (6, -4), (6, -3), (7, -2), (7, -1), (7, 0), (7, 1), (7, 2), (6, 3), (6, 4), (5, 5), (4, 6), (3, 6), (2, 7), (1, 7), (0, 7), (-1, 7), (-2, 7), (-3, 6), (-4, 6), (-5, 5), (-6, 4), (-6, 3), (-7, 2), (-7, 1), (-7, 0), (-7, -1), (-7, -2), (-6, -3), (-6, -4), (-5, -5), (-4, -6), (-3, -6), (-2, -7), (-1, -7)]
     >>> drawPoints(circle(0, 0, 7))
     ,,,,,OOOOO,,,,,
     ,,,OO,,,,,OO,,,
@@ -541,76 +1747,353 @@ def circle(centerx, centery, radius, filled=False, thickness=1):
     ,,O,,,,,,,,,O,,
     ,,,OO,,,,,OO,,,
     ,,,,,OOOOO,,,,,
+    >>> drawPoints(circle(0, 0, 4, filled=True))
+    ,,,OOO,,,
+    ,OOOOOOO,
+    ,OOOOOOO,
+    OOOOOOOOO
+    OOOOOOOOO
+    OOOOOOOOO
+    ,OOOOOOO,
+    ,OOOOOOO,
+    ,,,OOO,,,
+    >>> list(circle(0, 0, 7, clip=(5, -3, 10, 3)))
+    [(6, -3), (7, -2), (7, -1), (7, 0), (7, 1), (7, 2), (6, 3)]
     """
-    # Mid-point/Bresenham's Circle algorithm from https://www.daniweb.com/programming/software-development/threads/321181/python-bresenham-circle-arc-algorithm
-    # and then modified to remove duplicates.
-
-    # The order that the xy points are returned is rather unconventional due to the optimizations in the code, it is not a simple clockwise/counterclockwise sweep.
-    if filled or thickness != 1:
+    if thickness != 1:
         raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
-    switch = 3 - (2 * radius)
-    cx = 0
-    cy = radius
-    """
-    # NOTE - This code leaves a point missing from the final circle on the left side. Until I can figure it out, I'm usin the old algorithm, which unforuntately defeats the purpose of having a generator.
-    # 1st quarter/octant starts clockwise at 12 o'clock
-    while cx <= cy:
-        # Duplicates are formed whenever cx or cy is 0, or when cx == cy.
-        # I've rearranged the original code to minimize if statements,
-        # though it makes the code a bit inscrutable.
-        yield ( cx + x, -cy + y) # 1st quarter 1st octant
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    centerx, centery, radius = int(centerx), int(centery), int(radius)
+    clip = _checkClip(clip)
+
+    if asPointSet:
+        return PointSet.fromSpans(_circleSpans(centerx, centery, radius, filled, clip))
+    if filled:
+        return spansToPoints(_circleSpans(centerx, centery, radius, True, clip))
+    elif clip is not None:
+        return _clippedCirclePoints(centerx, centery, radius, clip)
+    else:
+        return _circlePoints(centerx, centery, radius)
+
+
+def circleSpans(centerx, centery, radius, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same circle that `circle()` produces. Each span covers the points
+    from `xStart` to `xEnd`, inclusive. The spans are produced from top to
+    bottom, and from left to right within each row.
+
+    Each row's span comes straight from the mid-point circle algorithm, so a
+    filled circle takes `2 * radius + 1` spans to describe, and doesn't need
+    any memory for its interior points.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
+
+    >>> list(circleSpans(0, 0, 2))
+    [(-2, -1, 1), (-1, -2, -2), (-1, 2, 2), (0, -2, -2), (0, 2, 2), (1, -2, -2), (1, 2, 2), (2, -1, 1)]
+    >>> list(circleSpans(0, 0, 2, filled=True))
+    [(-2, -1, 1), (-1, -2, 2), (0, -2, 2), (1, -2, 2), (2, -1, 1)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    centerx, centery, radius = int(centerx), int(centery), int(radius)
+    clip = _checkClip(clip)
+
+    return _circleSpans(centerx, centery, radius, filled, clip)
+
+
+def _circleSpans(centerx, centery, radius, filled, clip=None):
+    if clip is None:
+        for rowOffset, runStart, runEnd in _circleRowRuns(radius):
+            y = rowOffset + centery
+            if filled or runStart == 0:
+                yield (y, centerx - runEnd, centerx + runEnd)
+            else:
+                yield (y, centerx - runEnd, centerx - runStart)
+                yield (y, centerx + runStart, centerx + runEnd)
+        return
+
+    left, top, right, bottom = clip
+    if centerx + radius < left or centerx - radius > right:
+        return # None of the circle's columns are inside the clip rectangle.
+    for rowOffset, runStart, runEnd in _circleRowRuns(radius, top - centery, bottom - centery):
+        y = rowOffset + centery
+        if filled or runStart == 0:
+            runs = ((centerx - runEnd, centerx + runEnd),)
+        else:
+            runs = ((centerx - runEnd, centerx - runStart), (centerx + runStart, centerx + runEnd))
+        for xStart, xEnd in runs:
+            xStart, xEnd = max(xStart, left), min(xEnd, right)
+            if xStart <= xEnd:
+                yield (y, xStart, xEnd)
+
+
+def _circleRowRuns(radius, firstRow=None, lastRow=None):
+    # Yields a (rowOffset, runStart, runEnd) tuple for each row of a circle,
+    # from top to bottom. The circle's outline points on the row are the ones
+    # whose distance from the center column is from runStart to runEnd.
+    #
+    # The rows far from the center row come from the octants at 12 and 6
+    # o'clock, where a row can have a run of several points. The rows close
+    # to the center row come from the octants at 3 and 9 o'clock, which only
+    # have one point per row on each side. The octant at 12 o'clock ends on
+    # row `splitRow`, and every row above it comes from the 3 o'clock octant.
+    #
+    # If firstRow and lastRow are given, only the rows with offsets from
+    # firstRow to lastRow are yielded, and the octants are only traced along
+    # the part of them that is on those rows.
+    isClipped = firstRow is not None
+    if not isClipped:
+        firstRow, lastRow = -radius, radius
+    firstRow, lastRow = max(firstRow, -radius), min(lastRow, radius)
+    if firstRow > lastRow:
+        return
+    if radius == 0:
+        yield (0, 0, 0)
+        return
+    octantEnd = _circleOctantEnd(radius)
+    splitRow = _circleY(radius, octantEnd)
+
+    # The top rows, grouping the points of the 12 o'clock octant by row.
+    first, last = _circleOctantRange(radius, octantEnd, -lastRow, -firstRow) if isClipped else (0, octantEnd)
+    runy = None
+    for cx, cy in _circleOctantPart(radius, octantEnd, first, last):
+        if cy != runy:
+            if runy is not None:
+                yield (-runy, runStart, runEnd)
+            runy, runStart = cy, cx
+        runEnd = cx
+    if runy is not None:
+        yield (-runy, runStart, runEnd)
+
+    # The rows just above the center row, then the center row, then the rows just below it.
+    for cx, cy in _circleOctantPart(radius, octantEnd, -lastRow, min(-firstRow, splitRow - 1), reverse=True):
+        yield (-cx, cy, cy)
+    if firstRow <= 0 <= lastRow:
+        yield (0, radius, radius)
+    for cx, cy in _circleOctantPart(radius, octantEnd, max(firstRow, 1), min(lastRow, splitRow - 1)):
+        yield (cx, cy, cy)
+
+    # The bottom rows, walking the octant backwards so the rows go downwards.
+    # (The backwards walk stops before cx == 0, where cy == radius.)
+    first, last = _circleOctantRange(radius, octantEnd, firstRow, lastRow) if isClipped else (0, octantEnd)
+    runy = None
+    for cx, cy in _circleOctantPart(radius, octantEnd, first, last, reverse=True):
+        if cy != runy:
+            if runy is not None:
+                yield (runy, runStart, runEnd)
+            runy, runEnd = cy, cx
+        runStart = cx
+    if lastRow < radius:
+        # The bottom row wasn't asked for.
+        if runy is not None:
+            yield (runy, runStart, runEnd)
+    elif runy == radius:
+        yield (runy, 0, runEnd)
+    else:
+        if runy is not None:
+            yield (runy, runStart, runEnd)
+        yield (radius, 0, 0)
+
+
+def _circlePoints(centerx, centery, radius):
+    # Each octant is traced from one end to the other, so that the whole
+    # circle is a single clockwise sweep. The octants at 12, 3, 6, and 9 o'clock
+    # start with the point on the axis, while the others end just before it
+    # and skip the diagonal point (where cx == cy) that the previous octant
+    # already produced. This way no point is produced twice.
+    if radius == 0:
+        yield (centerx, centery)
+        return
+
+    for cx, cy in _circleOctant(radius):
+        yield (cx + centerx, -cy + centery) # 1st octant, from 12 o'clock
+    for cx, cy in _circleOctant(radius, reverse=True):
+        if cx != cy:
+            yield (cy + centerx, -cx + centery) # 2nd octant, to 3 o'clock
+    for cx, cy in _circleOctant(radius):
+        yield (cy + centerx, cx + centery) # 3rd octant, from 3 o'clock
+    for cx, cy in _circleOctant(radius, reverse=True):
+        if cx != cy:
+            yield (cx + centerx, cy + centery) # 4th octant, to 6 o'clock
+    for cx, cy in _circleOctant(radius):
+        yield (-cx + centerx, cy + centery) # 5th octant, from 6 o'clock
+    for cx, cy in _circleOctant(radius, reverse=True):
         if cx != cy:
-            yield ( cy + x, -cx + y) # 1st quarter 2nd octant
-        if cx != 0:
-            yield ( cy + x,  cx + y) # 2nd quarter 3rd octant
-            if cy != 0:
-                yield (-cx + x,  cy + y) # 3rd quarter 5th octant
-                yield (-cy + x, -cx + y) # 4th quarter 7th octant
-                if cx != cy:
-                    yield (-cy + x,  cx + y) # 3rd quarter 6th octant
-                    yield (-cx + x, -cy + y) # 4th quarter 8th octant
-        if cy != 0 and cx != cy:
-            yield ( cx + x,  cy + y) # 2nd quarter 4th octant
-
-        if switch < 0:
-            switch += (4 * cx) + 6
+            yield (-cy + centerx, cx + centery) # 6th octant, to 9 o'clock
+    for cx, cy in _circleOctant(radius):
+        yield (-cy + centerx, -cx + centery) # 7th octant, from 9 o'clock
+    for cx, cy in _circleOctant(radius, reverse=True):
+        if cx != cy:
+            yield (-cx + centerx, -cy + centery) # 8th octant, to 12 o'clock
+
+
+def _clippedCirclePoints(centerx, centery, radius, clip):
+    # Yields the same points as _circlePoints(), in the same order, but only
+    # the ones inside the clip rectangle. Each octant is only traced over the
+    # range of cx where its points are inside the rectangle, so the octants
+    # outside of it cost nothing.
+    left, top, right, bottom = clip
+    if radius == 0:
+        if left <= centerx <= right and top <= centery <= bottom:
+            yield (centerx, centery)
+        return
+
+    octantEnd = _circleOctantEnd(radius)
+    # Each octant's points are (centerx + signx * cx, centery + signy * cy),
+    # with cx and cy swapped if `swap` is True. The `reverse` octants are
+    # traced backwards so that the circle is one clockwise sweep.
+    for swap, signx, signy, reverse in ((False, 1, -1, False), (True, 1, -1, True), (True, 1, 1, False), (False, 1, 1, True),
+                                        (False, -1, 1, False), (True, -1, 1, True), (True, -1, -1, False), (False, -1, -1, True)):
+        first, last = _circleOctantClipRange(radius, octantEnd, centerx, centery, clip, swap, signx, signy)
+        for cx, cy in _circleOctantPart(radius, octantEnd, first, last, reverse):
+            if reverse and cx == cy:
+                continue # The previous octant already produced the diagonal point.
+            if swap:
+                yield (centerx + signx * cy, centery + signy * cx)
+            else:
+                yield (centerx + signx * cx, centery + signy * cy)
+
+
+def _circleOctantClipRange(radius, octantEnd, centerx, centery, clip, swap, signx, signy):
+    # Returns the (first, last) range of cx where the points of an octant are
+    # inside the clip rectangle. The octant's points are
+    # (centerx + signx * cx, centery + signy * cy), with cx and cy swapped if
+    # `swap` is True.
+    left, top, right, bottom = clip
+    # The range of offsets from the center that are inside the clip rectangle, in this octant's directions.
+    xLow, xHigh = (left - centerx, right - centerx) if signx == 1 else (centerx - right, centerx - left)
+    yLow, yHigh = (top - centery, bottom - centery) if signy == 1 else (centery - bottom, centery - top)
+    if swap:
+        xLow, xHigh, yLow, yHigh = yLow, yHigh, xLow, xHigh
+    first, last = _circleOctantRange(radius, octantEnd, yLow, yHigh)
+    return max(first, xLow), min(last, xHigh)
+
+
+def _circleOctant(radius, reverse=False, start=None):
+    # Yields the (cx, cy) offsets of one octant of a circle, from cx == 0 up
+    # to the diagonal where cx <= cy stops being true. If reverse is True, the
+    # offsets are yielded from the diagonal down to cx == 1 instead. If
+    # `start` is given, the octant starts partway through at cx == start.
+    if not reverse:
+        # Mid-point/Bresenham's Circle algorithm from https://www.daniweb.com/programming/software-development/threads/321181/python-bresenham-circle-arc-algorithm
+        switch = 3 - (2 * radius)
+        cx = 0
+        cy = radius
+        if start:
+            # The algorithm's decision variable is always
+            # 2*cx**2 + 2*cy**2 + 4*cx - 2*cy + 3 - 2*radius**2, so it can be
+            # calculated for any cx instead of stepping there.
+            cx = start
+            cy = _circleY(radius, cx)
+            switch = 2 * (cx * cx + cy * cy - radius * radius) + 4 * cx - 2 * cy + 3
+        while cx <= cy:
+            yield (cx, cy)
+            if switch < 0:
+                switch = switch + (4 * cx) + 6
+            else:
+                switch = switch + (4 * (cx - cy)) + 10
+                cy = cy - 1
+            cx = cx + 1
+    else:
+        # The mid-point algorithm can't be run backwards directly, but the cy
+        # it picks for each cx is the largest cy where cy * (cy - 1) <= radius**2 - cx**2 - 1.
+        # Since cy only ever goes up by 0 or 1 when cx goes down by 1, each
+        # step only needs to check whether cy + 1 still meets that condition.
+        cx = _circleOctantEnd(radius) if start is None else start
+        cy = _circleY(radius, cx)
+        radiusSquared = radius * radius
+        while cx > 0:
+            yield (cx, cy)
+            cx -= 1
+            if (cy + 1) * cy <= radiusSquared - (cx * cx) - 1:
+                cy += 1
+
+
+def _circleOctantPart(radius, octantEnd, first, last, reverse=False):
+    # Returns an iterator of the offsets of _circleOctant() that have a cx
+    # from `first` to `last`, without tracing the rest of the octant.
+    # `octantEnd` is _circleOctantEnd(radius).
+    first, last = max(first, 1 if reverse else 0), min(last, octantEnd)
+    if first > last:
+        return iter(())
+    if reverse and first == 1:
+        return _circleOctant(radius, True, last) # The octant ends at cx == 1 on its own.
+    if not reverse and last == octantEnd:
+        return _circleOctant(radius, False, first) # The octant ends at the diagonal on its own.
+    if reverse:
+        return itertools.islice(_circleOctant(radius, True, last), last - first + 1)
+    return itertools.islice(_circleOctant(radius, False, first), last - first + 1)
+
+
+def _circleOctantRange(radius, octantEnd, cyLow, cyHigh):
+    # Returns the (first, last) range of cx in the first octant where the cy
+    # of the circle is from cyLow to cyHigh. Since cy never goes up as cx
+    # goes up, the ends of the range are found with binary searches.
+    low, high = 0, octantEnd + 1
+    while low < high: # Find the first cx where cy <= cyHigh.
+        middle = (low + high) // 2
+        if _circleY(radius, middle) <= cyHigh:
+            high = middle
         else:
-            switch += (4 * (cx - cy)) + 10
-            cy -= 1
-        cx += 1
-    """
-    points = set()
-    while cx <= cy:
-        # first quarter first octant
-        points.add((cx + centerx,-cy + centery))
-        # first quarter 2nd octant
-        points.add((cy + centerx,-cx + centery))
-        # second quarter 3rd octant
-        points.add((cy + centerx,cx + centery))
-        # second quarter 4.octant
-        points.add((cx + centerx,cy + centery))
-        # third quarter 5.octant
-        points.add((-cx + centerx,cy + centery))
-        # third quarter 6.octant
-        points.add((-cy + centerx,cx + centery))
-        # fourth quarter 7.octant
-        points.add((-cy + centerx,-cx + centery))
-        # fourth quarter 8.octant
-        points.add((-cx + centerx,-cy + centery))
-        if switch < 0:
-            switch = switch + (4 * cx) + 6
+            low = middle + 1
+    first = low
+    low, high = -1, octantEnd
+    while low < high: # Find the last cx where cy >= cyLow.
+        middle = (low + high + 1) // 2
+        if _circleY(radius, middle) >= cyLow:
+            low = middle
         else:
-            switch = switch + (4 * (cx - cy)) + 10
-            cy = cy - 1
-        cx = cx + 1
-    return iter(points)
+            high = middle - 1
+    return first, low
+
 
+def _circleY(radius, cx):
+    # Returns the cy that the mid-point circle algorithm picks for cx in the
+    # first octant, without having to run the algorithm up to cx.
+    discriminant = 1 + 4 * (radius * radius - cx * cx - 1)
+    if discriminant < 0:
+        return 0 # cx is past the end of the octant.
+    return (1 + _isqrt(discriminant)) // 2
+
+
+def _circleOctantEnd(radius):
+    # Returns the last cx of the first octant, where cx <= cy is still true.
+    cx = _isqrt(radius * radius // 2)
+    while cx + 1 <= _circleY(radius, cx + 1):
+        cx += 1
+    while cx > _circleY(radius, cx):
+        cx -= 1
+    return cx
 
 
+def _isqrt(n):
+    # Returns the integer square root of n. (math.isqrt() requires Python 3.8.)
+    if n < 0:
+        raise PyBresenhamException('cannot take the square root of a negative number')
+    if n == 0:
+        return 0
+    x = int(math.sqrt(n))
+    # Correct for floating point error on large numbers.
+    while x * x > n:
+        x -= 1
+    while (x + 1) * (x + 1) <= n:
+        x += 1
+    return x
 
 
-def square(left, top, length, filled=False, thickness=1):
+
+
+
+def square(left, top, length, filled=False, thickness=1, clip=None):
     """Returns a generator that produces (x, y) tuples for a square.
     This function is an alias for the rectangle() function, with `length` passed for both the
     `width` and `height` parameters.
@@ -619,6 +2102,8 @@ def square(left, top, length, filled=False, thickness=1):
 
     If `filled` is `True`, the interior points are also returned.
 
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside that rectangle are produced.
+
     NOTE: The `thickness` argument is not yet implemented.
 
     >>> list(square(0, 0, 5))
@@ -639,10 +2124,22 @@ def square(left, top, length, filled=False, thickness=1):
     if thickness != 1:
         raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
-    return rectangle(left, top, length, length, filled, thickness)
+    return rectangle(left, top, length, length, filled, thickness, clip)
+
+
+def squareSpans(left, top, length, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same square that `square()` produces.
+    This function is an alias for the rectangleSpans() function.
+
+    >>> list(squareSpans(0, 0, 3))
+    [(0, 0, 2), (1, 0, 0), (1, 2, 2), (2, 0, 2)]
+    """
+    return rectangleSpans(left, top, length, length, filled, clip)
 
 
-def rectangle(left, top, width, height, filled=False, thickness=1):
+def rectangle(left, top, width, height, filled=False, thickness=1, clip=None):
     """
     Returns a generator that produces (x, y) tuples for a rectangle.
 
@@ -650,6 +2147,10 @@ def rectangle(left, top, width, height, filled=False, thickness=1):
 
     If `filled` is `True`, the interior points are also returned.
 
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced. Each side is cut to fit inside it, so the
+    points outside of it are never generated.
+
     NOTE: The `thickness` argument is not yet implemented.
 
     >>> list(rectangle(0, 0, 10, 4))
@@ -664,6 +2165,8 @@ def rectangle(left, top, width, height, filled=False, thickness=1):
     OOOOOOOOOO
     OOOOOOOOOO
     OOOOOOOOOO
+    >>> list(rectangle(0, 0, 10, 4, clip=(7, 2, 20, 20)))
+    [(9, 2), (9, 3), (8, 3), (7, 3)]
     """
 
     # Note: For perfomance, this function does not rely on line() to generate its points.
@@ -679,40 +2182,113 @@ def rectangle(left, top, width, height, filled=False, thickness=1):
     _checkForIntOrFloat(height)
 
     left, top, width, height = int(left), int(top), int(width), int(height)
+    clip = _checkClip(clip)
 
     if width < 1 or height < 1:
         raise PyBresenhamException('width and height must be positive integers')
 
+    right = left + width - 1
+    bottom = top + height - 1
+
+    # The part of the rectangle that is inside the clip rectangle. Each side's range is cut to fit inside of it.
+    if clip is None:
+        clipLeft, clipTop, clipRight, clipBottom = left, top, right, bottom
+    else:
+        clipLeft, clipTop = max(left, clip[0]), max(top, clip[1])
+        clipRight, clipBottom = min(right, clip[2]), min(bottom, clip[3])
+        if clipLeft > clipRight or clipTop > clipBottom:
+            return # The rectangle is completely outside of the clip rectangle.
+
     # Generate all the points.
-    if filled:
-        for y in range(top, top + height):
-            for x in range(left, left + width):
+    if filled or width == 1 or height == 1:
+        # (A rectangle that is one point wide or tall has no interior, so it's the same as a filled one.)
+        for y in range(clipTop, clipBottom + 1):
+            for x in range(clipLeft, clipRight + 1):
                 yield (x, y)
     else:
         # Note: The `- 1` adjustments here are to prevent duplicate coordinates of the corners being returned.
 
         # Top side.
         y = top
-        for x in range(left, left + width - 1):
-            yield (x, y)
+        if clipTop == top:
+            for x in range(clipLeft, min(right - 1, clipRight) + 1):
+                yield (x, y)
 
         # Right side.
-        x = left + width - 1
-        for y in range(top, top + height - 1):
-            yield (x, y)
+        x = right
+        if clipRight == right:
+            for y in range(clipTop, min(bottom - 1, clipBottom) + 1):
+                yield (x, y)
 
         # Bottom side.
-        y = top + height - 1
-        for x in range(left + width - 1, left, -1):
-            yield (x, y)
+        y = bottom
+        if clipBottom == bottom:
+            for x in range(clipRight, max(left + 1, clipLeft) - 1, -1):
+                yield (x, y)
 
         # Left side.
         x = left
-        for y in range(top + height - 1, top, -1):
-            yield (x, y)
+        if clipLeft == left:
+            for y in range(clipBottom, max(top + 1, clipTop) - 1, -1):
+                yield (x, y)
+
+
+def rectangleSpans(left, top, width, height, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same rectangle that `rectangle()` produces. Each span covers the
+    points from `xStart` to `xEnd`, inclusive. The spans are produced from top
+    to bottom, and from left to right within each row.
+
+    A filled rectangle only has one span per row, no matter how wide it is.
 
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
 
-def diamond(left, top, radius, filled=False, thickness=1):
+    >>> list(rectangleSpans(0, 0, 10, 4))
+    [(0, 0, 9), (1, 0, 0), (1, 9, 9), (2, 0, 0), (2, 9, 9), (3, 0, 9)]
+    >>> list(rectangleSpans(0, 0, 10, 4, filled=True))
+    [(0, 0, 9), (1, 0, 9), (2, 0, 9), (3, 0, 9)]
+    """
+
+    # Validate arguments
+    _checkForIntOrFloat(left)
+    _checkForIntOrFloat(top)
+    _checkForIntOrFloat(width)
+    _checkForIntOrFloat(height)
+
+    left, top, width, height = int(left), int(top), int(width), int(height)
+
+    if width < 1 or height < 1:
+        raise PyBresenhamException('width and height must be positive integers')
+
+    right = left + width - 1
+    bottom = top + height - 1
+    clip = _checkClip(clip)
+
+    # Generate all the spans.
+    if clip is None:
+        for y in range(top, bottom + 1):
+            if filled or y == top or y == bottom or width <= 2:
+                yield (y, left, right)
+            else:
+                yield (y, left, left)
+                yield (y, right, right)
+        return
+
+    clipLeft, clipTop, clipRight, clipBottom = clip
+    for y in range(max(top, clipTop), min(bottom, clipBottom) + 1):
+        if filled or y == top or y == bottom or width <= 2:
+            runs = ((left, right),)
+        else:
+            runs = ((left, left), (right, right))
+        for xStart, xEnd in runs:
+            xStart, xEnd = max(xStart, clipLeft), min(xEnd, clipRight)
+            if xStart <= xEnd:
+                yield (y, xStart, xEnd)
+
+
+def diamond(left, top, radius, filled=False, thickness=1, clip=None):
     """
     Returns a generator that produces (x, y) tuples in a diamond shape.
     It is easier to predict the size of the diamond that this function
@@ -725,6 +2301,9 @@ def diamond(left, top, radius, filled=False, thickness=1):
 
     If `filled` is `True`, the interior points are also returned.
 
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced, and the rows outside of it are skipped.
+
     In this example diamond shape, the D characters represent the
     drawn diamond, the . characters represent the "outside spaces",
     and the ' characters represent the "inside spaces".
@@ -761,6 +2340,18 @@ def diamond(left, top, radius, filled=False, thickness=1):
     if thickness != 1:
         raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
+    # Validate arguments.
+    _checkForIntOrFloat(left)
+    _checkForIntOrFloat(top)
+    _checkForIntOrFloat(radius, minVal=0)
+    left, top, radius = int(left), int(top), int(radius)
+
+    if clip is not None:
+        # The diamond's points are in the same order as its spans, so only the spans inside the clip rectangle are needed.
+        for point in spansToPoints(diamondSpans(left, top, radius, filled, clip)):
+            yield point
+        return
+
     outsideSpaces = radius
     insideSpaces = 1 # We'll only start incrementing insidesSpaces on the 2nd row.
 
@@ -788,34 +2379,841 @@ def diamond(left, top, radius, filled=False, thickness=1):
             outsideSpaces += 1
             insideSpaces -= 2
 
-'''
-# TODO The following functions still need implementing.
 
-def ellipse(rotation=0, filled=False, thickness=1): # TODO rect-based paramters or center xy parameters?
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+def diamondSpans(left, top, radius, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same diamond that `diamond()` produces. Each span covers the
+    points from `xStart` to `xEnd`, inclusive. The spans are produced from top
+    to bottom, and from left to right within each row.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
+
+    >>> list(diamondSpans(0, 0, 2))
+    [(0, 3, 3), (1, 2, 2), (1, 4, 4), (2, 1, 1), (2, 5, 5), (3, 2, 2), (3, 4, 4), (4, 3, 3)]
+    >>> list(diamondSpans(0, 0, 2, filled=True))
+    [(0, 3, 3), (1, 2, 4), (2, 1, 5), (3, 2, 4), (4, 3, 3)]
+    """
 
+    # Validate arguments.
+    _checkForIntOrFloat(left)
+    _checkForIntOrFloat(top)
+    _checkForIntOrFloat(radius, minVal=0)
+    left, top, radius = int(left), int(top), int(radius)
+    clip = _checkClip(clip)
+
+    rows = range(radius * 2 + 1)
+    if clip is not None:
+        rows = range(max(0, clip[1] - top), min(radius * 2, clip[3] - top) + 1)
+
+    for row in rows:
+        # The rows get narrower the further they are from the middle row.
+        distanceFromMiddle = abs(row - radius)
+        leftx = left + 1 + distanceFromMiddle
+        rightx = left + 1 + (radius * 2) - distanceFromMiddle
+
+        if clip is not None:
+            if filled or leftx == rightx:
+                runs = ((leftx, rightx),)
+            else:
+                runs = ((leftx, leftx), (rightx, rightx))
+            for xStart, xEnd in runs:
+                xStart, xEnd = max(xStart, clip[0]), min(xEnd, clip[2])
+                if xStart <= xEnd:
+                    yield (row + top, xStart, xEnd)
+        elif filled or leftx == rightx:
+            yield (row + top, leftx, rightx)
+        else:
+            yield (row + top, leftx, leftx)
+            yield (row + top, rightx, rightx)
 
-def ellipseVertices():
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
+def ellipse(centerx, centery, radiusx, radiusy, rotationDegrees=0, filled=False, thickness=1, clip=None):
+    """
+    Returns a generator that produces the (x, y) tuples for the outline of an ellipse.
 
-def arc(x, y, radius, startAngle, stopAngle, rotation=0, filled=False, thickness=1, endcap=None):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    `centerx` and `centery` are the center of the ellipse, and `radiusx` and
+    `radiusy` are its horizontal and vertical radii before it is rotated
+    counterclockwise by `rotationDegrees`. An ellipse with equal radii is the
+    same as the `circle()` with that radius.
 
+    Each point is picked by the mid-point rule: a point is part of the
+    ellipse when the point halfway between it and the next point outward is
+    inside the ellipse. For unrotated ellipses (and ones rotated by a multiple
+    of 90 degrees) this is done with integer math. Rotated ellipses solve the
+    ellipse's conic equation, `A*x*x + B*x*y + C*y*y = F`, for each row.
 
-def arcVertices(x, y, radius, startAngle, stopAngle, numVertices):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    The points are produced row by row, from top to bottom and left to right
+    within each row. Each row is worked out on its own from its neighbors, so
+    even a huge ellipse uses a constant amount of memory, its outline takes
+    time in proportion to its perimeter, and a filled ellipse takes one span
+    per row (see `ellipseSpans()`).
 
+    If `filled` is `True`, the interior points are also returned.
 
-def star(x, y, radius, points=5, rotation=0, filled=False, thickness=1):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
-    # TODO - will call polygonVertices() to get the verticies needed for the star.
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced, and the rows outside of it are skipped.
 
-def starVertices(x, y, radius, points=5):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
-'''
+    (Note: The `thickness` parameter is not yet implemented.)
+
+    >>> drawPoints(ellipse(0, 0, 7, 3))
+    ,,,,OOOOOOO,,,,
+    ,OOO,,,,,,,OOO,
+    O,,,,,,,,,,,,,O
+    O,,,,,,,,,,,,,O
+    O,,,,,,,,,,,,,O
+    ,OOO,,,,,,,OOO,
+    ,,,,OOOOOOO,,,,
+    >>> drawPoints(ellipse(0, 0, 8, 3, rotationDegrees=30))
+    ,,,,,,,,,,,OOO,
+    ,,,,,,,,OOO,,,O
+    ,,,,,,OO,,,,,,O
+    ,,,,OO,,,,,,,,O
+    ,,,O,,,,,,,,,O,
+    ,,O,,,,,,,,,O,,
+    ,O,,,,,,,,,O,,,
+    O,,,,,,,,OO,,,,
+    O,,,,,,OO,,,,,,
+    O,,,OOO,,,,,,,,
+    ,OOO,,,,,,,,,,,
+    >>> drawPoints(ellipse(0, 0, 4, 2, filled=True))
+    ,,OOOOO,,
+    ,OOOOOOO,
+    OOOOOOOOO
+    ,OOOOOOO,
+    ,,OOOOO,,
+    """
+    if thickness != 1:
+        raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    return spansToPoints(ellipseSpans(centerx, centery, radiusx, radiusy, rotationDegrees, filled, clip))
+
+
+def ellipseSpans(centerx, centery, radiusx, radiusy, rotationDegrees=0, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same ellipse that `ellipse()` produces. Each span covers the points
+    from `xStart` to `xEnd`, inclusive. The spans are produced from top to
+    bottom, and from left to right within each row, so a filled ellipse takes
+    one span per row.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows outside of it are skipped.
+
+    >>> list(ellipseSpans(0, 0, 3, 1))
+    [(-1, -2, 2), (0, -3, -3), (0, 3, 3), (1, -2, 2)]
+    >>> list(ellipseSpans(0, 0, 3, 1, filled=True))
+    [(-1, -2, 2), (0, -3, 3), (1, -2, 2)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radiusx, minVal=0)
+    _checkForIntOrFloat(radiusy, minVal=0)
+    _checkForIntOrFloat(rotationDegrees)
+    centerx, centery, radiusx, radiusy = int(centerx), int(centery), int(radiusx), int(radiusy)
+    clip = _checkClip(clip)
+
+    cos, sin = _cosSin(rotationDegrees)
+    if cos == 0:
+        # A quarter turn just swaps the radii.
+        radiusx, radiusy, cos, sin = radiusy, radiusx, 1, 0
+    if sin != 0 and (radiusx == 0 or radiusy == 0):
+        # A rotated ellipse with no width or height is a line.
+        endx, endy = int(round(radiusx * cos - radiusy * sin)), int(round(-radiusx * sin - radiusy * cos))
+        return iter(pointsToSpans(line(centerx - endx, centery - endy, centerx + endx, centery + endy, clip=clip)))
+    if sin == 0:
+        rowExtent, lastRow = _axisAlignedEllipseRowExtent(radiusx, radiusy)
+    else:
+        rowExtent, lastRow = _rotatedEllipseRowExtent(radiusx, radiusy, cos, sin)
+    return _ellipseSpans(centerx, centery, rowExtent, lastRow, filled, clip)
+
+
+def _ellipseSpans(centerx, centery, rowExtent, lastRow, filled, clip):
+    # Produces the spans of the rows from -lastRow to lastRow (relative to
+    # centery), where rowExtent(row) returns the row's (left, right) extent
+    # relative to centerx, or None if the row is empty. An outline point is a
+    # point of the filled ellipse that has a side (not just a corner) next to
+    # a point outside of it.
+    firstRow = -lastRow
+    left = right = None
+    if clip is not None:
+        left, top, right, bottom = clip
+        firstRow, lastRow = max(firstRow, top - centery), min(lastRow, bottom - centery)
+    if firstRow > lastRow:
+        return
+
+    above = rowExtent(firstRow - 1) # This is None for the rows past the top of the ellipse.
+    current = rowExtent(firstRow)
+    for row in range(firstRow, lastRow + 1):
+        below = rowExtent(row + 1)
+        if current is not None:
+            xStart, xEnd = current
+            leftEnd = rightStart = xEnd + 1
+            if not filled and above is not None and below is not None:
+                # The points left of both neighboring rows' spans (and right of
+                # both of them) are on the outline. Next to a missing row, the
+                # whole row is.
+                leftEnd = max(xStart, above[0] - 1, below[0] - 1)
+                rightStart = min(xEnd, above[1] + 1, below[1] + 1)
+            y = row + centery
+            if leftEnd + 1 >= rightStart:
+                runs = ((xStart, xEnd),)
+            else:
+                runs = ((xStart, leftEnd), (rightStart, xEnd))
+            for runStart, runEnd in runs:
+                runStart, runEnd = runStart + centerx, runEnd + centerx
+                if left is not None:
+                    runStart, runEnd = max(runStart, left), min(runEnd, right)
+                    if runStart > runEnd:
+                        continue
+                yield (y, runStart, runEnd)
+        above, current = current, below
+
+
+def _axisAlignedEllipseRowExtent(radiusx, radiusy):
+    # Returns a function that gives the (left, right) extent of a row of an
+    # unrotated ellipse, and the last row. A point is inside if the midpoint
+    # toward the next point outward, along the row or along the column, is
+    # inside the ellipse `ry*ry*x*x + rx*rx*y*y <= rx*rx*ry*ry`.
+    rx2, ry2 = radiusx * radiusx, radiusy * radiusy
+    isqrt = getattr(math, 'isqrt', _isqrt) # math.isqrt() requires Python 3.8.
+
+    def rowExtent(row):
+        row = abs(row)
+        if row > radiusy:
+            return None
+        if row == 0:
+            return (-radiusx, radiusx)
+        # Along the row: ry2 * (2x - 1)**2 <= 4 * rx2 * (ry2 - row**2)
+        # Along the column: 4 * ry2 * x**2 <= rx2 * (4 * ry2 - (2row - 1)**2)
+        right = max((isqrt(4 * rx2 * (ry2 - row * row) // ry2) + 1) // 2,
+                    isqrt(rx2 * (4 * ry2 - (2 * row - 1) ** 2) // (4 * ry2)))
+        return (-right, right)
+    return rowExtent, radiusy
+
+
+def _rotatedEllipseRowExtent(radiusx, radiusy, cos, sin):
+    # Returns a function that gives the (left, right) extent of a row of a
+    # rotated ellipse, and the last row. With y increasing going down, the
+    # ellipse is the conic A*x*x + B*x*y + C*y*y <= F.
+    rx2, ry2 = radiusx * radiusx, radiusy * radiusy
+    a = ry2 * cos * cos + rx2 * sin * sin
+    b = 2 * cos * sin * (rx2 - ry2)
+    c = ry2 * sin * sin + rx2 * cos * cos
+    f = rx2 * ry2
+    determinant = 4 * a * c - b * b
+    maxy = math.sqrt(4 * a * f / determinant) # The distance from the center to the top and bottom.
+    rightmostx = math.sqrt(4 * c * f / determinant)
+    rightmosty = -b * rightmostx / (2 * c) # The leftmost point is at -rightmostx, -rightmosty.
+
+    sqrt, ceil, floor = math.sqrt, math.ceil, math.floor
+    twoA, fourAF = 2 * a, 4 * a * f
+
+    def rowExtent(row):
+        if abs(row) - 0.5 > maxy:
+            return None
+        # Along the column: the columns that cross the row's band from row -
+        # 0.5 to row + 0.5, which reach farthest left and right at the y in
+        # the band closest to the leftmost and rightmost points.
+        bandTop, bandBottom = max(row - 0.5, -maxy), min(row + 0.5, maxy)
+        y = min(max(-rightmosty, bandTop), bandBottom)
+        xStart = int(ceil((-b * y - sqrt(max(0.0, fourAF - determinant * y * y))) / twoA))
+        y = min(max(rightmosty, bandTop), bandBottom)
+        xEnd = int(floor((-b * y + sqrt(max(0.0, fourAF - determinant * y * y))) / twoA))
+        if abs(row) <= maxy:
+            # Along the row: the points whose inward midpoint is inside.
+            root = sqrt(max(0.0, fourAF - determinant * row * row))
+            xStart = min(xStart, int(ceil((-b * row - root) / twoA - 0.5)))
+            xEnd = max(xEnd, int(floor((-b * row + root) / twoA + 0.5)))
+        if xStart > xEnd:
+            return None
+        return (xStart, xEnd)
+    return rowExtent, int(math.floor(maxy + 0.5))
+
+
+def ellipseVertices(centerx, centery, radiusx, radiusy, rotationDegrees=0, numVertices=None):
+    """
+    Returns a generator that produces the (x, y) points of the vertices of a
+    polygon that follows the outline of an ellipse, going counterclockwise
+    from the end of its horizontal radius. The arguments are the same as for
+    `ellipse()`. Passing the vertices to `lines()` with `closed=True` draws
+    the polygon.
+
+    If `numVertices` isn't given, enough vertices are used that the polygon
+    is never more than half a point away from the ellipse. The vertices are
+    rounded to the nearest ints.
+
+    >>> list(ellipseVertices(0, 0, 10, 4, numVertices=4))
+    [(10, 0), (0, -4), (-10, 0), (0, 4)]
+    >>> list(ellipseVertices(0, 0, 10, 4, rotationDegrees=90, numVertices=4))
+    [(0, -10), (-4, 0), (0, 10), (4, 0)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radiusx, minVal=0)
+    _checkForIntOrFloat(radiusy, minVal=0)
+    _checkForIntOrFloat(rotationDegrees)
+    if numVertices is None:
+        # A chord's farthest distance from the curve is radius * (1 - cos(pi / numVertices)).
+        maxRadius = max(radiusx, radiusy)
+        numVertices = 4 if maxRadius <= 1 else max(4, int(math.ceil(math.pi / math.acos(1 - 0.5 / maxRadius))))
+    _checkForIntOrFloat(numVertices, minVal=3)
+
+    cos, sin = _cosSin(rotationDegrees)
+    for i in range(int(numVertices)):
+        pointCos, pointSin = _cosSin(360.0 * i / int(numVertices))
+        x, y = radiusx * pointCos, radiusy * pointSin
+        yield (int(round(centerx + x * cos - y * sin)), int(round(centery - x * sin - y * cos)))
+
+
+def arc(centerx, centery, radius, startAngle, stopAngle, filled=False, thickness=1, clip=None):
+    """
+    Returns a generator that produces the (x, y) tuples of the part of a
+    circle's outline that goes counterclockwise from `startAngle` to
+    `stopAngle`. The angles are in degrees, counterclockwise from 3 o'clock
+    (the same direction that `polygon()` rotates in), so an arc from 0 to 90
+    is the top right quarter of the circle. If the angles are 360 or more
+    degrees apart, the whole circle is produced.
+
+    The points are the same ones that `circle()` produces, but only the
+    octants that the arc covers are traced, and only between the arc's ends,
+    so a short arc of a huge circle is cheap. The points are produced in
+    counterclockwise order, from `startAngle` to `stopAngle`.
+
+    If `filled` is `True`, the points of the pie slice between the arc and the
+    center are produced instead, row by row from top to bottom. If `thickness`
+    is more than 1, the arc is that many points thick, growing inwards from
+    the outline. These are produced from the spans of `arcSpans()`.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced.
+
+    >>> list(arc(0, 0, 5, 0, 90))
+    [(5, 0), (5, -1), (5, -2), (4, -3), (3, -4), (2, -5), (1, -5), (0, -5)]
+    >>> drawPoints(arc(0, 0, 7, 45, 180))
+    ,,,,,OOOOO,,,
+    ,,,OO,,,,,OO,
+    ,,O,,,,,,,,,O
+    ,O,,,,,,,,,,,
+    ,O,,,,,,,,,,,
+    O,,,,,,,,,,,,
+    O,,,,,,,,,,,,
+    O,,,,,,,,,,,,
+    >>> drawPoints(arc(0, 0, 6, 30, 150, filled=True))
+    ,,,OOOOO,,,
+    ,,OOOOOOO,,
+    ,OOOOOOOOO,
+    OOOOOOOOOOO
+    ,,OOOOOOO,,
+    ,,,,OOO,,,,
+    ,,,,,O,,,,,
+    >>> drawPoints(arc(0, 0, 6, 0, 270, thickness=2))
+    ,,,,OOOOO,,,,
+    ,,,OOOOOOO,,,
+    ,,OOO,,,OOO,,
+    ,OO,,,,,,,OO,
+    OOO,,,,,,,OOO
+    OO,,,,,,,,,OO
+    OO,,,,,,,,,OO
+    OO,,,,,,,,,,,
+    OOO,,,,,,,,,,
+    ,OO,,,,,,,,,,
+    ,,OOO,,,,,,,,
+    ,,,OOOO,,,,,,
+    ,,,,OOO,,,,,,
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    _checkForIntOrFloat(startAngle)
+    _checkForIntOrFloat(stopAngle)
+    _checkForIntOrFloat(thickness, minVal=1)
+    centerx, centery, radius, thickness = int(centerx), int(centery), int(radius), int(thickness)
+    clip = _checkClip(clip)
+
+    startAngle, sweep = _arcSweep(startAngle, stopAngle)
+    if filled or thickness > 1:
+        return spansToPoints(_arcSpans(centerx, centery, radius, startAngle, sweep, filled, thickness, clip))
+    return _arcPoints(centerx, centery, radius, startAngle, sweep, clip)
+
+
+def arcSpans(centerx, centery, radius, startAngle, stopAngle, filled=False, thickness=1, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same arc (or pie slice) that `arc()` produces. Each span covers the
+    points from `xStart` to `xEnd`, inclusive. The spans are produced from top
+    to bottom, and from left to right within each row.
+
+    Only the rows that the arc reaches are visited, and each row's spans are
+    the circle's spans on that row cut down to the arc's angles, so a filled
+    or thick arc takes a few spans per row instead of one tuple per point.
+
+    If `thickness` is more than 1, the arc is made of the points of the
+    filled circle that aren't in the filled circle with a radius of
+    `radius - thickness`, so a thick arc has no gaps.
+
+    >>> list(arcSpans(0, 0, 3, 0, 90))
+    [(-3, 0, 1), (-2, 2, 2), (-1, 3, 3), (0, 3, 3)]
+    >>> list(arcSpans(0, 0, 3, 0, 90, filled=True))
+    [(-3, 0, 1), (-2, 0, 2), (-1, 0, 3), (0, 0, 3)]
+    >>> list(arcSpans(0, 0, 3, 0, 90, thickness=2))
+    [(-3, 0, 1), (-2, 0, 2), (-1, 1, 3), (0, 2, 3)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    _checkForIntOrFloat(startAngle)
+    _checkForIntOrFloat(stopAngle)
+    _checkForIntOrFloat(thickness, minVal=1)
+    centerx, centery, radius, thickness = int(centerx), int(centery), int(radius), int(thickness)
+    clip = _checkClip(clip)
+
+    startAngle, sweep = _arcSweep(startAngle, stopAngle)
+    return _arcSpans(centerx, centery, radius, startAngle, sweep, filled, thickness, clip)
+
+
+def _arcSweep(startAngle, stopAngle):
+    # Returns the start angle (from 0 up to 360) and the number of degrees
+    # that the arc sweeps counterclockwise from it (from 0 to 360).
+    if abs(stopAngle - startAngle) >= 360:
+        return startAngle % 360, 360
+    return startAngle % 360, (stopAngle - startAngle) % 360
+
+
+def _arcDirection(angle):
+    # Returns an (x, y) vector that points at the angle, with y going up. The
+    # vectors of multiples of 45 degrees are exact ints, so the points that
+    # are exactly on those angles (like the diagonal points of a circle) are
+    # always on the same side of them.
+    angle %= 360
+    if angle % 45 == 0:
+        return ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))[int(angle) // 45]
+    return _cosSin(angle)
+
+
+def _arcSide(direction, x, y):
+    # Returns a positive number if the point (x, y) (with y going up) is
+    # counterclockwise from `direction`, a negative number if it's clockwise
+    # from it, and 0 if it's exactly on the line. Both arc() and arcSpans()
+    # decide which points are inside an arc with this, so they always agree.
+    return direction[0] * y - direction[1] * x
+
+
+def _arcPoints(centerx, centery, radius, startAngle, sweep, clip):
+    # Yields the points of circle() that are on the arc, going
+    # counterclockwise. The arc is split up by the octants that it passes
+    # through (starting with the octant before it, in case it starts on a
+    # point that octant owns), and each octant is only traced between the
+    # arc's ends.
+    if radius == 0:
+        if clip is None or (clip[0] <= centerx <= clip[2] and clip[1] <= centery <= clip[3]):
+            yield (centerx, centery)
+        return
+
+    octantEnd = _circleOctantEnd(radius)
+    diagonalIsOnCircle = _circleY(radius, octantEnd) == octantEnd
+    stopAngle = startAngle + sweep
+    for k in range(int(startAngle // 45) - 1, int(stopAngle // 45) + 1):
+        lowAngle, highAngle = max(startAngle, 45 * k), min(stopAngle, 45 * (k + 1))
+        if lowAngle > highAngle:
+            continue
+
+        # The octants go counterclockwise from 3 o'clock, and each one's
+        # points are (centerx + signx * cx, centery + signy * cy), with cx and
+        # cy swapped if `swap` is True. The angle of the even octants' points
+        # goes up as cx goes up, and the odd octants' goes down. The odd
+        # octants own the points on the axes and diagonals between them.
+        octant = k % 8
+        swap, signx, signy = ((True, 1, -1), (False, 1, -1), (False, -1, -1), (True, -1, -1),
+                              (True, -1, 1), (False, -1, 1), (False, 1, 1), (True, 1, 1))[octant]
+        isOdd = octant % 2 == 1
+        first, last = (0, octantEnd) if isOdd else (1, octantEnd - 1 if diagonalIsOnCircle else octantEnd)
+
+        # Find the range of cx between the arc's ends. An end on the edge of the
+        # octant doesn't need a search, unless the end of a whole circle has
+        # to leave out the point at its start.
+        if lowAngle != 45 * k:
+            cx = _arcOctantSearch(radius, octantEnd, swap, signx, signy, _arcDirection(lowAngle), 1, False, not isOdd)
+            first, last = (first, min(last, cx)) if isOdd else (max(first, cx), last)
+        isOpen = sweep == 360 and highAngle == stopAngle
+        if highAngle != 45 * (k + 1) or isOpen:
+            cx = _arcOctantSearch(radius, octantEnd, swap, signx, signy, _arcDirection(highAngle), -1, isOpen, isOdd)
+            first, last = (max(first, cx), last) if isOdd else (first, min(last, cx))
+        if clip is not None:
+            clipFirst, clipLast = _circleOctantClipRange(radius, octantEnd, centerx, centery, clip, swap, signx, signy)
+            first, last = max(first, clipFirst), min(last, clipLast)
+        if first > last:
+            continue
+
+        # The even octants go counterclockwise when cx goes up, and the odd ones when it goes down.
+        offsets = _circleOctantPart(radius, octantEnd, first, last, reverse=isOdd)
+        if isOdd and first == 0:
+            offsets = itertools.chain(offsets, ((0, radius),)) # The reverse walk stops before cx == 0.
+        for cx, cy in offsets:
+            if swap:
+                yield (centerx + signx * cy, centery + signy * cx)
+            else:
+                yield (centerx + signx * cx, centery + signy * cy)
+
+
+def _arcOctantSearch(radius, octantEnd, swap, signx, signy, direction, sign, isOpen, findFirst):
+    # Returns the first cx of the octant (or octantEnd + 1 if there's none)
+    # where `sign` times _arcSide() of the point is at least 0 (or more than 0
+    # if `isOpen` is True), or if `findFirst` is False, the last cx (or -1).
+    # Since the octant covers only 45 degrees, the points on one side of
+    # `direction` are all at one end of it, so this is a binary search.
+    def isOnSide(cx):
+        cy = _circleY(radius, cx)
+        x, y = (cy, cx) if swap else (cx, cy)
+        side = sign * _arcSide(direction, signx * x, -signy * y)
+        return side > 0 if isOpen else side >= 0
+
+    if findFirst:
+        low, high = 0, octantEnd + 1
+        while low < high:
+            middle = (low + high) // 2
+            if isOnSide(middle):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+    low, high = -1, octantEnd
+    while low < high:
+        middle = (low + high + 1) // 2
+        if isOnSide(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _arcSpans(centerx, centery, radius, startAngle, sweep, filled, thickness, clip):
+    # Yields the spans of each of the circle's rows (or, for a thick arc, the
+    # parts of the filled circle's rows that are outside of the inner filled
+    # circle) cut down to the part of the row that is inside the arc's angles.
+    stopAngle = startAngle + sweep
+    startDirection, stopDirection = _arcDirection(startAngle), _arcDirection(stopAngle)
+
+    # Only visit the rows from the arc's top to its bottom, plus a row on each
+    # side for rounding. The ends of the arc (and of its inside edge, for
+    # thick arcs, or the center, for pie slices) are the top and bottom,
+    # unless the arc passes 12 or 6 o'clock.
+    innerRadius = radius - thickness if thickness > 1 and not filled else -1
+    startSin, stopSin = _cosSin(startAngle)[1], _cosSin(stopAngle)[1]
+    ends = [radius * startSin, radius * stopSin]
+    if filled or thickness > radius:
+        ends.append(0)
+    elif thickness > 1:
+        ends.extend((innerRadius * startSin, innerRadius * stopSin))
+    highest = radius if (90 - startAngle) % 360 <= sweep else max(ends)
+    lowest = -radius if (270 - startAngle) % 360 <= sweep else min(ends)
+    firstRow, lastRow = -int(math.ceil(highest)) - 1, -int(math.floor(lowest)) + 1
+    clipLow, clipHigh = -float('inf'), float('inf') # The range of x offsets from centerx that are inside the clip rectangle.
+    if clip is not None:
+        left, top, right, bottom = clip
+        firstRow, lastRow = max(firstRow, top - centery), min(lastRow, bottom - centery)
+        clipLow, clipHigh = left - centerx, right - centerx
+
+    innerRows = _circleRowRuns(innerRadius, firstRow, lastRow) if innerRadius >= 0 else iter(())
+    innerRow = next(innerRows, None)
+    for rowOffset, runStart, runEnd in _circleRowRuns(radius, firstRow, lastRow):
+        if filled or thickness > 1:
+            runs = ((-runEnd, runEnd),)
+            if innerRow is not None and innerRow[0] == rowOffset:
+                runs = ((-runEnd, -innerRow[2] - 1), (innerRow[2] + 1, runEnd))
+                innerRow = next(innerRows, None)
+        elif runStart == 0:
+            runs = ((-runEnd, runEnd),)
+        else:
+            runs = ((-runEnd, -runStart), (runStart, runEnd))
+
+        # The range of x on this row that is inside the arc's angles. Up to
+        # 180 degrees, that's the points on both the counterclockwise side of
+        # the start and the clockwise side of the stop, and past it, the
+        # points on either side.
+        y = -rowOffset
+        if sweep == 360:
+            insides = ((-runEnd, runEnd),)
+        else:
+            startLow, startHigh = _arcRowRange(startDirection, 1, y)
+            stopLow, stopHigh = _arcRowRange(stopDirection, -1, y)
+            if sweep <= 180:
+                low, high = max(startLow, stopLow), min(startHigh, stopHigh)
+                if sweep == 0:
+                    # The start and stop are the same line, so keep only the half of it that the start points along.
+                    alongLow, alongHigh = _arcRowRange((startDirection[1], -startDirection[0]), 1, y)
+                    low, high = max(low, alongLow), min(high, alongHigh)
+                insides = ((low, high),)
+            elif startLow <= stopLow:
+                insides = ((startLow, startHigh), (stopLow, stopHigh))
+            else:
+                insides = ((stopLow, stopHigh), (startLow, startHigh))
+            if len(insides) == 2 and insides[0][1] + 1 >= insides[1][0]:
+                insides = ((insides[0][0], max(insides[0][1], insides[1][1])),)
+
+        rowy = rowOffset + centery
+        for runStart, runEnd in runs:
+            for insideLow, insideHigh in insides:
+                xStart, xEnd = max(runStart, insideLow, clipLow), min(runEnd, insideHigh, clipHigh)
+                if xStart <= xEnd:
+                    yield (rowy, xStart + centerx, xEnd + centerx)
+
+
+def _arcRowRange(direction, sign, y):
+    # Returns the (low, high) range of the x on row y (with y going up) where
+    # `sign` times _arcSide() is at least 0. One end of the range is infinite.
+    # The range's other end is calculated, then moved to the exact point
+    # where _arcSide() changes sign.
+    dx, dy = direction
+    dxy = dx * y # The sides are calculated with the same formula as _arcSide(), so that they match it exactly.
+    if dy == 0:
+        return (-float('inf'), float('inf')) if sign * dxy >= 0 else (float('inf'), -float('inf'))
+    boundary = dxy / float(dy)
+    if sign * dy < 0:
+        # The points to the right of the boundary are on the side.
+        x = int(math.ceil(boundary))
+        while sign * (dxy - dy * (x - 1)) >= 0:
+            x -= 1
+        while sign * (dxy - dy * x) < 0:
+            x += 1
+        return (x, float('inf'))
+    x = int(math.floor(boundary))
+    while sign * (dxy - dy * (x + 1)) >= 0:
+        x += 1
+    while sign * (dxy - dy * x) < 0:
+        x -= 1
+    return (-float('inf'), x)
+
+
+def arcVertices(centerx, centery, radius, startAngle, stopAngle, numVertices=None):
+    """
+    Returns a generator that produces the (x, y) points of the vertices of a
+    series of lines that follow the arc from `startAngle` to `stopAngle`,
+    going counterclockwise (see `arc()`). The first and last vertices are the
+    ends of the arc. Passing the vertices to `lines()` draws the lines.
+
+    If `numVertices` isn't given, enough vertices are used that the lines are
+    never more than half a point away from the arc. The vertices are rounded
+    to the nearest ints.
+
+    >>> list(arcVertices(0, 0, 10, 0, 90, numVertices=3))
+    [(10, 0), (7, -7), (0, -10)]
+    >>> list(arcVertices(0, 0, 10, 90, 0, numVertices=4))
+    [(0, -10), (-10, 0), (0, 10), (10, 0)]
+    """
 
-def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness=1):
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    _checkForIntOrFloat(startAngle)
+    _checkForIntOrFloat(stopAngle)
+    startAngle, sweep = _arcSweep(startAngle, stopAngle)
+    if numVertices is None:
+        # A chord's farthest distance from the curve is radius * (1 - cos(angle / 2)).
+        numSegments = 1 if radius <= 1 else int(math.ceil(math.radians(sweep) / (2 * math.acos(1 - 0.5 / radius))))
+        numVertices = max(2, numSegments + 1)
+    _checkForIntOrFloat(numVertices, minVal=2)
+
+    numVertices = int(numVertices)
+    for i in range(numVertices):
+        cos, sin = _cosSin(startAngle + sweep * i / float(numVertices - 1))
+        yield (int(round(centerx + radius * cos)), int(round(centery - radius * sin)))
+
+
+def star(centerx, centery, radius, points=5, rotationDegrees=0, innerRadius=None, filled=False, thickness=1, clip=None):
+    """
+    Returns a generator that produces the (x, y) points of the outline of a
+    star with `points` points, centered on `centerx` and `centery`. The
+    points of the star are `radius` away from its center, and the corners
+    between them are `innerRadius` away (see `starVertices()`).
+
+    The star has a point at the top, and the `rotationDegrees` argument will
+    rotate it counterclockwise.
+
+    If `filled` is `True`, the interior points are also produced. Filled
+    stars are scan converted with `fillSpans()`, so their points are produced
+    row by row, from top to bottom. Otherwise, the `thickness` and `clip`
+    arguments are the same as for `lines()`.
+
+    >>> drawPoints(star(0, 0, 8))
+    ,,,,,,,,O,,,,,,,,
+    ,,,,,,,,O,,,,,,,,
+    ,,,,,,,O,O,,,,,,,
+    ,,,,,,,O,O,,,,,,,
+    ,,,,,,,O,O,,,,,,,
+    ,,,,,,O,,,O,,,,,,
+    OOOOOOO,,,OOOOOOO
+    ,OO,,,,,,,,,,,OO,
+    ,,,OO,,,,,,,OO,,,
+    ,,,,,O,,,,,O,,,,,
+    ,,,,,O,,,,,O,,,,,
+    ,,,,O,,,O,,,O,,,,
+    ,,,,O,OO,OO,O,,,,
+    ,,,OOO,,,,,OO,,,,
+    ,,,O,,,,,,,,,O,,,
+    >>> drawPoints(star(0, 0, 6, filled=True))
+    ,,,,,,O,,,,,,
+    ,,,,,,O,,,,,,
+    ,,,,,,O,,,,,,
+    ,,,,,OOO,,,,,
+    OOOOOOOOOOOOO
+    ,OOOOOOOOOOO,
+    ,,,OOOOOOOO,,
+    ,,,,OOOOO,,,,
+    ,,,,OOOOO,,,,
+    ,,,OOO,OOO,,,
+    ,,,OO,,,,O,,,
+    ,,O,,,,,,,O,,
+    """
+    if filled:
+        # Scan convert the star instead of flood filling its outline.
+        return spansToPoints(starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius, filled=True, clip=clip))
+    vertices = list(starVertices(centerx, centery, radius, points, rotationDegrees, innerRadius))
+    return lines(vertices, closed=True, thickness=thickness, clip=clip)
+
+
+def starSpans(centerx, centery, radius, points=5, rotationDegrees=0, innerRadius=None, filled=False, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans of
+    the same star that `star()` produces. Each span covers the points from
+    `xStart` to `xEnd`, inclusive. The spans are produced from top to bottom,
+    and from left to right within each row.
+
+    Stars drawn as markers are usually small and come in only a few kinds, so
+    the spans of stars with a radius of at most `STAR_SPANS_CACHE_MAX_RADIUS`
+    are worked out once around (0, 0), cached, and then only moved to each
+    star's center. At most `STAR_SPANS_CACHE_SIZE` (as it was when
+    pybresenham was imported) of them are kept, discarding the least recently
+    used ones.
+
+    >>> list(starSpans(0, 0, 4, points=6, filled=True))
+    [(-4, 0, 0), (-3, 0, 0), (-2, -3, 3), (-1, -3, 3), (0, -2, 2), (1, -2, 2), (2, -3, 3), (3, -1, 1), (4, 0, 0)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    _checkForIntOrFloat(rotationDegrees)
+    _checkForIntOrFloat(points, minVal=3)
+    if innerRadius is not None:
+        _checkForIntOrFloat(innerRadius, minVal=0)
+    clip = _checkClip(clip)
+
+    if radius > STAR_SPANS_CACHE_MAX_RADIUS:
+        vertices = list(starVertices(centerx, centery, radius, points, rotationDegrees, innerRadius))
+        if filled:
+            return fillSpans(vertices, clip=clip)
+        return iter(pointsToSpans(lines(vertices, closed=True, clip=clip)))
+
+    # starVertices() rounds the vertices around an int center, so a star's spans are the same wherever it's drawn.
+    spans = _starSpansTable(radius, int(points), rotationDegrees, innerRadius, bool(filled))
+    return _movedStarSpans(spans, int(centerx), int(centery), clip)
+
+
+@functools.lru_cache(maxsize=STAR_SPANS_CACHE_SIZE)
+def _starSpansTable(radius, points, rotationDegrees, innerRadius, filled):
+    # Returns the spans of a star centered on (0, 0), which starSpans() moves to the star's center.
+    vertices = list(starVertices(0, 0, radius, points, rotationDegrees, innerRadius))
+    if filled:
+        return tuple(fillSpans(vertices))
+    return tuple(pointsToSpans(lines(vertices, closed=True)))
+
+
+def _movedStarSpans(spans, movex, movey, clip):
+    # Yields the cached spans of a star moved over by `movex` and `movey`, and clipped to `clip`.
+    if clip is None:
+        for y, xStart, xEnd in spans:
+            yield (y + movey, xStart + movex, xEnd + movex)
+        return
+
+    clipLeft, clipTop, clipRight, clipBottom = clip[0] - movex, clip[1] - movey, clip[2] - movex, clip[3] - movey
+    for y, xStart, xEnd in spans:
+        if y < clipTop:
+            continue
+        if y > clipBottom:
+            return
+        xStart, xEnd = max(xStart, clipLeft), min(xEnd, clipRight)
+        if xStart <= xEnd:
+            yield (y + movey, xStart + movex, xEnd + movex)
+
+
+def starSpansCacheInfo():
+    """
+    Returns the hits, misses, maxsize, and currsize statistics of the cache of
+    star spans used by `starSpans()`, and so by filled `star()` and
+    `drawStar()`. The spans are keyed by the star's radius, points, rotation,
+    inner radius, and whether it's filled, but not by its center.
+
+    >>> clearStarSpansCache()
+    >>> spans = list(starSpans(10, 10, 8)) + list(starSpans(50, 20, 8))
+    >>> starSpansCacheInfo()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+    return _starSpansTable.cache_info()
+
+
+def clearStarSpansCache():
+    """Empties the cache of star spans used by `starSpans()` and resets its statistics."""
+    _starSpansTable.cache_clear()
+
+
+def starVertices(centerx, centery, radius, points=5, rotationDegrees=0, innerRadius=None):
+    """
+    Returns a generator that produces the (x, y) points of the vertices of a
+    star, going counterclockwise from the point at the top. The vertices
+    alternate between the star's points, which are `radius` away from the
+    center, and the corners between them, which are `innerRadius` away.
+
+    If `innerRadius` isn't given, the corners are where the lines between
+    every other point would cross, which gives the classic five-pointed star.
+    Stars with fewer than five points have no such crossings, so their
+    `innerRadius` is half of `radius` instead.
+
+    The vertices' directions are the same as the vertices of a regular
+    polygon with twice as many sides, so they come from the same cache of
+    vertex tables as `polygonVertices()`, and drawing many stars of the same
+    kind only scales and moves one table. The center is truncated to ints and
+    the vertices' offsets from it are rounded to the nearest ints, so a star
+    has the same shape wherever it's drawn.
+
+    >>> list(starVertices(10, 10, 8))
+    [(10, 2), (8, 8), (2, 8), (7, 11), (5, 16), (10, 13), (15, 16), (13, 11), (18, 8), (12, 8)]
+    >>> list(starVertices(0, 0, 10, points=4, innerRadius=3))
+    [(0, -10), (-2, -2), (-10, 0), (-2, 2), (0, 10), (2, 2), (10, 0), (2, -2)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(centerx)
+    _checkForIntOrFloat(centery)
+    _checkForIntOrFloat(radius, minVal=0)
+    _checkForIntOrFloat(rotationDegrees)
+    _checkForIntOrFloat(points, minVal=3)
+    points = int(points)
+    if innerRadius is None:
+        innerRadius = radius * math.cos(2 * math.pi / points) / math.cos(math.pi / points) if points >= 5 else radius / 2.0
+    _checkForIntOrFloat(innerRadius, minVal=0)
+    centerx, centery = int(centerx), int(centery)
+
+    # The polygon table starts half a side before the top, so rotate it by half a side to put the first vertex at the top.
+    table = _unitPolygonTable(points * 2, rotationDegrees + 90.0 / points)
+    for i in range(0, points * 2, 2):
+        cos, sin = table[i]
+        yield (centerx + int(round(cos * radius)), centery - int(round(sin * radius)))
+        cos, sin = table[i + 1]
+        yield (centerx + int(round(cos * innerRadius)), centery - int(round(sin * innerRadius)))
+
+
+def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness=1, clip=None):
     """
     Returns a generator that produces (x, y) tuples for a grid.
 
@@ -832,6 +3230,9 @@ def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thi
 
     The height of the grid is `(numBoxesHeight * boxheight) + (thickness * (numBoxesHeight + 1))`.
 
+    If `clip` is a `(left, top, right, bottom)` tuple, only the points inside
+    that rectangle are produced. The grid lines outside of it are skipped,
+    and the ones that cross it are cut to fit inside of it.
 
     >>> list(grid(0, 0, 3, 2, 5, 4))
     [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (12, 0), (13, 0), (14, 0), (15, 0), (16, 0), (17, 0), (18, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (12, 5), (13, 5), (14, 5), (15, 5), (16, 5), (17, 5), (18, 5), (0, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (12, 10), (13, 10), (14, 10), (15, 10), (16, 10), (17, 10), (18, 10), (0, 1), (0, 2), (0, 3), (0, 4), (0, 6), (0, 7), (0, 8), (0, 9), (6, 1), (6, 2), (6, 3), (6, 4), (6, 6), (6, 7), (6, 8), (6, 9), (12, 1), (12, 2), (12, 3), (12, 4), (12, 6), (12, 7), (12, 8), (12, 9), (18, 1), (18, 2), (18, 3), (18, 4), (18, 6), (18, 7), (18, 8), (18, 9)]
@@ -890,7 +3291,20 @@ def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thi
         raise PyBresenhamException('boxHeight must be 1 or greater')
     if thickness < 1:
         raise PyBresenhamException('thickness must be 1 or greater')
+    clip = _checkClip(clip)
+
+    gridWidth = numBoxesWide * boxWidth + (thickness * (numBoxesWide + 1))
+    gridHeight = numBoxesHigh * boxHeight + (thickness * (numBoxesHigh + 1))
 
+    # The part of the grid that is inside the clip rectangle, relative to the
+    # grid's top left corner. Lines outside of it are skipped, and lines that
+    # cross it only produce their points inside of it.
+    clipLeft, clipTop, clipRight, clipBottom = 0, 0, gridWidth - 1, gridHeight - 1
+    if clip is not None:
+        clipLeft = max(clipLeft, int(math.ceil(clip[0] - gridLeft)))
+        clipTop = max(clipTop, int(math.ceil(clip[1] - gridTop)))
+        clipRight = min(clipRight, int(math.floor(clip[2] - gridLeft)))
+        clipBottom = min(clipBottom, int(math.floor(clip[3] - gridTop)))
 
     # Record the y coordinates so we don't repeat the points at the intersections
     # of the grid.
@@ -912,7 +3326,9 @@ def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thi
         for thicknessIndex in range(thickness): # thicknessIndex isn't a great name, but each "grid row" can be multiple points tall if thickness > 1
             y = (boxHeight * gridRow) + (thickness * gridRow) + thicknessIndex
             intersectiony.add(y)
-            for x in range(numBoxesWide * boxWidth + (thickness * (numBoxesWide + 1))):
+            if not clipTop <= y <= clipBottom:
+                continue
+            for x in range(clipLeft, clipRight + 1):
                 yield (x + gridLeft, y + gridTop)
 
     """Generate the points for the vertical lines in between the horizontal lines of the grid.
@@ -930,7 +3346,9 @@ def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thi
     for gridColumn in range(numBoxesWide + 1):
         for thicknessIndex in range(thickness): # thicknessIndex isn't a great name, but each "grid row" can be multiple points tall if thickness > 1
             x = (boxWidth * gridColumn) + (thickness * gridColumn) + thicknessIndex
-            for y in range(numBoxesHigh * boxHeight + (thickness * (numBoxesHigh + 1))):
+            if not clipLeft <= x <= clipRight:
+                continue
+            for y in range(clipTop, clipBottom + 1):
 
                 # Additionally, we don't want to yield xy points we've yielded before.
                 """ i.e. These would be the points at the intersections of the grid,
@@ -948,6 +3366,210 @@ def grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thi
                 if y not in intersectiony:
                     yield (x + gridLeft, y + gridTop)
 
+
+def gridSpans(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness=1, clip=None):
+    """
+    Returns a generator that produces the (y, xStart, xEnd) horizontal spans
+    of the same grid that `grid()` produces. Each span covers the points from
+    `xStart` to `xEnd`, inclusive. The spans are produced from top to bottom,
+    and from left to right within each row.
+
+    If `clip` is a `(left, top, right, bottom)` tuple, the spans are cut to
+    fit inside that rectangle, and the rows and grid lines outside of it are
+    skipped.
+
+    >>> list(gridSpans(0, 0, 2, 1, 3, 2))
+    [(0, 0, 8), (1, 0, 0), (1, 4, 4), (1, 8, 8), (2, 0, 0), (2, 4, 4), (2, 8, 8), (3, 0, 8)]
+    """
+
+    # Validate arguments.
+    _checkForIntOrFloat(gridLeft)
+    _checkForIntOrFloat(gridTop)
+    _checkForIntOrFloat(numBoxesWide)
+    _checkForIntOrFloat(numBoxesHigh)
+    _checkForIntOrFloat(boxWidth)
+    _checkForIntOrFloat(boxHeight)
+    _checkForIntOrFloat(thickness)
+
+    numBoxesWide = int(numBoxesWide)
+    numBoxesHigh = int(numBoxesHigh)
+    boxWidth = int(boxWidth)
+    boxHeight = int(boxHeight)
+    thickness = int(thickness)
+
+    if numBoxesWide < 1:
+        raise PyBresenhamException('numBoxesWide must be 1 or greater')
+    if numBoxesHigh < 1:
+        raise PyBresenhamException('numBoxesHigh must be 1 or greater')
+    if boxWidth < 1:
+        raise PyBresenhamException('boxWidth must be 1 or greater')
+    if boxHeight < 1:
+        raise PyBresenhamException('boxHeight must be 1 or greater')
+    if thickness < 1:
+        raise PyBresenhamException('thickness must be 1 or greater')
+    clip = _checkClip(clip)
+
+    gridWidth = numBoxesWide * boxWidth + (thickness * (numBoxesWide + 1))
+    gridHeight = numBoxesHigh * boxHeight + (thickness * (numBoxesHigh + 1))
+
+    # The part of the grid that is inside the clip rectangle, relative to the
+    # grid's top left corner, the same as in grid().
+    clipLeft, clipTop, clipRight, clipBottom = 0, 0, gridWidth - 1, gridHeight - 1
+    if clip is not None:
+        clipLeft = max(clipLeft, int(math.ceil(clip[0] - gridLeft)))
+        clipTop = max(clipTop, int(math.ceil(clip[1] - gridTop)))
+        clipRight = min(clipRight, int(math.floor(clip[2] - gridLeft)))
+        clipBottom = min(clipBottom, int(math.floor(clip[3] - gridTop)))
+        if clipLeft > clipRight:
+            return
+
+    # Only the vertical lines that reach into the clip rectangle are produced.
+    columnWidth = boxWidth + thickness
+    firstColumn = max(0, -((thickness - 1 - clipLeft) // columnWidth))
+    lastColumn = min(numBoxesWide, clipRight // columnWidth)
+
+    for y in range(clipTop, clipBottom + 1):
+        if y % (boxHeight + thickness) < thickness:
+            # This row is part of a horizontal line of the grid.
+            yield (y + gridTop, clipLeft + gridLeft, clipRight + gridLeft)
+        else:
+            # This row only has the vertical lines of the grid.
+            for gridColumn in range(firstColumn, lastColumn + 1):
+                x = columnWidth * gridColumn
+                xStart, xEnd = max(x, clipLeft), min(x + thickness - 1, clipRight)
+                yield (y + gridTop, xStart + gridLeft, xEnd + gridLeft)
+
+
+def bezier(controlPoints, maxError=0.5, thickness=1, endcap=None, clip=None):
+    """
+    Returns a generator that produces the points of a quadratic or cubic Bezier
+    curve. `controlPoints` is a sequence of three (quadratic) or four (cubic)
+    (x, y) tuples. The curve starts at the first control point, ends at the
+    last one, and is pulled towards the ones in between.
+
+    The curve is drawn as the lines connecting the vertices from
+    `bezierVertices()`, so it's never more than `maxError` points (plus the
+    rounding of the vertices to ints) from the true curve. Flat parts of the
+    curve get few vertices and sharp bends get many. The points where the lines
+    join are produced only once.
+
+    The `thickness`, `endcap`, and `clip` arguments are the same as for
+    `lines()`.
+
+    >>> drawPoints(bezier([(0, 0), (6, 10), (12, 0)]))
+    O,,,,,,,,,,,O
+    ,O,,,,,,,,,O,
+    ,O,,,,,,,,,O,
+    ,,O,,,,,,,O,,
+    ,,,OO,,,OO,,,
+    ,,,,,OOO,,,,,
+    >>> drawPoints(bezier([(0, 0), (12, 0), (0, 6), (12, 6)]))
+    OOOOO,,,,,,,,
+    ,,,,,O,,,,,,,
+    ,,,,,O,,,,,,,
+    ,,,,,,O,,,,,,
+    ,,,,,,O,,,,,,
+    ,,,,,,,OO,,,,
+    ,,,,,,,,,OOOO
+    """
+    return lines(bezierVertices(controlPoints, maxError), thickness=thickness, endcap=endcap, clip=clip)
+
+
+def bezierVertices(controlPoints, maxError=0.5):
+    """
+    Returns a generator that produces the (x, y) vertices of a series of lines
+    that follow the quadratic or cubic Bezier curve given by `controlPoints`
+    (see `bezier()`). Passing the vertices to `lines()` draws the curve.
+
+    The curve is split in half until each piece is close enough to the line
+    between its ends, so the lines through the vertices (before they're
+    rounded to the nearest ints) are never more than `maxError` points away
+    from the curve. The first and last vertices are the first and last control
+    points, and the vertices in between that round to the same point as the
+    one before them are skipped.
+
+    >>> list(bezierVertices([(0, 0), (6, 10), (12, 0)]))
+    [(0, 0), (3, 4), (6, 5), (9, 4), (12, 0)]
+    >>> list(bezierVertices([(0, 0), (6, 10), (12, 0)], maxError=2))
+    [(0, 0), (6, 5), (12, 0)]
+    """
+
+    # Validate arguments.
+    try:
+        controlPoints = [(point[0], point[1]) for point in controlPoints]
+        for x, y in controlPoints:
+            _checkForIntOrFloat(x)
+            _checkForIntOrFloat(y)
+    except:
+        raise PyBresenhamException('controlPoints argument must be a sequence of (x, y) tuples of int/float values')
+    if len(controlPoints) not in (3, 4):
+        raise PyBresenhamException('controlPoints argument must have three (quadratic) or four (cubic) points')
+    _checkForIntOrFloat(maxError)
+    if maxError <= 0:
+        raise PyBresenhamException('maxError must be greater than 0')
+
+    if len(controlPoints) == 3:
+        # Every quadratic curve is also a cubic curve with these control points.
+        (x0, y0), (x1, y1), (x3, y3) = controlPoints
+        x1, y1, x2, y2 = x0 + (x1 - x0) * 2.0 / 3, y0 + (y1 - y0) * 2.0 / 3, x3 + (x1 - x3) * 2.0 / 3, y3 + (y1 - y3) * 2.0 / 3
+    else:
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = controlPoints
+    return _cubicBezierVertices(x0, y0, x1, y1, x2, y2, x3, y3, maxError)
+
+
+def _cubicBezierVertices(x0, y0, x1, y1, x2, y2, x3, y3, maxError):
+    # A cubic curve is never more than sqrt(max(ux**2, vx**2) + max(uy**2,
+    # vy**2)) / 4 away from the line between its ends, where u = 3*p1 - 2*p0 - p3
+    # and v = 3*p2 - p0 - 2*p3. Each half of a split curve has a quarter of
+    # that distance, so the splitting stops after log4(distance / maxError)
+    # levels. Splitting also stops after 16 levels (65536 lines), in case the
+    # control points are extremely far apart.
+    flatLimit = 16 * maxError * maxError
+    prevx, prevy = int(round(x0)), int(round(y0))
+    yield (prevx, prevy)
+    numVertices = 1
+
+    curves = [(x0, y0, x1, y1, x2, y2, x3, y3, 0)] # The pieces still to be drawn, with the next one last.
+    while curves:
+        x0, y0, x1, y1, x2, y2, x3, y3, depth = curves.pop()
+        ux, uy = 3 * x1 - 2 * x0 - x3, 3 * y1 - 2 * y0 - y3
+        vx, vy = 3 * x2 - x0 - 2 * x3, 3 * y2 - y0 - 2 * y3
+        if depth < 16 and max(ux * ux, vx * vx) + max(uy * uy, vy * vy) > flatLimit:
+            # Split the curve in half at its midpoint with de Casteljau's algorithm.
+            ax, ay = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+            bx, by = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+            cx, cy = (x2 + x3) * 0.5, (y2 + y3) * 0.5
+            abx, aby = (ax + bx) * 0.5, (ay + by) * 0.5
+            bcx, bcy = (bx + cx) * 0.5, (by + cy) * 0.5
+            midx, midy = (abx + bcx) * 0.5, (aby + bcy) * 0.5
+            depth += 1
+            curves.append((midx, midy, bcx, bcy, cx, cy, x3, y3, depth))
+            curves.append((x0, y0, ax, ay, abx, aby, midx, midy, depth))
+            continue
+
+        x, y = int(round(x3)), int(round(y3))
+        if x != prevx or y != prevy or (not curves and numVertices == 1):
+            # The last vertex is produced even if it's the same as the first, so that there are always two.
+            yield (x, y)
+            prevx, prevy = x, y
+            numVertices += 1
+
+
+def bezierSegments(controlPoints, maxError=0.5):
+    """
+    Returns a generator that produces the (x1, y1, x2, y2) line segments
+    between the vertices that `bezierVertices()` produces for the same
+    arguments.
+
+    >>> list(bezierSegments([(0, 0), (6, 10), (12, 0)]))
+    [(0, 0, 3, 4), (3, 4, 6, 5), (6, 5, 9, 4), (9, 4, 12, 0)]
+    """
+    vertices = bezierVertices(controlPoints, maxError)
+    prevx, prevy = next(vertices)
+    for x, y in vertices:
+        yield (prevx, prevy, x, y)
+        prevx, prevy = x, y
+
 '''
 def gridInterior(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness=1):
     raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
@@ -982,21 +3604,243 @@ def neckerSegments(left, top, width, height, depth, wireframe=True):
     raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
 
-def bezier():
+def roundedBox(left, top, width, height, radius, rotation=0, filled=False, thickness=1):
     raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
 
 
-def bezierSegments():
+def roundedBoxSegments(left, top, width, height, radius):
     raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+'''
 
+class _BufferTarget(object):
+    """
+    Writes points and spans directly into a caller-owned 2D buffer, clipping
+    them to the buffer's bounds. This is used by the draw*() functions.
+
+    The buffer can be a 2D NumPy array or 2D memoryview, in which case its
+    shape is used. Otherwise the buffer is a flat bytearray, array.array, 1D
+    memoryview, or 1D NumPy array, and the `width` of the image must be given.
+    The `stride` (the number of items from the start of one row to the start
+    of the next) defaults to the width, and the `height` defaults to as many
+    rows as fit in the buffer.
+    """
 
-def roundedBox(left, top, width, height, radius, rotation=0, filled=False, thickness=1):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
+    def __init__(self, buffer, value, width=None, height=None, stride=None):
+        self.buffer = buffer
+        self.value = value
+        self.isNumpy = hasattr(buffer, 'dtype')
+        shape = getattr(buffer, 'shape', None)
+
+        if shape is not None and len(shape) == 2:
+            if width is not None or height is not None or stride is not None:
+                raise PyBresenhamException('width, height, and stride must not be given for 2D buffers')
+            height, width = shape
+            if not self.isNumpy:
+                # Flatten 2D memoryviews, since they don't support slice assignment.
+                try:
+                    self.buffer = buffer.cast(buffer.format)
+                except TypeError:
+                    raise PyBresenhamException('2D memoryview buffers must be C-contiguous')
+            stride = width
+        else:
+            if width is None:
+                raise PyBresenhamException('width must be given for one-dimensional buffers')
+            _checkForIntOrFloat(width, minVal=0)
+            width = int(width)
+            if stride is None:
+                stride = width
+            _checkForIntOrFloat(stride, minVal=width)
+            stride = int(stride)
+            if height is None:
+                height = (len(buffer) - width) // stride + 1 if stride else 0
+            _checkForIntOrFloat(height, minVal=0)
+            height = int(height)
+            if height > 0 and stride * (height - 1) + width > len(buffer):
+                raise PyBresenhamException('buffer is too small for the given width, height, and stride')
+
+        self.width, self.height, self.stride = width, height, stride
+        self.pointsWritten = 0
+        # Passed as the clip argument of the shape functions, so that they skip the parts of huge shapes outside of the buffer.
+        self.clip = (0, 0, width - 1, height - 1)
+
+        # Non-NumPy buffers need a sequence of the same type for slice assignment.
+        if not self.isNumpy:
+            if isinstance(self.buffer, memoryview):
+                typecode = self.buffer.format
+            else:
+                typecode = getattr(self.buffer, 'typecode', 'B') # bytearrays don't have a typecode
+            try:
+                self.fill = array.array(typecode, [value])
+            except (OverflowError, TypeError, ValueError):
+                raise PyBresenhamException('value %r cannot be stored in this buffer' % (value,))
+
+    def point(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if self.isNumpy and self.buffer.ndim == 2:
+                self.buffer[y, x] = self.value
+            else:
+                self.buffer[y * self.stride + x] = self.value
+            self.pointsWritten += 1
+
+    def span(self, y, xStart, xEnd):
+        if not (0 <= y < self.height):
+            return
+        xStart = max(xStart, 0)
+        xEnd = min(xEnd, self.width - 1)
+        if xStart > xEnd:
+            return
+        if self.isNumpy:
+            if self.buffer.ndim == 2:
+                self.buffer[y, xStart:xEnd + 1] = self.value
+            else:
+                self.buffer[y * self.stride + xStart:y * self.stride + xEnd + 1] = self.value
+        else:
+            self.buffer[y * self.stride + xStart:y * self.stride + xEnd + 1] = self.fill * (xEnd - xStart + 1)
+        self.pointsWritten += xEnd - xStart + 1
+
+    def drawPoints(self, points):
+        for x, y in points:
+            self.point(x, y)
+        return self.pointsWritten
+
+    def drawSpans(self, spans):
+        for y, xStart, xEnd in spans:
+            self.span(y, xStart, xEnd)
+        return self.pointsWritten
+
+    def drawRuns(self, runs, isVertical):
+        # Draws the (x, y, length) runs from lineRuns().
+        if isVertical:
+            for x, y, length in runs:
+                for y in range(y, y + length):
+                    self.point(x, y)
+        else:
+            for x, y, length in runs:
+                self.span(y, x, x + length - 1)
+        return self.pointsWritten
 
 
-def roundedBoxSegments(left, top, width, height, radius):
-    raise NotImplementedError('The pybresenham module is under development and the filled, thickness, and endcap parameters are not implemented. You can contribute at https://github.com/asweigart/pybresenham')
-'''
+def drawLine(buffer, x1, y1, x2, y2, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of `line(x1, y1, x2, y2)`,
+    instead of producing (x, y) tuples. Points outside of the buffer are skipped.
+    Like the other draw*() functions, the shape is clipped to the buffer, so
+    the parts of a huge shape outside of the buffer cost nothing.
+    Returns the number of points that were written.
+
+    `buffer` can be a 2D NumPy array or 2D memoryview. It can also be a flat
+    bytearray, array.array, 1D memoryview, or 1D NumPy array, in which case
+    the `width` of the image must be given. `stride` is the number of items
+    from the start of one row to the start of the next, and defaults to
+    `width`. `height` defaults to as many rows as fit in the buffer.
+
+    >>> image = bytearray(b',' * 15)
+    >>> drawLine(image, 0, 0, 4, 2, value=ord('O'), width=5)
+    5
+    >>> for y in range(3): print(image[y * 5:y * 5 + 5].decode())
+    OO,,,
+    ,,OO,
+    ,,,,O
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    runs = lineRuns(x1, y1, x2, y2)
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    if not (0 <= min(x1, x2) and max(x1, x2) < target.width and 0 <= min(y1, y2) and max(y1, y2) < target.height):
+        # Lines that reach outside of the buffer skip straight to their points inside of it.
+        return target.drawPoints(line(x1, y1, x2, y2, clip=target.clip))
+    return target.drawRuns(runs, abs(y2 - y1) > abs(x2 - x1))
+
+
+def drawLines(buffer, points, closed=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of `lines(points, closed)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawPoints(lines(points, closed, clip=target.clip))
+
+
+def drawCircle(buffer, centerx, centery, radius, filled=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of `circle(centerx, centery, radius, filled)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(circleSpans(centerx, centery, radius, filled, clip=target.clip))
+
+
+def drawRectangle(buffer, left, top, rectWidth, rectHeight, filled=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of
+    `rectangle(left, top, rectWidth, rectHeight, filled)`. Each row of the
+    rectangle is written with a single slice assignment.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+
+    >>> image = bytearray(b',' * 20)
+    >>> drawRectangle(image, 1, 1, 3, 2, filled=True, value=ord('O'), width=5)
+    6
+    >>> for y in range(4): print(image[y * 5:y * 5 + 5].decode())
+    ,,,,,
+    ,OOO,
+    ,OOO,
+    ,,,,,
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(rectangleSpans(left, top, rectWidth, rectHeight, filled, clip=target.clip))
+
+
+def drawDiamond(buffer, left, top, radius, filled=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of `diamond(left, top, radius, filled)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(diamondSpans(left, top, radius, filled, clip=target.clip))
+
+
+def drawPolygon(buffer, centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of
+    `polygon(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(polygonSpans(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled, clip=target.clip))
+
+
+def drawStar(buffer, centerx, centery, radius, points=5, rotationDegrees=0, innerRadius=None, filled=False, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of
+    `star(centerx, centery, radius, points, rotationDegrees, innerRadius, filled)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius, filled, clip=target.clip))
+
+
+def drawGrid(buffer, gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness=1, value=1, width=None, height=None, stride=None):
+    """
+    Writes `value` directly into `buffer` at the points of
+    `grid(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness)`.
+    Returns the number of points that were written.
+
+    See `drawLine()` for a description of the `buffer`, `width`, `height`, and `stride` parameters.
+    """
+    target = _BufferTarget(buffer, value, width, height, stride)
+    return target.drawSpans(gridSpans(gridLeft, gridTop, numBoxesWide, numBoxesHigh, boxWidth, boxHeight, thickness, clip=target.clip))
+
 
 def drawPoints(points, bg=','):
     """A small debug function that takes an iterable of (x, y) integer tuples
@@ -1036,4 +3880,5 @@ def drawPoints(points, bg=','):
 
 
 if __name__ == '__main__':
+    import doctest
     print(doctest.testmod())
\ No newline at end of file
@@ -0,0 +1,426 @@
+"""
+The NumPy kernels of PyBresenham, which draw whole shapes into NumPy arrays
+at once. These functions are available from the `pybresenham` package, but
+this module (and NumPy) is only imported the first time one of them is used.
+"""
+
+from pybresenham import EVEN_ODD, PyBresenhamException, _checkForIntOrFloat, _circleSpans, _clipLineSteps, _fillSpans, _importNumpy
+
+
+def linesBatch(x1, y1, x2, y2):
+    """
+    Rasterizes many independent line segments at once. This function requires NumPy.
+
+    `x1`, `y1`, `x2`, and `y2` are equal-length sequences (or 1D NumPy arrays)
+    of segment endpoints, so that segment `i` goes from `x1[i]`, `y1[i]` to
+    `x2[i]`, `y2[i]`.
+
+    Returns a tuple of three NumPy int64 arrays: `(xs, ys, offsets)`. The points
+    of segment `i` are `xs[offsets[i]:offsets[i+1]]` and `ys[offsets[i]:offsets[i+1]]`,
+    in the same order that `line()` produces them. The points are identical
+    to the ones produced by calling `line()` on each segment.
+
+    >>> from pybresenham import line
+    >>> xs, ys, offsets = linesBatch([0, 5], [0, 5], [10, 0], [3, 0])
+    >>> list(zip(xs.tolist(), ys.tolist()))[offsets[0]:offsets[1]] == list(line(0, 0, 10, 3))
+    True
+    >>> list(zip(xs.tolist(), ys.tolist()))[offsets[1]:offsets[2]] == list(line(5, 5, 0, 0))
+    True
+    """
+
+    numpy = _importNumpy()
+
+    # Validate arguments, and convert floats to ints the same way int() does in line().
+    coords = []
+    for arg in (x1, y1, x2, y2):
+        arg = numpy.asarray(arg)
+        if arg.ndim != 1 or arg.dtype.kind not in 'iuf':
+            raise PyBresenhamException('x1, y1, x2, and y2 must be one-dimensional sequences of int or float values')
+        if arg.dtype.kind == 'f':
+            arg = numpy.trunc(arg)
+        coords.append(arg.astype(numpy.int64))
+    x1, y1, x2, y2 = coords
+    if not (len(x1) == len(y1) == len(x2) == len(y2)):
+        raise PyBresenhamException('x1, y1, x2, and y2 must all have the same length')
+    return _linesBatch(numpy, x1, y1, x2, y2)
+
+
+def _linesBatch(numpy, x1, y1, x2, y2, firstSteps=None, lastSteps=None):
+    # Returns the (xs, ys, offsets) of linesBatch() for int64 endpoint arrays.
+    # If they're given, only the points from step firstSteps[i] to step
+    # lastSteps[i] of segment i are produced, counting its first point as step 0.
+
+    # Each segment goes through the same steps as line(): swap the axes of
+    # steep segments, then put the endpoint with the lower x first.
+    isSteep = numpy.abs(y2 - y1) > numpy.abs(x2 - x1)
+    sx1, sy1 = numpy.where(isSteep, y1, x1), numpy.where(isSteep, x1, y1)
+    sx2, sy2 = numpy.where(isSteep, y2, x2), numpy.where(isSteep, x2, y2)
+    isReversed = sx1 > sx2
+    lowx, lowy = numpy.where(isReversed, sx2, sx1), numpy.where(isReversed, sy2, sy1)
+    highx, highy = numpy.where(isReversed, sx1, sx2), numpy.where(isReversed, sy1, sy2)
+
+    deltax = highx - lowx
+    deltay = numpy.abs(highy - lowy)
+    ystep = numpy.sign(highy - lowy)
+
+    # Every segment has one point per step along its major axis.
+    if firstSteps is None:
+        firstSteps, lastSteps = numpy.zeros(len(x1), dtype=numpy.int64), deltax
+    numSteps = lastSteps - firstSteps + 1
+    offsets = numpy.zeros(len(x1) + 1, dtype=numpy.int64)
+    numpy.cumsum(numSteps, out=offsets[1:])
+    segmentIndex = numpy.repeat(numpy.arange(len(x1)), numSteps)
+    step = firstSteps[segmentIndex] + numpy.arange(offsets[-1], dtype=numpy.int64) - offsets[:-1][segmentIndex]
+
+    deltax = deltax[segmentIndex]
+    deltay = deltay[segmentIndex]
+    isReversed = isReversed[segmentIndex]
+    error = deltax // 2 # the initial error term, same as int(deltax / 2) in line()
+    divisor = numpy.maximum(deltax, 1) # (zero-length segments only have step 0)
+
+    # Instead of looping, compute how many times the minor axis has moved
+    # before each step. line()'s forward loop moves when the error term drops
+    # below 0, while its reversed loop moves when it drops to 0 or below, so
+    # the two branches need slightly different formulas.
+    forwardMoves = numpy.maximum((step * deltay - error + deltax - 1) // divisor, 0)
+    reversedMoves = numpy.where(step == 0, 0, (step * deltay - error) // divisor + 1)
+    # (The minor axis moves at most once per step, which the reversed formula
+    # overshoots on two-point diagonal segments, where the error starts at 0.)
+    moves = numpy.minimum(numpy.where(isReversed, reversedMoves, forwardMoves), step)
+
+    ystep = ystep[segmentIndex]
+    major = numpy.where(isReversed, highx[segmentIndex] - step, lowx[segmentIndex] + step)
+    minor = numpy.where(isReversed, highy[segmentIndex] - ystep * moves, lowy[segmentIndex] + ystep * moves)
+
+    isSteep = isSteep[segmentIndex]
+    xs = numpy.where(isSteep, minor, major)
+    ys = numpy.where(isSteep, major, minor)
+    return xs, ys, offsets
+
+
+def lineArray(x1, y1, x2, y2):
+    """
+    Returns the points of `line(x1, y1, x2, y2)` as an N x 2 NumPy int64
+    array, in the same order. This function requires NumPy.
+
+    The points are calculated with NumPy array operations instead of a
+    Python loop (see `linesBatch()`), so NumPy can release the GIL while it
+    calculates the points of a long line.
+
+    >>> lineArray(0, 0, 4, 2).tolist()
+    [[0, 0], [1, 0], [2, 1], [3, 1], [4, 2]]
+    """
+    numpy = _importNumpy()
+    _checkForIntOrFloat(x1)
+    _checkForIntOrFloat(y1)
+    _checkForIntOrFloat(x2)
+    _checkForIntOrFloat(y2)
+    xs, ys, offsets = linesBatch([int(x1)], [int(y1)], [int(x2)], [int(y2)])
+    return numpy.stack((xs, ys), axis=1)
+
+
+def rectangleArray(left, top, width, height, filled=False):
+    """
+    Returns the points of `rectangle(left, top, width, height, filled)` as an
+    N x 2 NumPy int64 array, in the same order. This function requires NumPy.
+
+    >>> rectangleArray(0, 0, 3, 2).tolist()
+    [[0, 0], [1, 0], [2, 0], [2, 1], [1, 1], [0, 1]]
+    """
+    numpy = _importNumpy()
+    _checkForIntOrFloat(left)
+    _checkForIntOrFloat(top)
+    _checkForIntOrFloat(width)
+    _checkForIntOrFloat(height)
+    left, top, width, height = int(left), int(top), int(width), int(height)
+    if width < 1 or height < 1:
+        raise PyBresenhamException('width and height must be positive integers')
+
+    if filled or width == 1 or height == 1:
+        xs = numpy.tile(numpy.arange(left, left + width, dtype=numpy.int64), height)
+        ys = numpy.repeat(numpy.arange(top, top + height, dtype=numpy.int64), width)
+    else:
+        # The sides are in the same order as rectangle(): top, right, bottom, and left.
+        right, bottom = left + width - 1, top + height - 1
+        xSides = (numpy.arange(left, right), numpy.full(height - 1, right), numpy.arange(right, left, -1), numpy.full(height - 1, left))
+        ySides = (numpy.full(width - 1, top), numpy.arange(top, bottom), numpy.full(width - 1, bottom), numpy.arange(bottom, top, -1))
+        xs = numpy.concatenate(xSides).astype(numpy.int64)
+        ys = numpy.concatenate(ySides).astype(numpy.int64)
+    return numpy.stack((xs, ys), axis=1)
+
+
+def diamondArray(left, top, radius, filled=False):
+    """
+    Returns the points of `diamond(left, top, radius, filled)` as an N x 2
+    NumPy int64 array, in the same order. This function requires NumPy.
+
+    >>> diamondArray(0, 0, 1).tolist()
+    [[2, 0], [1, 1], [3, 1], [2, 2]]
+    """
+    numpy = _importNumpy()
+    _checkForIntOrFloat(left)
+    _checkForIntOrFloat(top)
+    _checkForIntOrFloat(radius, minVal=0)
+    ys, xStarts, xEnds = _diamondSpanArrays(numpy, int(left), int(top), int(radius), filled)
+    xs, ys = _spanPointArrays(numpy, ys, xStarts, xEnds)
+    return numpy.stack((xs, ys), axis=1)
+
+
+def _diamondSpanArrays(numpy, left, top, radius, filled, clipTop=None, clipBottom=None):
+    # Returns the ys, xStarts, and xEnds arrays of diamondSpans(left, top, radius, filled).
+    # If clipTop and clipBottom are given, only the rows between them are included.
+    if clipTop is None:
+        rows = numpy.arange(radius * 2 + 1, dtype=numpy.int64)
+    else:
+        rows = numpy.arange(max(0, clipTop - top), min(radius * 2, clipBottom - top) + 1, dtype=numpy.int64)
+    distanceFromMiddle = numpy.abs(rows - radius)
+    leftxs = left + 1 + distanceFromMiddle
+    rightxs = left + 1 + radius * 2 - distanceFromMiddle
+    if filled:
+        return rows + top, leftxs, rightxs
+    # Every row has a left and right point, except the top and bottom rows where they're the same point.
+    hasTwoPoints = numpy.stack((numpy.ones(len(rows), dtype=bool), leftxs != rightxs), axis=1).ravel()
+    xs = numpy.stack((leftxs, rightxs), axis=1).ravel()[hasTwoPoints]
+    ys = numpy.repeat(rows + top, 2)[hasTwoPoints]
+    return ys, xs, xs
+
+
+def _spanPointArrays(numpy, ys, xStarts, xEnds):
+    # Returns the xs and ys arrays of every point in the spans given by the
+    # ys, xStarts, and xEnds arrays, in the same order as spansToPoints().
+    lengths = xEnds - xStarts + 1
+    spanIndex = numpy.repeat(numpy.arange(len(ys)), lengths)
+    spanStarts = numpy.cumsum(lengths) - lengths
+    xs = xStarts[spanIndex] + (numpy.arange(len(spanIndex), dtype=numpy.int64) - spanStarts[spanIndex])
+    return xs, ys[spanIndex]
+
+
+def floodFillArray(points, startx, starty, connectivity=4):
+    """
+    Returns the points of `floodFill(points, startx, starty, connectivity=connectivity)`
+    as an N x 2 NumPy int64 array, sorted by y and then x. This function requires NumPy.
+
+    `points` can be an iterable of (x, y) tuples or an N x 2 NumPy array.
+
+    Instead of filling one span at a time, the whole area is filled with
+    NumPy array operations: every run of open points that touches a filled
+    point is filled, first along the rows and then along the columns, until
+    the filled area stops growing. Each round is a handful of operations on
+    the whole bitmap, which NumPy runs without holding the GIL, and most
+    shapes only need a few rounds.
+
+    >>> from pybresenham import rectangle
+    >>> floodFillArray(list(rectangle(0, 0, 4, 3)), 1, 1).tolist()
+    [[0, 0], [1, 0], [2, 0], [3, 0], [0, 1], [1, 1], [2, 1], [3, 1], [0, 2], [1, 2], [2, 2], [3, 2]]
+    """
+    numpy = _importNumpy()
+    if connectivity not in (4, 8):
+        raise PyBresenhamException('connectivity argument must be 4 or 8')
+    try:
+        points = numpy.asarray(points if hasattr(points, 'shape') else list(points))
+        if points.ndim != 2 or points.shape[1] != 2 or points.dtype.kind not in 'iuf':
+            raise ValueError
+    except (TypeError, ValueError):
+        raise PyBresenhamException('points must only contains (x, y) numeric tuples')
+    if len(points) == 0:
+        raise PyBresenhamException('points argument must have at least one point')
+    _checkForIntOrFloat(startx)
+    _checkForIntOrFloat(starty)
+    startx, starty = int(startx), int(starty)
+
+    points = numpy.trunc(points).astype(numpy.int64) if points.dtype.kind == 'f' else points.astype(numpy.int64)
+    minx, miny = points.min(axis=0)
+    maxx, maxy = points.max(axis=0)
+    isBorder = numpy.zeros((maxy - miny + 1, maxx - minx + 1), dtype=bool)
+    isBorder[points[:, 1] - miny, points[:, 0] - minx] = True
+
+    # Like floodFill(), the fill never reaches the edges of the rectangle
+    # around the points. Since the edges are closed, the runs of open points
+    # in the flattened bitmap never wrap around from one row to the next.
+    isOpen = ~isBorder
+    isOpen[0, :] = isOpen[-1, :] = isOpen[:, 0] = isOpen[:, -1] = False
+    isFilled = numpy.zeros(isBorder.shape, dtype=bool)
+    if minx < startx < maxx and miny < starty < maxy and isOpen[starty - miny, startx - minx]:
+        isFilled[starty - miny, startx - minx] = True
+
+        # Number the runs of open points along the rows and along the columns.
+        # Every open point in a run has the same number.
+        rowRuns = numpy.cumsum(~isOpen.ravel()).reshape(isOpen.shape)
+        columnRuns = numpy.cumsum(~isOpen.T.ravel()).reshape(isOpen.T.shape).T
+        numFilled = 0
+        while True:
+            for runs in (rowRuns, columnRuns):
+                isRunFilled = numpy.zeros(runs.max() + 1, dtype=bool)
+                isRunFilled[runs[isFilled]] = True
+                isFilled = isRunFilled[runs] & isOpen
+            if connectivity == 8:
+                # Spread diagonally, to the open points that are diagonal to a filled point.
+                diagonal = numpy.zeros(isFilled.shape, dtype=bool)
+                diagonal[1:, 1:] |= isFilled[:-1, :-1]
+                diagonal[1:, :-1] |= isFilled[:-1, 1:]
+                diagonal[:-1, 1:] |= isFilled[1:, :-1]
+                diagonal[:-1, :-1] |= isFilled[1:, 1:]
+                isFilled |= diagonal & isOpen
+            newNumFilled = int(numpy.count_nonzero(isFilled))
+            if newNumFilled == numFilled:
+                break
+            numFilled = newNumFilled
+
+    ys, xs = numpy.nonzero(isFilled | isBorder)
+    return numpy.stack((xs.astype(numpy.int64) + minx, ys.astype(numpy.int64) + miny), axis=1)
+
+
+def rasterize(scene, image=None):
+    """
+    Draws the shapes of a `Scene` into a NumPy array with NumPy array
+    operations, and returns the array. This function requires NumPy.
+
+    `image` is a 2D NumPy array with `scene.height` rows and `scene.width`
+    columns to draw into. If it isn't given, a new uint8 array of zeros is
+    used, and the result is the same as `scene.render()`.
+
+    The points of lines, rectangles, and diamonds are calculated with NumPy
+    array operations, and the points of every shape are written into the
+    array with a single NumPy assignment. NumPy doesn't hold the GIL during
+    these operations, so several threads can rasterize at the same time
+    (see `rasterizeAsync()`). Consecutive line shapes with the same value
+    are rasterized together in one batch. Every shape is clipped to the
+    image before its points are calculated, so shapes that reach far off of
+    the image only cost as much as their visible parts.
+
+    >>> from pybresenham import Scene
+    >>> scene = Scene(5, 3)
+    >>> scene.line(0, 0, 4, 2, value=7)
+    >>> rasterize(scene).tolist()
+    [[7, 7, 0, 0, 0], [0, 0, 7, 7, 0], [0, 0, 0, 0, 7]]
+    """
+    numpy = _importNumpy()
+    width, height = scene.width, scene.height
+    if image is None:
+        image = numpy.zeros((height, width), dtype=numpy.uint8)
+    elif getattr(image, 'shape', None) != (height, width):
+        raise PyBresenhamException('image must be a 2D NumPy array with the same height and width as the scene')
+    clip = (0, 0, width - 1, height - 1)
+
+    # The line segments of consecutive line, lines, and polygon outline shapes with the same value.
+    segments = []
+    segmentsValue = None
+
+    for kind, arguments, value, (left, top, right, bottom) in scene.shapes:
+        if right < 0 or bottom < 0 or left >= width or top >= height:
+            continue # The shape is completely outside of the image.
+
+        if kind in ('line', 'lines', 'polygon') and not (kind == 'polygon' and arguments[1]):
+            if segments and value != segmentsValue:
+                _paintSegments(numpy, image, segments, segmentsValue)
+                segments = []
+            segmentsValue = value
+            if kind == 'line':
+                segments.append(arguments)
+            else:
+                points = arguments[0]
+                closed = kind == 'polygon' or arguments[1] # (A polygon's second argument is `filled`.)
+                segments.extend([points[i - 1] + points[i] for i in range(1, len(points))])
+                if closed:
+                    segments.append(points[-1] + points[0])
+            continue
+
+        # Draw the waiting line segments first, since this shape goes over them.
+        if segments:
+            _paintSegments(numpy, image, segments, segmentsValue)
+            segments = []
+
+        if kind == 'rectangle':
+            rectLeft, rectTop, rectWidth, rectHeight, filled = arguments
+            if filled or rectWidth <= 2 or rectHeight <= 2:
+                image[max(top, 0):bottom + 1, max(left, 0):right + 1] = value
+            else:
+                # Each side of the outline is a slice of the array.
+                for y in (top, bottom):
+                    if 0 <= y < height:
+                        image[y, max(left, 0):right + 1] = value
+                for x in (left, right):
+                    if 0 <= x < width:
+                        image[max(top, 0):bottom + 1, x] = value
+        elif kind == 'diamond':
+            ys, xStarts, xEnds = _diamondSpanArrays(numpy, *arguments, clipTop=0, clipBottom=height - 1)
+            _paintSpans(numpy, image, ys, xStarts, xEnds, value)
+        else:
+            if kind == 'circle':
+                spans = _circleSpans(*arguments, clip=clip)
+            else:
+                spans = _fillSpans([arguments[0]], EVEN_ODD, includeEdges=True, clip=clip)
+            spans = numpy.array(list(spans), dtype=numpy.int64).reshape(-1, 3)
+            _paintSpans(numpy, image, spans[:, 0], spans[:, 1], spans[:, 2], value)
+
+    if segments:
+        _paintSegments(numpy, image, segments, segmentsValue)
+    return image
+
+
+def _paintSegments(numpy, image, segments, value):
+    # Writes value at the points of each (x1, y1, x2, y2) line segment that are
+    # inside the image. Each segment is clipped to the image first, so that
+    # only the points of its visible part are calculated.
+    clip = (0, 0, image.shape[1] - 1, image.shape[0] - 1)
+    visibleSegments, firstSteps, lastSteps = [], [], []
+    for segment in segments:
+        steps = _segmentClipSteps(*segment, clip=clip)
+        if steps is not None:
+            visibleSegments.append(segment)
+            firstSteps.append(steps[0])
+            lastSteps.append(steps[1])
+    if not visibleSegments:
+        return
+    x1, y1, x2, y2 = numpy.array(visibleSegments, dtype=numpy.int64).T
+    xs, ys, offsets = _linesBatch(numpy, x1, y1, x2, y2, numpy.array(firstSteps, dtype=numpy.int64), numpy.array(lastSteps, dtype=numpy.int64))
+    isInside = (xs >= 0) & (xs < image.shape[1]) & (ys >= 0) & (ys < image.shape[0])
+    image[ys[isInside], xs[isInside]] = value
+
+
+def _segmentClipSteps(x1, y1, x2, y2, clip):
+    # Returns the (first, last) range of the steps of line(x1, y1, x2, y2)
+    # whose points are inside clip, or None if none of them are, the same way
+    # that line() clips them.
+    left, top, right, bottom = clip
+    if abs(y2 - y1) > abs(x2 - x1):
+        # Steep lines have a point per y, so swap the axes.
+        x1, y1, x2, y2 = y1, x1, y2, x2
+        left, top, right, bottom = top, left, bottom, right
+    deltax, deltay = abs(x2 - x1), abs(y2 - y1)
+    if deltax < 2:
+        return (0, deltax) # (Lines this short have at most two points, which are checked when they're drawn.)
+    xstep = 1 if x1 <= x2 else -1
+    ystep = 1 if y1 < y2 else (-1 if y1 > y2 else 0)
+    error = deltax // 2 if xstep == 1 else deltax // 2 - 1
+    return _clipLineSteps(x1, xstep, y1, ystep, deltax, deltay, error, left, right, top, bottom)
+
+
+def _paintSpans(numpy, image, ys, xStarts, xEnds, value):
+    # Writes value at the points of the spans given by the ys, xStarts, and xEnds arrays, clipped to the image.
+    xStarts, xEnds = numpy.maximum(xStarts, 0), numpy.minimum(xEnds, image.shape[1] - 1)
+    isInside = (ys >= 0) & (ys < image.shape[0]) & (xStarts <= xEnds)
+    xs, ys = _spanPointArrays(numpy, ys[isInside], xStarts[isInside], xEnds[isInside])
+    image[ys, xs] = value
+
+
+def rasterizeAsync(scene, image=None, executor=None):
+    """
+    Runs `rasterize(scene, image)` in a thread pool and returns an awaitable
+    for its result, so that an asyncio event loop can keep running while the
+    scene is drawn. This function requires NumPy, and must be called while
+    an event loop is running.
+
+    `executor` is the `concurrent.futures` executor to run `rasterize()` in.
+    By default, it is the event loop's default thread pool.
+
+        image = await rasterizeAsync(scene)
+    """
+    import asyncio
+    _importNumpy() # Raise an exception now instead of when the result is awaited.
+    return asyncio.get_running_loop().run_in_executor(executor, rasterize, scene, image)
+
+
+if __name__ == '__main__':
+    import doctest
+    print(doctest.testmod())
@@ -0,0 +1,168 @@
+"""
+The `ShapeCache` class, which keeps rasterized shapes to draw them again at
+other positions. It is available from the `pybresenham` package, but this
+module is only imported the first time `ShapeCache` is used.
+"""
+
+import array
+import collections
+import itertools
+
+from pybresenham import (_checkForIntOrFloat, circle, circleSpans, diamond, diamondSpans, pointsToSpans, polygon,
+                         polygonSpans)
+
+
+ShapeCacheInfo = collections.namedtuple('ShapeCacheInfo', 'hits misses evictions currbytes maxbytes')
+
+
+class ShapeCache(object):
+    """
+    An opt-in cache of rasterized circles, diamonds, and polygons. Each shape
+    is rasterized once at the origin and stored in a compact array, keyed on
+    every argument except its position. Drawing the same shape again at any
+    position returns a `CachedShape` view of the stored shape, moved over by
+    the new position, without rasterizing it again.
+
+    Outlines are stored as their points, and filled shapes as their spans.
+    When the arrays take up more than `maxBytes` bytes in total, the least
+    recently used shapes are discarded.
+
+    The shapes are the same as the ones their functions return. Polygons
+    with a non-int center (or a non-int `stretchVertical`) are rounded
+    differently at every position, so they are only reused when they are
+    drawn at exactly the same position again.
+
+    >>> cache = ShapeCache()
+    >>> list(cache.circle(10, 10, 1)) == list(circle(10, 10, 1))
+    True
+    >>> list(cache.circle(-5, 0, 1))
+    [(-5, -1), (-4, 0), (-5, 1), (-6, 0)]
+    >>> cache.cacheInfo()
+    ShapeCacheInfo(hits=1, misses=1, evictions=0, currbytes=32, maxbytes=67108864)
+    """
+
+    def __init__(self, maxBytes=64 * 1024 * 1024):
+        _checkForIntOrFloat(maxBytes, minVal=0)
+        self.maxBytes = maxBytes
+        self._shapes = collections.OrderedDict() # Maps keys to (isSpans, data, numPoints) tuples, from least to most recently used.
+        self._currBytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def circle(self, centerx, centery, radius, filled=False):
+        """Returns a `CachedShape` of the points of `circle(centerx, centery, radius, filled)`."""
+        return self._lookup(('circle', radius, filled), centerx, centery, filled,
+                            lambda: circleSpans(0, 0, radius, filled) if filled else circle(0, 0, radius))
+
+    def diamond(self, left, top, radius, filled=False):
+        """Returns a `CachedShape` of the points of `diamond(left, top, radius, filled)`."""
+        return self._lookup(('diamond', radius, filled), left, top, filled,
+                            lambda: diamondSpans(0, 0, radius, filled) if filled else diamond(0, 0, radius))
+
+    def polygon(self, centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False):
+        """Returns a `CachedShape` of the points of `polygon(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled)`."""
+        key = ('polygon', radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled)
+        _checkForIntOrFloat(centerx)
+        _checkForIntOrFloat(centery)
+        _checkForIntOrFloat(stretchVertical)
+        if centerx != int(centerx) or centery != int(centery) or stretchVertical != int(stretchVertical):
+            # polygon() adds the center to the vertices before truncating them,
+            # and truncating depends on which side of 0 they're on, so a
+            # non-int center or y value makes the shape depend on its position.
+            # This shape is stored at its exact position instead.
+            key += (centerx, centery)
+            return self._lookup(key, 0, 0, filled,
+                                lambda: polygonSpans(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled) if filled else
+                                        polygon(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical))
+        return self._lookup(key, centerx, centery, filled,
+                            lambda: polygonSpans(0, 0, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled) if filled else
+                                    polygon(0, 0, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical))
+
+    def cacheInfo(self):
+        """Returns the hits, misses, evictions, and current and maximum byte size of the cache."""
+        return ShapeCacheInfo(self._hits, self._misses, self._evictions, self._currBytes, self.maxBytes)
+
+    def clear(self):
+        """Discards all of the cached shapes and resets the statistics."""
+        self._shapes.clear()
+        self._currBytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key, x, y, isSpans, rasterize):
+        # Returns a view of the shape stored under `key`, calling rasterize()
+        # to get the shape's points or spans at the origin if it isn't stored.
+        _checkForIntOrFloat(x)
+        _checkForIntOrFloat(y)
+        entry = self._shapes.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._shapes.move_to_end(key)
+        else:
+            self._misses += 1
+            data = array.array('i', itertools.chain.from_iterable(rasterize())) # The flattened points or spans.
+            if isSpans:
+                numPoints = sum([data[i + 2] - data[i + 1] + 1 for i in range(0, len(data), 3)])
+            else:
+                numPoints = len(data) // 2
+            entry = (isSpans, data, numPoints)
+
+            # A shape bigger than the whole budget is still returned, but isn't kept.
+            numBytes = len(data) * data.itemsize
+            if numBytes <= self.maxBytes:
+                self._shapes[key] = entry
+                self._currBytes += numBytes
+                # Discard the least recently used shapes until the cache is under budget.
+                while self._currBytes > self.maxBytes:
+                    evictedData = self._shapes.popitem(last=False)[1][1]
+                    self._currBytes -= len(evictedData) * evictedData.itemsize
+                    self._evictions += 1
+        isSpans, data, numPoints = entry
+        return CachedShape(isSpans, data, numPoints, int(x), int(y))
+
+
+class CachedShape(object):
+    """
+    A view of a shape stored in a `ShapeCache`, moved over to a new position.
+    Iterating over it produces the shape's (x, y) points in the same order as
+    the shape's function does. Creating a view doesn't copy the shape.
+    """
+
+    __slots__ = ('_isSpans', '_data', '_numPoints', 'offsetx', 'offsety')
+
+    def __init__(self, isSpans, data, numPoints, offsetx, offsety):
+        self._isSpans = isSpans
+        self._data = data
+        self._numPoints = numPoints
+        self.offsetx = offsetx
+        self.offsety = offsety
+
+    def __len__(self):
+        return self._numPoints
+
+    def __iter__(self):
+        offsetx, offsety = self.offsetx, self.offsety
+        dataIterator = iter(self._data)
+        if self._isSpans:
+            for y, xStart, xEnd in zip(dataIterator, dataIterator, dataIterator):
+                y += offsety
+                for x in range(xStart + offsetx, xEnd + offsetx + 1):
+                    yield (x, y)
+        else:
+            for x, y in zip(dataIterator, dataIterator):
+                yield (x + offsetx, y + offsety)
+
+    def spans(self):
+        """Returns a generator that produces the (y, xStart, xEnd) spans of the shape, like `pointsToSpans()`."""
+        if not self._isSpans:
+            return iter(pointsToSpans(self))
+        return self._spans()
+
+    def _spans(self):
+        offsetx, offsety = self.offsetx, self.offsety
+        dataIterator = iter(self._data)
+        for y, xStart, xEnd in zip(dataIterator, dataIterator, dataIterator):
+            yield (y + offsety, xStart + offsetx, xEnd + offsetx)
+
+
+if __name__ == '__main__':
+    import doctest
+    print(doctest.testmod())
@@ -0,0 +1,251 @@
+"""
+Opt-in measurement of the PyBresenham functions that produce points. These
+functions are available from the `pybresenham` package, but this module is
+only imported the first time one of them is used.
+"""
+
+import collections
+import functools
+import sys
+import time
+
+from pybresenham import PyBresenhamException
+
+
+# The names of the public functions that produce points (or spans) and that
+# enableInstrumentation() measures.
+INSTRUMENTED_FUNCTIONS = ('line', 'lineRuns', 'lines', 'polygon', 'polygonSpans', 'polygonVertices', 'fillSpans',
+                          'strokeSpans', 'spansToPoints', 'pointsToSpans', 'floodFill', 'circle', 'circleSpans',
+                          'square', 'squareSpans', 'rectangle', 'rectangleSpans', 'diamond', 'diamondSpans',
+                          'ellipse', 'ellipseSpans', 'ellipseVertices', 'arc', 'arcSpans', 'arcVertices', 'star',
+                          'starSpans', 'starVertices', 'grid', 'gridSpans', 'bezier', 'bezierVertices',
+                          'bezierSegments', 'rotatePoints', 'translatePoints')
+
+InstrumentationStats = collections.namedtuple('InstrumentationStats', ('calls', 'points', 'seconds'))
+
+_originalFunctions = {} # Maps the measured functions to the unmeasured ones while instrumentation is enabled.
+_instrumentationStats = {} # Maps names to [calls, points, seconds] lists.
+_instrumentationCallback = None
+_monitoringToolId = None
+_monitoredCodes = {} # Maps the code objects watched by sys.monitoring to [calls, points, seconds] lists.
+_monitoringThreadState = None
+
+
+def enableInstrumentation(callback=None, monitoring=False):
+    """
+    Starts measuring the public functions that produce points or spans, such
+    as `line()`, `polygon()`, and `floodFill()`. (They are listed in
+    `INSTRUMENTED_FUNCTIONS`.) For each function, the number of calls, the
+    number of points (or spans) produced, and the seconds spent producing them
+    are added up, and `instrumentationStats()` returns the totals.
+
+    The measured functions replace the ones in the `pybresenham` package until
+    `disableInstrumentation()` is called, so instrumentation costs nothing
+    while it is disabled. Names imported with `from pybresenham import line`
+    in other modules still refer to the unmeasured functions. Since the
+    functions call each other, the seconds of a function include the seconds
+    of the measured functions it calls, such as the `lines()` call that
+    `polygon()` makes to draw its edges.
+
+    If `callback` is given, `callback(name, args, kwargs, points, seconds)` is
+    called as each call finishes (that is, when its generator is exhausted or
+    closed), so that the calls can be grouped by their arguments.
+
+    If `monitoring` is True (this requires Python 3.12 or later), the points
+    and seconds are collected by a `sys.monitoring` tool instead. The points
+    of each function pass through a generator whose code object has the name
+    of the function, so any other `sys.monitoring` tool also sees a PY_START
+    event as each call starts producing points and a PY_YIELD event for each
+    point. `callback` can't be used with `monitoring`.
+    """
+    global _instrumentationCallback
+    if callback is not None and not callable(callback):
+        raise PyBresenhamException('callback must be a function')
+    if callback is not None and monitoring:
+        raise PyBresenhamException('callback cannot be used with monitoring')
+
+    disableInstrumentation()
+    if monitoring:
+        _startMonitoring()
+    _instrumentationCallback = callback
+
+    import pybresenham
+    instrumentedFunctions = {}
+    for name in INSTRUMENTED_FUNCTIONS:
+        function = getattr(pybresenham, name)
+        instrumentedFunctions[function] = _instrumentedFunction(name, function, monitoring)
+        _originalFunctions[instrumentedFunctions[function]] = function
+    _replaceFunctions(instrumentedFunctions)
+
+
+def disableInstrumentation():
+    """Puts back the unmeasured functions replaced by `enableInstrumentation()`.
+    The totals returned by `instrumentationStats()` are kept."""
+    global _instrumentationCallback
+    _replaceFunctions(_originalFunctions)
+    _originalFunctions.clear()
+    _instrumentationCallback = None
+    if _monitoringToolId is not None:
+        _stopMonitoring()
+
+
+def _replaceFunctions(replacements):
+    # Replaces the functions that are keys of `replacements` with their values,
+    # in the pybresenham package and in its loaded submodules, which import
+    # some of these functions from the package.
+    for moduleName, module in list(sys.modules.items()):
+        if module is None or (moduleName != 'pybresenham' and not moduleName.startswith('pybresenham.')):
+            continue
+        moduleGlobals = vars(module)
+        for name in INSTRUMENTED_FUNCTIONS:
+            if moduleGlobals.get(name) in replacements:
+                moduleGlobals[name] = replacements[moduleGlobals[name]]
+
+
+def instrumentationStats():
+    """
+    Returns a dict that maps the name of each measured function that has been
+    called to an `InstrumentationStats` named tuple of its calls, points (or
+    spans), and seconds.
+    """
+    return dict((name, InstrumentationStats(*stats)) for name, stats in _instrumentationStats.items() if stats[0])
+
+
+def clearInstrumentationStats():
+    """Resets the totals returned by `instrumentationStats()` to zero."""
+    for stats in _instrumentationStats.values():
+        stats[:] = [0, 0, 0.0]
+
+
+def _instrumentedFunction(name, function, monitoring):
+    # Returns a function that calls `function` and measures the points it produces.
+    stats = _instrumentationStats.setdefault(name, [0, 0, 0.0])
+    if monitoring:
+        passThrough = _monitoredPassThrough(name, stats)
+
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        stats[0] += 1
+        startTime = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - startTime
+        if not hasattr(result, '__next__'):
+            # The function returned a list or PointSet, so all of its points are already made.
+            stats[1] += len(result)
+            stats[2] += seconds
+            if _instrumentationCallback is not None:
+                _instrumentationCallback(name, args, kwargs, len(result), seconds)
+            return result
+        if monitoring:
+            stats[2] += seconds
+            return passThrough(result)
+        return _measuredPoints(name, stats, result, args, kwargs, seconds)
+    return instrumented
+
+
+def _measuredPoints(name, stats, points, args, kwargs, seconds):
+    # Only the time spent inside next() is counted, not the time the caller
+    # spends between points.
+    perfCounter = time.perf_counter
+    numPoints = 0
+    try:
+        while True:
+            startTime = perfCounter()
+            try:
+                point = next(points)
+            except StopIteration:
+                break
+            finally:
+                seconds += perfCounter() - startTime
+            numPoints += 1
+            yield point
+    finally:
+        stats[1] += numPoints
+        stats[2] += seconds
+        if _instrumentationCallback is not None:
+            _instrumentationCallback(name, args, kwargs, numPoints, seconds)
+
+
+def _passThrough(points):
+    for point in points:
+        yield point
+
+
+def _monitoredPassThrough(name, stats):
+    # Returns a copy of _passThrough() whose code object is named after the
+    # measured function, and has sys.monitoring watch that code object.
+    import types
+    code = _passThrough.__code__.replace(co_name=name, co_qualname=name)
+    events = sys.monitoring.events
+    sys.monitoring.set_local_events(_monitoringToolId, code, events.PY_START | events.PY_RESUME | events.PY_YIELD | events.PY_RETURN)
+    _monitoredCodes[code] = stats
+    return types.FunctionType(code, globals(), name)
+
+
+def _startMonitoring():
+    global _monitoringToolId, _monitoringThreadState
+    if sys.version_info < (3, 12):
+        raise PyBresenhamException('monitoring requires Python 3.12 or later')
+    import threading
+    monitoring = sys.monitoring
+    for toolId in (3, 4, monitoring.PROFILER_ID):
+        if monitoring.get_tool(toolId) is None:
+            break
+    else:
+        raise PyBresenhamException('no sys.monitoring tool ID is free')
+
+    monitoring.use_tool_id(toolId, 'pybresenham')
+    _monitoringToolId = toolId
+    _monitoringThreadState = threading.local()
+    events = monitoring.events
+    for event in (events.PY_START, events.PY_RESUME, events.PY_THROW):
+        monitoring.register_callback(toolId, event, _monitorResume)
+    monitoring.register_callback(toolId, events.PY_YIELD, _monitorYield)
+    for event in (events.PY_RETURN, events.PY_UNWIND):
+        monitoring.register_callback(toolId, event, _monitorSuspend)
+    # PY_THROW and PY_UNWIND (a generator closed or raising an exception) can
+    # only be watched for all code objects, so the callbacks check the code.
+    monitoring.set_events(toolId, events.PY_THROW | events.PY_UNWIND)
+
+
+def _stopMonitoring():
+    global _monitoringToolId
+    monitoring = sys.monitoring
+    monitoring.set_events(_monitoringToolId, 0)
+    for code in _monitoredCodes:
+        monitoring.set_local_events(_monitoringToolId, code, 0)
+    _monitoredCodes.clear()
+    events = monitoring.events
+    for event in (events.PY_START, events.PY_RESUME, events.PY_THROW, events.PY_YIELD, events.PY_RETURN, events.PY_UNWIND):
+        monitoring.register_callback(_monitoringToolId, event, None)
+    monitoring.free_tool_id(_monitoringToolId)
+    _monitoringToolId = None
+
+
+def _monitorResume(code, instructionOffset, exception=None):
+    # A measured generator started or resumed running. Generators resume
+    # inside each other, so the start times are kept on a per-thread stack.
+    if code in _monitoredCodes:
+        try:
+            _monitoringThreadState.startTimes.append(time.perf_counter())
+        except AttributeError:
+            _monitoringThreadState.startTimes = [time.perf_counter()]
+
+
+def _monitorYield(code, instructionOffset, point):
+    # A measured generator produced a point.
+    stats = _monitoredCodes[code]
+    stats[1] += 1
+    stats[2] += time.perf_counter() - _monitoringThreadState.startTimes.pop()
+
+
+def _monitorSuspend(code, instructionOffset, valueOrException):
+    # A measured generator finished, or was closed.
+    stats = _monitoredCodes.get(code)
+    if stats is not None:
+        stats[2] += time.perf_counter() - _monitoringThreadState.startTimes.pop()
+
+
+if __name__ == '__main__':
+    import doctest
+    print(doctest.testmod())
@@ -0,0 +1,231 @@
+"""
+The `Scene` class, which draws many shapes into one large image, optionally
+in parallel. It is available from the `pybresenham` package, but this module
+is only imported the first time `Scene` is used.
+"""
+
+import os
+
+from pybresenham import (EVEN_ODD, PyBresenhamException, _BufferTarget, _checkForIntOrFloat, _circleSpans, _fillSpans,
+                         diamondSpans, line, lines, polygonVertices, rectangleSpans)
+
+
+class Scene(object):
+    """
+    A list of shapes to draw into one large image. Shapes are drawn in the
+    order they were added, so later shapes are drawn over earlier ones.
+    `render()` can split the image into square tiles and draw them in
+    parallel with a pool of processes, and `rasterize()` draws them into a
+    NumPy array with NumPy kernels.
+
+    The image is `width` by `height` points, with one byte per point. Each
+    shape's `value` (from 0 to 255) is written at its points, and the rest
+    of the image is 0.
+
+    >>> scene = Scene(7, 3)
+    >>> scene.rectangle(0, 0, 7, 3, value=ord(','), filled=True)
+    >>> scene.line(0, 0, 6, 2, value=ord('O'))
+    >>> image = scene.render(processes=1)
+    >>> for y in range(3): print(image[y * 7:y * 7 + 7].decode())
+    OO,,,,,
+    ,,OOO,,
+    ,,,,,OO
+    """
+
+    def __init__(self, width, height):
+        _checkForIntOrFloat(width, minVal=0)
+        _checkForIntOrFloat(height, minVal=0)
+        self.width, self.height = int(width), int(height)
+        # Each shape is a (kind, arguments, value, boundingBox) tuple. Only
+        # these tuples are sent to the worker processes, never the points.
+        self.shapes = []
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def _add(self, kind, arguments, value, left, top, right, bottom):
+        _checkForIntOrFloat(value, minVal=0, maxVal=255)
+        self.shapes.append((kind, arguments, int(value), (left, top, right, bottom)))
+
+    def line(self, x1, y1, x2, y2, value=1):
+        """Adds the points of `line(x1, y1, x2, y2)` to the scene."""
+        _checkForIntOrFloat(x1)
+        _checkForIntOrFloat(y1)
+        _checkForIntOrFloat(x2)
+        _checkForIntOrFloat(y2)
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        self._add('line', (x1, y1, x2, y2), value, min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+    def lines(self, points, closed=False, value=1):
+        """Adds the points of `lines(points, closed)` to the scene."""
+        points = [(int(x), int(y)) for x, y in _validatedPoints(points)]
+        if closed and len(points) < 3:
+            raise PyBresenhamException('points argument must have at least three points if closed==True')
+        if len(points) < 2:
+            raise PyBresenhamException('points argument must have at least two points')
+        xs, ys = [x for x, y in points], [y for x, y in points]
+        self._add('lines', (points, bool(closed)), value, min(xs), min(ys), max(xs), max(ys))
+
+    def circle(self, centerx, centery, radius, filled=False, value=1):
+        """Adds the points of `circle(centerx, centery, radius, filled)` to the scene."""
+        _checkForIntOrFloat(centerx)
+        _checkForIntOrFloat(centery)
+        _checkForIntOrFloat(radius, minVal=0)
+        centerx, centery, radius = int(centerx), int(centery), int(radius)
+        self._add('circle', (centerx, centery, radius, bool(filled)), value, centerx - radius, centery - radius, centerx + radius, centery + radius)
+
+    def polygon(self, centerx, centery, radius, sides, rotationDegrees=0, stretchHorizontal=1.0, stretchVertical=1.0, filled=False, value=1):
+        """Adds the points of `polygon(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical, filled)` to the scene."""
+        _checkForIntOrFloat(sides)
+        if sides < 3:
+            raise PyBresenhamException('sides argument must be at least 3')
+        # (The vertices are truncated to ints, the same way that polygon() draws them.)
+        vertices = [(int(x), int(y)) for x, y in polygonVertices(centerx, centery, radius, sides, rotationDegrees, stretchHorizontal, stretchVertical)]
+        xs, ys = [x for x, y in vertices], [y for x, y in vertices]
+        self._add('polygon', (vertices, bool(filled)), value, min(xs), min(ys), max(xs), max(ys))
+
+    def rectangle(self, left, top, width, height, filled=False, value=1):
+        """Adds the points of `rectangle(left, top, width, height, filled)` to the scene."""
+        _checkForIntOrFloat(left)
+        _checkForIntOrFloat(top)
+        _checkForIntOrFloat(width)
+        _checkForIntOrFloat(height)
+        left, top, width, height = int(left), int(top), int(width), int(height)
+        if width < 1 or height < 1:
+            raise PyBresenhamException('width and height must be positive integers')
+        self._add('rectangle', (left, top, width, height, bool(filled)), value, left, top, left + width - 1, top + height - 1)
+
+    def diamond(self, left, top, radius, filled=False, value=1):
+        """Adds the points of `diamond(left, top, radius, filled)` to the scene."""
+        _checkForIntOrFloat(left)
+        _checkForIntOrFloat(top)
+        _checkForIntOrFloat(radius, minVal=0)
+        left, top, radius = int(left), int(top), int(radius)
+        self._add('diamond', (left, top, radius, bool(filled)), value, left + 1, top, left + 1 + radius * 2, top + radius * 2)
+
+    def tiles(self, tileSize=256):
+        """
+        Returns a list of `(clip, shapes)` tuples, one for each `tileSize` by
+        `tileSize` tile of the image that has shapes on it. `clip` is the
+        tile's `(left, top, right, bottom)` rectangle, and `shapes` is the
+        list of the shapes whose bounding boxes overlap the tile, in the order
+        they were added.
+        """
+        _checkForIntOrFloat(tileSize, minVal=1)
+        tileSize = int(tileSize)
+        tilesWide = (self.width + tileSize - 1) // tileSize
+        tilesHigh = (self.height + tileSize - 1) // tileSize
+
+        tileShapes = {}
+        for shape in self.shapes:
+            left, top, right, bottom = shape[3]
+            firstColumn, lastColumn = max(left // tileSize, 0), min(right // tileSize, tilesWide - 1)
+            firstRow, lastRow = max(top // tileSize, 0), min(bottom // tileSize, tilesHigh - 1)
+            for row in range(firstRow, lastRow + 1):
+                for column in range(firstColumn, lastColumn + 1):
+                    tileShapes.setdefault((row, column), []).append(shape)
+
+        tiles = []
+        for row, column in sorted(tileShapes):
+            left, top = column * tileSize, row * tileSize
+            clip = (left, top, min(left + tileSize, self.width) - 1, min(top + tileSize, self.height) - 1)
+            tiles.append((clip, tileShapes[(row, column)]))
+        return tiles
+
+    def render(self, processes=None, tileSize=256):
+        """
+        Draws all of the shapes and returns the image as a bytearray of
+        `width * height` bytes, one row after another.
+
+        The tiles of the image are drawn by a pool of `processes` worker
+        processes (by default, one per CPU). Each tile only draws the part of
+        each shape that is inside of it, and writes it straight into an
+        image in shared memory, so no points are sent between processes.
+        Since every point is only drawn by the one tile it is in, the image
+        is exactly the same as the one drawn by a single process, which is
+        what happens if `processes` is 1.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        _checkForIntOrFloat(processes, minVal=1)
+        tiles = self.tiles(tileSize)
+
+        if processes == 1 or len(tiles) <= 1:
+            image = bytearray(self.width * self.height)
+            _drawSceneShapes(image, self.width, self.height, (0, 0, self.width - 1, self.height - 1), self.shapes)
+            return image
+
+        from multiprocessing import shared_memory
+        import concurrent.futures
+
+        imageSize = self.width * self.height
+        sharedImage = shared_memory.SharedMemory(create=True, size=imageSize)
+        try:
+            sharedImage.buf[:imageSize] = bytes(imageSize)
+            with concurrent.futures.ProcessPoolExecutor(int(processes)) as executor:
+                jobs = [(sharedImage.name, self.width, self.height, clip, shapes) for clip, shapes in tiles]
+                # Wait for all of the tiles, raising any exception from the workers.
+                for pointsWritten in executor.map(_renderSceneTile, jobs, chunksize=max(1, len(jobs) // (4 * int(processes)))):
+                    pass
+            return bytearray(sharedImage.buf[:imageSize])
+        finally:
+            sharedImage.close()
+            sharedImage.unlink()
+
+
+def _validatedPoints(points):
+    # Yields the points of an iterable of (x, y) tuples, raising an exception for invalid points.
+    try:
+        points = iter(points)
+    except TypeError:
+        raise PyBresenhamException('points must be an iterable')
+    for i, point in enumerate(points):
+        try:
+            _checkForIntOrFloat(point[0])
+            _checkForIntOrFloat(point[1])
+        except:
+            raise PyBresenhamException('point at index %s is not a tuple of two int/float values' % (i))
+        yield point
+
+
+def _renderSceneTile(job):
+    # Draws one tile of a Scene into the shared memory image. This runs in a worker process.
+    from multiprocessing import shared_memory
+    sharedImageName, width, height, clip, shapes = job
+    sharedImage = shared_memory.SharedMemory(name=sharedImageName)
+    try:
+        return _drawSceneShapes(sharedImage.buf, width, height, clip, shapes)
+    finally:
+        sharedImage.close()
+
+
+def _drawSceneShapes(buffer, width, height, clip, shapes):
+    # Draws the parts of the Scene shapes that are inside `clip` into the buffer, in order.
+    pointsWritten = 0
+    for kind, arguments, value, boundingBox in shapes:
+        target = _BufferTarget(buffer, value, width, height)
+        if kind == 'line':
+            target.drawPoints(line(*arguments, validate=False, clip=clip))
+        elif kind == 'lines':
+            points, closed = arguments
+            target.drawPoints(lines(points, closed, clip=clip))
+        elif kind == 'circle':
+            centerx, centery, radius, filled = arguments
+            target.drawSpans(_circleSpans(centerx, centery, radius, filled, clip))
+        elif kind == 'polygon':
+            vertices, filled = arguments
+            if filled:
+                target.drawSpans(_fillSpans([vertices], EVEN_ODD, includeEdges=True, clip=clip))
+            else:
+                target.drawPoints(lines(vertices, closed=True, clip=clip))
+        elif kind == 'rectangle':
+            target.drawSpans(rectangleSpans(*arguments, clip=clip))
+        elif kind == 'diamond':
+            target.drawSpans(diamondSpans(*arguments, clip=clip))
+        pointsWritten += target.pointsWritten
+    return pointsWritten
+
+
+if __name__ == '__main__':
+    import doctest
+    print(doctest.testmod())
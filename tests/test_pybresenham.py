@@ -1,5 +1,7 @@
+import math
 import os
 import pytest
+import subprocess
 import sys
 
 
@@ -22,6 +24,68 @@ def test_rotatePoints():
     # TODO add more tests, including with pivot values.
 
 
+def test_Transform():
+    import random
+    random.seed(42)
+    points = [(random.randint(-500, 500), random.randint(-500, 500)) for i in range(1000)]
+
+    # Rotations match rotatePoints() exactly, including the truncation to ints.
+    for rotationDegrees in (0, 30, 45, 90, 123.4, 180, 270, -90, 720):
+        assert list(pybresenham.Transform().rotate(rotationDegrees).apply(points)) == list(pybresenham.rotatePoints(points, rotationDegrees))
+    assert list(pybresenham.Transform().rotate(90, 3, 4).apply(points)) == list(pybresenham.rotatePoints(points, 90, 3, 4))
+    assert list(pybresenham.Transform().rotate(30, 47, -15).apply([(-97, -15)])) == [(-77, -86)] == list(pybresenham.rotatePoints([(-97, -15)], 30, 47, -15))
+    for i in range(200):
+        rotationDegrees = random.choice([random.uniform(-360, 360), random.randint(-360, 360)])
+        pivotx, pivoty = random.choice([(random.randint(-100, 100), random.randint(-100, 100)), (random.uniform(-100, 100), random.uniform(-100, 100))])
+        transform = pybresenham.Transform().rotate(rotationDegrees, pivotx, pivoty)
+        assert list(transform.apply(points)) == list(pybresenham.rotatePoints(points, rotationDegrees, pivotx, pivoty))
+    assert list(pybresenham.Transform().translate(1, -3).apply(points)) == list(pybresenham.translatePoints(points, 1, -3))
+    assert pybresenham.rotatePoint(-10, 5, 90) == (-5, -10) # quarter turns are exact
+
+    # The steps are applied in order.
+    assert list(pybresenham.Transform().translate(10, 0).rotate(90).apply([(0, 0)])) == [(0, 10)]
+    assert list(pybresenham.Transform().rotate(90).translate(10, 0).apply([(0, 0)])) == [(10, 0)]
+    assert list(pybresenham.Transform().scale(2).apply([(3, -4)])) == [(6, -8)]
+    assert list(pybresenham.Transform().scale(2, 3, 1, 1).apply([(2, 2)], asFloat=True)) == [(3.0, 4.0)]
+    assert list(pybresenham.Transform().shear(0.5).apply([(0, 4), (4, 0)])) == [(2, 4), (4, 0)]
+    assert list(pybresenham.Transform().shear(0, 0.5, 0, 2).apply([(2, 2)])) == [(2, 3)]
+    assert list(pybresenham.Transform().scale(0.5).apply([(-3, 3)], asFloat=True)) == [(-1.5, 1.5)]
+    assert list(pybresenham.Transform().scale(0.5).apply([(-3, 3)])) == [(-1, 1)] # truncated toward zero
+
+    transform = pybresenham.Transform().rotate(33).scale(1.5, 0.5).translate(10, 20).shear(0.1)
+    assert transform == pybresenham.Transform().rotate(33).then(pybresenham.Transform().scale(1.5, 0.5)).then(pybresenham.Transform().translate(10, 20).shear(0.1))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.Transform().rotate('invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.Transform((1, 2, 3))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.Transform().apply([(0, 'invalid')]))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.Transform().then(42)
+
+
+def test_TransformApplyArray():
+    numpy = pytest.importorskip('numpy')
+    import random
+    random.seed(42)
+    points = [(random.randint(-500, 500), random.randint(-500, 500)) for i in range(1000)]
+    transform = pybresenham.Transform().rotate(33).scale(1.5, 0.5).translate(10, 20).shear(0.1)
+
+    assert transform.applyArray(points).tolist() == [list(point) for point in transform.apply(points)]
+    pivotTransform = transform.rotate(30, 47, -15).scale(2, 0.5, -3.5, 8)
+    assert pivotTransform.applyArray(points).tolist() == [list(point) for point in pivotTransform.apply(points)]
+    assert pybresenham.Transform().rotate(30, 47, -15).applyArray(points).tolist() == [list(point) for point in pybresenham.rotatePoints(points, 30, 47, -15)]
+    assert transform.applyArray(numpy.array(points, dtype=numpy.float32), asFloat=True).dtype == numpy.float64
+    assert transform.applyArray(numpy.array(points)).dtype == numpy.int64
+    assert transform.applyArray(numpy.zeros((0, 2))).shape == (0, 2)
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        transform.applyArray([1, 2, 3])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        transform.applyArray([['a', 'b']])
+
+
 def test_line():
     assert list(pybresenham.line(0, 0, 5, 5))  == [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5)]
     assert list(pybresenham.line(0, 0, 5, 15)) == [(0, 0), (0, 1), (1, 2), (1, 3), (1, 4), (2, 5), (2, 6), (2, 7), (3, 8), (3, 9), (3, 10), (4, 11), (4, 12), (4, 13), (5, 14), (5, 15)]
@@ -46,11 +110,52 @@ def test_line():
     with pytest.raises(pybresenham.PyBresenhamException):
         list(pybresenham.line(0, 0, 5, 5, _skipFirst='invalid'))
 
-    # Test unimplemented parts.
-    with pytest.raises(NotImplementedError):
-        list(pybresenham.line(0,0,0,0, thickness=2))
-    with pytest.raises(NotImplementedError):
-        list(pybresenham.line(0,0,0,0,endcap=2))
+    # Test the validate parameter.
+    for x1, y1, x2, y2 in [(17, 9, 5, -15), (21, 14, 18, -8), (-18, -26, -29, 9), (0, 0, 0, 0), (0, 0, 1, 0), (1, 0, 0, 0)]:
+        assert list(pybresenham.line(x1, y1, x2, y2, validate=False)) == list(pybresenham.line(x1, y1, x2, y2))
+        assert list(pybresenham.line(x1, y1, x2, y2, validate=False, _skipFirst=True)) == list(pybresenham.line(x1, y1, x2, y2))[1:]
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.line(0, 0, 'invalid', 5) # arguments are checked when line() is called, not when it's iterated
+
+    # Two-point lines going left or up stay on the same row or column.
+    assert list(pybresenham.line(1, 0, 0, 0)) == [(1, 0), (0, 0)]
+    assert list(pybresenham.line(0, 1, 0, 0)) == [(0, 1), (0, 0)]
+
+    # Test thick lines.
+    assert list(pybresenham.line(0, 0, 0, 0, thickness=2)) == [(-1, -1), (0, -1), (-1, 0), (0, 0)]
+    assert list(pybresenham.line(0, 0, 4, 0, thickness=3)) == [(x, y) for y in range(-1, 2) for x in range(0, 5)]
+    assert list(pybresenham.line(0, 0, 4, 0, thickness=3, endcap=pybresenham.SQUARE_CAP)) == [(x, y) for y in range(-1, 2) for x in range(-1, 6)]
+    assert list(pybresenham.line(0, 0, 0, 0, endcap=pybresenham.ROUNDED_CAP)) == [(0, 0)] # the end cap of a 1-thick line doesn't change it
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.line(0, 0, 0, 0, endcap='invalid'))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.line(0, 0, 0, 0, thickness=0))
+
+def test_lineRuns():
+    import random
+    random.seed(42)
+
+    assert list(pybresenham.lineRuns(0, 0, 10, 3)) == [(0, 0, 2), (2, 1, 4), (6, 2, 3), (9, 3, 2)]
+    assert list(pybresenham.lineRuns(0, 0, 0, 0)) == [(0, 0, 1)]
+    assert list(pybresenham.lineRuns(5, 2, -5, 2)) == [(-5, 2, 11)]
+    assert list(pybresenham.lineRuns(0, 0, 1000, 1)) == [(0, 0, 501), (501, 1, 500)]
+
+    # The runs cover the same points as line(), in the same order.
+    for i in range(1000):
+        x1, y1, x2, y2 = [random.randint(-50, 50) for j in range(4)]
+        isSteep = abs(y2 - y1) > abs(x2 - x1)
+        linePoints = list(pybresenham.line(x1, y1, x2, y2))
+        runPoints = []
+        for x, y, length in pybresenham.lineRuns(x1, y1, x2, y2):
+            run = [(x, y + j) if isSteep else (x + j, y) for j in range(length)]
+            if (isSteep and y2 < y1) or (not isSteep and x2 < x1):
+                run.reverse()
+            runPoints.extend(run)
+        assert runPoints == linePoints
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.lineRuns(0, 0, 'invalid', 0)
+
 
 def test_lines():
     assert list(pybresenham.lines([(0, 0), (2, 0), (2, 2)])) == [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]
@@ -58,6 +163,7 @@ def test_lines():
     # TODO Make sure no duplicate points are in the returned generators.
     result1 = [(1, 0), (2, 0), (2, 1), (2, 2), (1, 1), (0, 0)]
     assert list(pybresenham.lines([(0, 0), (2, 0), (2, 2)], closed=True)) == result1
+    assert list(pybresenham.lines([(3, 4), (3, 4), (3, 4)], closed=True)) == [(3, 4)] # A closed shape that is a single point still has that point.
     assert list(pybresenham.lines([(0, 0), (2, 0), (2, 2)], True)) == result1 # test the positional argument
 
     result2 = [(0, 1), (1, 2), (1, 3), (2, 4), (2, 5), (3, 6), (3, 7), (2, 6), (2, 5), (1, 4), (1, 3), (0, 2), (0, 1), (-1, 0), (-1, -1), (-2, -2), (-2, -3), (-3, -4), (-3, -5), (-4, -6), (-4, -7), (-5, -8), (-5, -9), (-4, -8), (-4, -7), (-3, -6), (-3, -5), (-2, -4), (-2, -3), (-1, -2), (-1, -1), (0, 0)]
@@ -75,20 +181,160 @@ def test_lines():
         pybresenham.lines([]) # zero points
     with pytest.raises(pybresenham.PyBresenhamException):
         pybresenham.lines([42]) # not iterable argument
+    # (Invalid points raise an exception when they are reached.)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.lines([('invalid', 0), (0, 0)])) # not a int/floats at first point
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.lines([(0, 'invalid'), (0, 0)])) # not a int/floats at first point
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.lines([(0, 0), (0, 0), ('invalid', 0)])) # not a int/floats at last point
     with pytest.raises(pybresenham.PyBresenhamException):
-        pybresenham.lines([('invalid', 0), (0, 0)]) # not a int/floats at first point
+        list(pybresenham.lines([(0, 0), (0, 0), (0, 'invalid')])) # not a int/floats at last point
+
+    # Test iterators of points, which are read one at a time.
+    points = [(0, 0), (3, 7), (-5, -9), (10, 2)]
+    assert list(pybresenham.lines(iter(points))) == list(pybresenham.lines(points))
+    assert list(pybresenham.lines((point for point in points), closed=True)) == list(pybresenham.lines(points, closed=True))
+    assert list(pybresenham.lines(iter(points), thickness=3)) == list(pybresenham.lines(points, thickness=3))
+    import itertools
+    endlessPoints = ((i % 2 * 10, i) for i in itertools.count()) # a zigzag line that never ends
+    assert list(itertools.islice(pybresenham.lines(endlessPoints), 25)) == list(pybresenham.lines([(0, 0), (10, 1), (0, 2), (10, 3)]))[:25]
+
+    # Invalid points from an iterator raise an exception when they are reached.
+    linesIterator = pybresenham.lines(iter([(0, 0), (3, 0), ('invalid', 0)]))
+    assert next(linesIterator) == (0, 0)
     with pytest.raises(pybresenham.PyBresenhamException):
-        pybresenham.lines([(0, 'invalid'), (0, 0)]) # not a int/floats at first point
+        list(linesIterator)
     with pytest.raises(pybresenham.PyBresenhamException):
-        pybresenham.lines([(0, 0), (0, 0), ('invalid', 0)]) # not a int/floats at last point
+        list(pybresenham.lines(iter([(0, 0)])))
     with pytest.raises(pybresenham.PyBresenhamException):
-        pybresenham.lines([(0, 0), (0, 0), (0, 'invalid')]) # not a int/floats at last point
+        list(pybresenham.lines(iter([(0, 0), (10, 10)]), closed=True))
 
-    # Test unimplemented parts.
-    with pytest.raises(NotImplementedError):
-        pybresenham.lines([(0,0),(0,0)], thickness=2)
-    with pytest.raises(NotImplementedError):
-        pybresenham.lines([(0,0),(0,0)],endcap=2)
+    # Test invalid thick line arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.lines([(0, 0), (0, 0)], thickness='invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.lines([(0, 0), (0, 0)], endcap='invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.lines([(0, 0), (0, 0)], thickness=3, join='invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.lines([(0, 0), (5, 5), (0, 0)], closed=True, thickness=3) # only 2 distinct points
+
+
+def test_PointSet():
+    import random
+    random.seed(42)
+
+    # PointSet behaves the same as a set of (x, y) tuples.
+    for i in range(100):
+        pointsA = set([(random.randint(-30, 30), random.randint(-10, 10)) for j in range(random.randint(0, 200))])
+        pointsB = set([(random.randint(-50, 20), random.randint(-10, 10)) for j in range(random.randint(0, 200))])
+        pointSetA, pointSetB = pybresenham.PointSet(pointsA), pybresenham.PointSet(pointsB)
+        assert pointSetA == pointsA
+        assert len(pointSetA) == len(pointsA)
+        assert list(pointSetA) == sorted(pointsA, key=lambda point: (point[1], point[0]))
+        assert list(pointSetA.spans()) == (pybresenham.pointsToSpans(pointsA) if pointsA else [])
+        assert pointSetA | pointSetB == pointsA | pointsB
+        assert pointSetA & pointSetB == pointsA & pointsB
+        assert pointSetA - pointSetB == pointsA - pointsB
+        assert pointSetA - pointsB == pointsA - pointsB
+        assert all([(point in pointSetA) == (point in pointsA) for point in pointsB])
+
+    pointSet = pybresenham.PointSet()
+    assert not pointSet and len(pointSet) == 0 and list(pointSet) == []
+    pointSet.add((5, 5))
+    pointSet.addSpan(5, -100, 3) # extends the bits to the left of the first point
+    pointSet.update([(4, 6)])
+    assert list(pointSet.spans()) == [(5, -100, 3), (5, 5, 5), (6, 4, 4)]
+    pointSet.discard((5, 5))
+    pointSet.discard((4, 6))
+    pointSet.discard((99, 99))
+    assert list(pointSet.spans()) == [(5, -100, 3)]
+    assert pointSet.copy() == pointSet
+    assert 'invalid' not in pointSet
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.PointSet([('invalid', 0)])
+
+    # circle() and floodFill() can return PointSets.
+    for radius in range(0, 20):
+        assert pybresenham.circle(3, 4, radius, asPointSet=True) == set(pybresenham.circle(3, 4, radius))
+        assert pybresenham.circle(3, 4, radius, filled=True, asPointSet=True) == set(pybresenham.circle(3, 4, radius, filled=True))
+    outline = list(pybresenham.polygon(5, 5, 4, 5))
+    assert pybresenham.floodFill(outline, 5, 5, asPointSet=True) == pybresenham.floodFill(outline, 5, 5)
+
+
+def test_strokeSpans():
+    import random
+    random.seed(42)
+
+    def strokePoints(points, thickness, endcap, closed, join):
+        return [(x, y) for y, xStart, xEnd in pybresenham.strokeSpans(points, thickness, endcap, closed, join) for x in range(xStart, xEnd + 1)]
+
+    # Each point of a stroke is produced only once, row by row, even where the lines overlap.
+    for i in range(200):
+        points = [(random.randint(-30, 30), random.randint(-30, 30)) for j in range(random.randint(3, 6))]
+        thickness = random.choice([2, 3, 4.5, 7])
+        endcap = random.choice([None, pybresenham.ROUNDED_CAP, pybresenham.SQUARE_CAP])
+        join = random.choice([None, pybresenham.MITER_JOIN, pybresenham.ROUNDED_JOIN])
+        closed = random.choice([True, False])
+        strokePointsList = strokePoints(points, thickness, endcap, closed, join)
+        assert strokePointsList == sorted(strokePointsList, key=lambda point: (point[1], point[0]))
+        assert len(strokePointsList) == len(set(strokePointsList))
+        assert list(pybresenham.lines(points, closed, thickness, endcap, join)) == strokePointsList
+
+        # The stroke covers the thin line through the same points.
+        assert set(pybresenham.lines(points, closed)) <= set(strokePointsList)
+
+    # Wider strokes cover narrower ones.
+    assert set(strokePoints([(0, 0), (20, 7), (3, 15)], 3, None, False, None)) <= set(strokePoints([(0, 0), (20, 7), (3, 15)], 5, None, False, None))
+
+    # Square caps extend past the end points by half of the thickness, and rounded caps by the radius of a circle.
+    assert strokePoints([(0, 0), (10, 0)], 5, pybresenham.SQUARE_CAP, False, None) == [(x, y) for y in range(-2, 3) for x in range(-2, 13)]
+    assert set(strokePoints([(0, 0), (10, 0)], 5, pybresenham.ROUNDED_CAP, False, None)) == set(strokePoints([(0, 0), (10, 0)], 5, None, False, None)) | set(pybresenham.circle(0, 0, 2, filled=True)) | set(pybresenham.circle(10, 0, 2, filled=True))
+
+    # Miter joins fill in the corner that bevel joins cut off.
+    assert (12, -2) not in strokePoints([(0, 0), (10, 0), (10, 10)], 5, None, False, None)
+    assert (12, -2) in strokePoints([(0, 0), (10, 0), (10, 10)], 5, None, False, pybresenham.MITER_JOIN)
+    assert set(strokePoints([(0, 0), (10, 0), (10, 10)], 5, None, False, None)) <= set(strokePoints([(0, 0), (10, 0), (10, 10)], 5, None, False, pybresenham.ROUNDED_JOIN))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.strokeSpans([(0, 0), (1, 1)], 0.5)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.strokeSpans([], 3)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.strokeSpans([('invalid', 0)], 3)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.strokeSpans(42, 3)
+
+
+def test_linesBatch():
+    numpy = pytest.importorskip('numpy')
+    import random
+    random.seed(42)
+
+    # Include every octant, both directions, and zero-length and axis-aligned segments.
+    segments = [(0, 0, 0, 0), (0, 0, 5, 0), (5, 0, 0, 0), (0, 0, 0, 5), (0, 5, 0, 0), (0, 0, 5, 5), (5, 5, 0, 0), (0, 0, 1, 1), (1, 1, 0, 0), (1, 0, 0, 1), (0, 0, 2.7, -3.9)]
+    for i in range(500):
+        segments.append(tuple(random.randint(-40, 40) for j in range(4)))
+    x1, y1, x2, y2 = zip(*segments)
+
+    xs, ys, offsets = pybresenham.linesBatch(x1, y1, x2, y2)
+    assert len(offsets) == len(segments) + 1
+    for i, segment in enumerate(segments):
+        batchPoints = list(zip(xs[offsets[i]:offsets[i + 1]].tolist(), ys[offsets[i]:offsets[i + 1]].tolist()))
+        assert batchPoints == list(pybresenham.line(*segment))
+
+    xs, ys, offsets = pybresenham.linesBatch([], [], [], [])
+    assert len(xs) == len(ys) == 0
+    assert offsets.tolist() == [0]
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.linesBatch([0, 0], [0], [1], [1])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.linesBatch(['invalid'], [0], [1], [1])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.linesBatch([[0]], [[0]], [[1]], [[1]])
 
 
 def test_polygon():
@@ -118,6 +364,114 @@ def test_polygon():
     with pytest.raises(NotImplementedError):
         pybresenham.polygon(0, 0, 10, 0, thickness=2)
 
+    # Filled polygons include their outline and have no duplicate points.
+    for radius in range(3, 30, 3):
+        for sides in range(3, 9):
+            outline = set(pybresenham.polygon(10, 10, radius, sides, 17))
+            filled = list(pybresenham.polygon(10, 10, radius, sides, 17, filled=True))
+            assert len(filled) == len(set(filled))
+            assert outline <= set(filled)
+            assert set(filled) == pybresenham.floodFill(list(outline), 10, 10) | set(filled) # the fill is a superset of the old flood fill
+    assert list(pybresenham.polygon(0, 0, 2, 4, 45, filled=True)) == [(0, -2), (-1, -1), (0, -1), (1, -1), (-2, 0), (-1, 0), (0, 0), (1, 0), (2, 0), (-1, 1), (0, 1), (1, 1), (0, 2)]
+
+
+def test_polygonTableCache():
+    pybresenham.clearPolygonTableCache()
+    assert pybresenham.polygonTableCacheInfo().currsize == 0
+
+    # Polygons with the same sides and rotation share one cached table, whatever their size and position.
+    hexagon = list(pybresenham.polygonVertices(0, 0, 10, 6))
+    assert list(pybresenham.polygonVertices(5, -5, 10, 6)) == [(x + 5, y - 5) for x, y in hexagon]
+    list(pybresenham.polygon(100, 100, 20, 6, stretchHorizontal=2))
+    list(pybresenham.polygonVertices(0, 0, 10, 6, rotationDegrees=30))
+    cacheInfo = pybresenham.polygonTableCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses, cacheInfo.currsize) == (2, 2, 2)
+
+    pybresenham.clearPolygonTableCache()
+    cacheInfo = pybresenham.polygonTableCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses, cacheInfo.currsize) == (0, 0, 0)
+    assert cacheInfo.maxsize == pybresenham.POLYGON_TABLE_CACHE_SIZE
+
+
+def test_fillSpans():
+    assert list(pybresenham.fillSpans([(0, 0), (4, 0), (4, 2), (0, 2)])) == [(0, 0, 4), (1, 0, 4), (2, 0, 4)]
+    assert list(pybresenham.fillSpans([(0, 0), (4, 0), (4, 2), (0, 2)], pybresenham.NONZERO)) == [(0, 0, 4), (1, 0, 4), (2, 0, 4)]
+    assert list(pybresenham.fillSpans([(0, 0), (2, 0), (2, 2)])) == [(0, 0, 2), (1, 1, 2), (2, 2, 2)]
+
+    # A non-convex U shape has two spans in its upper rows.
+    uShape = [(0, 0), (2, 0), (2, 4), (6, 4), (6, 0), (8, 0), (8, 6), (0, 6)]
+    spans = list(pybresenham.fillSpans(uShape))
+    assert spans[:5] == [(0, 0, 2), (0, 6, 8), (1, 0, 2), (1, 6, 8), (2, 0, 2)]
+    assert spans[-3:] == [(4, 0, 8), (5, 0, 8), (6, 0, 8)]
+
+    # A self-intersecting star has a hole in the middle with the even-odd rule, but not with the nonzero rule.
+    star = [(20, 0), (32, 36), (1, 14), (39, 14), (8, 36)]
+    evenOdd = set(pybresenham.spansToPoints(pybresenham.fillSpans(star)))
+    nonzero = set(pybresenham.spansToPoints(pybresenham.fillSpans(star, pybresenham.NONZERO)))
+    assert (20, 20) not in evenOdd
+    assert (20, 20) in nonzero
+    assert evenOdd < nonzero
+    assert set(pybresenham.lines(star, closed=True)) <= evenOdd
+
+    # Every row's spans are sorted and don't touch.
+    for spans in (pybresenham.fillSpans(star), pybresenham.fillSpans(uShape)):
+        spans = list(spans)
+        for (y1, xStart1, xEnd1), (y2, xStart2, xEnd2) in zip(spans, spans[1:]):
+            assert y1 < y2 or (y1 == y2 and xEnd1 + 1 < xStart2)
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.fillSpans([(0, 0), (1, 1)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.fillSpans([(0, 0), (1, 1), ('invalid', 0)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.fillSpans([(0, 0), (1, 1), (2, 0)], 'invalid fill rule')
+
+
+def test_floodFill():
+    outline = list(pybresenham.polygon(5, 5, 4, 5))
+    filled = pybresenham.floodFill(outline, 5, 5)
+    assert isinstance(filled, set)
+    assert filled == set(pybresenham.polygon(5, 5, 4, 5, filled=True)) - set([(1, 3), (9, 3)]) | set(outline)
+
+    # The fill includes the border, and doesn't spread past the rectangle around it.
+    box = list(pybresenham.rectangle(0, 0, 10, 5))
+    assert pybresenham.floodFill(box, 4, 2) == set([(x, y) for x in range(10) for y in range(5)])
+    assert pybresenham.floodFill(box, 0, 0) == set(box) # starting on the border fills nothing
+    assert pybresenham.floodFill(box, 50, 50) == set(box) # starting outside the rectangle fills nothing
+    assert pybresenham.floodFill(box, 4.5, 2.9) == pybresenham.floodFill(box, 4, 2) # float starts are truncated
+    assert pybresenham.floodFill([(0, 0), (5, 0), (5, 3)], 1, 1) == set([(0, 0), (5, 0), (5, 3), (1, 1), (2, 1), (3, 1), (4, 1), (1, 2), (2, 2), (3, 2), (4, 2)])
+
+    # 8-connected fills spread through diagonal gaps, and 4-connected fills don't.
+    diamondOutline = list(pybresenham.diamond(0, 0, 4))
+    insideDiamond = set(pybresenham.diamond(0, 0, 4, filled=True))
+    bigBox = list(pybresenham.rectangle(-5, -5, 19, 19))
+    assert pybresenham.floodFill(diamondOutline + bigBox, 5, 4) == insideDiamond | set(bigBox)
+    assert pybresenham.floodFill(diamondOutline + bigBox, 5, 4, connectivity=8) == set([(x, y) for x in range(-5, 14) for y in range(-5, 14)])
+
+    # isBoundary() works like extra border points, and isn't included in the fill.
+    calls = []
+    def isBoundary(x, y):
+        calls.append((x, y))
+        return x == 5
+    assert pybresenham.floodFill(box, 2, 2, isBoundary=isBoundary) == set(box) | set([(x, y) for x in range(1, 5) for y in range(1, 4)])
+    assert len(calls) == len(set(calls)) # called at most once per point
+
+    assert len(pybresenham.floodFill(box, 4, 2, maxPixels=24)) == 50
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFill(box, 4, 2, maxPixels=23)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFill(box, 4, 2, connectivity=6)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFill([], 4, 2)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFill(box, 'invalid', 2)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFill([('invalid', 0)], 4, 2)
+
+    # Large fills are fast enough to test.
+    assert len(pybresenham.floodFill(list(pybresenham.rectangle(0, 0, 1000, 1000)), 500, 500, asPointSet=True)) == 1000000
+
 
 def test_circle():
     c1 = list(pybresenham.circle(0, 0, 10))
@@ -136,12 +490,64 @@ def test_circle():
     assert len(c4) == len(set(c4)) # test for duplicate points
     assert set(c4) == set([(-76, 90), (-84, 66), (-65, 72), (-65, 82), (-64, 78), (-83, 89), (-90, 74), (-87, 85), (-76, 64), (-84, 88), (-89, 83), (-82, 65), (-64, 80), (-88, 84), (-64, 74), (-72, 65), (-88, 70), (-86, 86), (-90, 79), (-73, 89), (-69, 87), (-75, 90), (-86, 68), (-75, 64), (-64, 79), (-90, 75), (-81, 89), (-66, 84), (-71, 89), (-89, 82), (-65, 81), (-67, 85), (-64, 75), (-80, 64), (-80, 90), (-73, 65), (-90, 76), (-74, 64), (-89, 73), (-66, 70), (-83, 65), (-65, 71), (-79, 64), (-82, 89), (-85, 67), (-64, 76), (-72, 89), (-90, 77), (-89, 81), (-79, 90), (-87, 69), (-89, 72), (-90, 80), (-69, 67), (-67, 69), (-78, 64), (-70, 88), (-68, 68), (-65, 73), (-65, 83), (-77, 90), (-74, 90), (-64, 77), (-89, 71), (-68, 86), (-78, 90), (-81, 65), (-70, 66), (-85, 87), (-71, 65), (-77, 64), (-90, 78)])
 
-    with pytest.raises(NotImplementedError):
-        list(pybresenham.circle(0,0,0,filled=True))
+    # Compare to the original set-based algorithm for many radii.
+    for radius in range(0, 300):
+        switch = 3 - (2 * radius)
+        cx = 0
+        cy = radius
+        expected = set()
+        while cx <= cy:
+            expected.update([(cx, -cy), (cy, -cx), (cy, cx), (cx, cy), (-cx, cy), (-cy, cx), (-cy, -cx), (-cx, -cy)])
+            if switch < 0:
+                switch = switch + (4 * cx) + 6
+            else:
+                switch = switch + (4 * (cx - cy)) + 10
+                cy = cy - 1
+            cx = cx + 1
+
+        points = list(pybresenham.circle(0, 0, radius))
+        assert len(points) == len(set(points)) # test for duplicate points
+        assert set(points) == expected
+        assert points[0] == (0, -radius) # starts at 12 o'clock
+
+        # Each point is next to the previous one, going clockwise.
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            assert max(abs(x2 - x1), abs(y2 - y1)) <= 1
+            assert x1 * y2 - x2 * y1 >= 0 or radius == 0
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.circle(0, 0, -1)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.circle(0, 'invalid', 1)
+
     with pytest.raises(NotImplementedError):
         list(pybresenham.circle(0,0,0,thickness =2))
 
 
+def test_circleSpans():
+    for radius in range(0, 100):
+        outline = list(pybresenham.circle(3, -4, radius))
+
+        # The outline spans cover exactly the outline points.
+        spans = list(pybresenham.circleSpans(3, -4, radius))
+        assert spans == pybresenham.pointsToSpans(outline)
+
+        # Each row of a filled circle goes from the leftmost to the rightmost outline point on that row.
+        filledSpans = list(pybresenham.circleSpans(3, -4, radius, filled=True))
+        assert len(filledSpans) == 2 * radius + 1
+        rows = {}
+        for x, y in outline:
+            rows.setdefault(y, []).append(x)
+        assert filledSpans == [(y, min(rows[y]), max(rows[y])) for y in sorted(rows)]
+
+        filledPoints = list(pybresenham.circle(3, -4, radius, filled=True))
+        assert filledPoints == list(pybresenham.spansToPoints(filledSpans))
+        assert len(filledPoints) == len(set(filledPoints))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.circleSpans(0, 0, -1)
+
+
 def test_diamond():
     assert list(pybresenham.diamond(0,0,3)) == [(4, 0), (3, 1), (5, 1), (2, 2), (6, 2), (1, 3), (7, 3), (2, 4), (6, 4), (3, 5), (5, 5), (4, 6)]
     assert list(pybresenham.diamond(2,3,5)) == [(8, 3), (7, 4), (9, 4), (6, 5), (10, 5), (5, 6), (11, 6), (4, 7), (12, 7), (3, 8), (13, 8), (4, 9), (12, 9), (5, 10), (11, 10), (6, 11), (10, 11), (7, 12), (9, 12), (8, 13)]
@@ -200,36 +606,344 @@ def test_rectangle():
     with pytest.raises(NotImplementedError):
         list(pybresenham.rectangle(0,0,1,1, thickness=2))
 
-'''
 def test_ellipse():
+    assert list(pybresenham.ellipse(0, 0, 3, 1)) == [(-2, -1), (-1, -1), (0, -1), (1, -1), (2, -1), (-3, 0), (3, 0), (-2, 1), (-1, 1), (0, 1), (1, 1), (2, 1)]
+    assert list(pybresenham.ellipse(0, 0, 3, 1, filled=True)) == [(-2, -1), (-1, -1), (0, -1), (1, -1), (2, -1), (-3, 0), (-2, 0), (-1, 0), (0, 0), (1, 0), (2, 0), (3, 0), (-2, 1), (-1, 1), (0, 1), (1, 1), (2, 1)]
+
+    # An ellipse with equal radii is the same shape as a circle.
+    for radius in range(0, 40):
+        assert sorted(pybresenham.ellipse(3, -4, radius, radius)) == sorted(pybresenham.circle(3, -4, radius))
+        assert sorted(pybresenham.ellipse(3, -4, radius, radius, filled=True)) == sorted(pybresenham.circle(3, -4, radius, filled=True))
+
+    for radiusx, radiusy, rotationDegrees in ((7, 3, 0), (3, 7, 0), (8, 3, 30), (12, 5, 125), (1, 9, 200), (20, 19, 45)):
+        filledPoints = list(pybresenham.ellipse(2, 1, radiusx, radiusy, rotationDegrees, filled=True))
+        filledSet = set(filledPoints)
+        assert len(filledPoints) == len(filledSet)
+
+        # The outline is every filled point with a side next to a point outside of the ellipse.
+        outline = list(pybresenham.ellipse(2, 1, radiusx, radiusy, rotationDegrees))
+        assert len(outline) == len(set(outline))
+        assert set(outline) == {(x, y) for x, y in filledSet
+                                if not {(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)} <= filledSet}
+
+        # Clipping gives the same points as filtering the unclipped points.
+        clip = (0, -2, 6, 3)
+        assert list(pybresenham.ellipse(2, 1, radiusx, radiusy, rotationDegrees, clip=clip)) == [(x, y) for x, y in outline if 0 <= x <= 6 and -2 <= y <= 3]
+
+    # A quarter turn swaps the radii.
+    assert list(pybresenham.ellipse(0, 0, 9, 4, 90)) == list(pybresenham.ellipse(0, 0, 4, 9))
+    assert list(pybresenham.ellipse(0, 0, 9, 4, 270, filled=True)) == list(pybresenham.ellipse(0, 0, 4, 9, filled=True))
+
+    # Ellipses with no width or height are lines.
+    assert list(pybresenham.ellipse(0, 0, 3, 0)) == [(-3, 0), (-2, 0), (-1, 0), (0, 0), (1, 0), (2, 0), (3, 0)]
+    assert list(pybresenham.ellipse(0, 0, 0, 2)) == [(0, -2), (0, -1), (0, 0), (0, 1), (0, 2)]
+    assert sorted(pybresenham.ellipse(0, 0, 0, 3, 45)) == sorted(pybresenham.line(-2, -2, 2, 2))
+    assert list(pybresenham.ellipse(0, 0, 0, 0)) == [(0, 0)]
+
+    # Make sure invalid arguments are caught.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ellipse(0, 0, -1, 2)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ellipse(0, 0, 2, -1)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ellipse(0, 'invalid', 2, 1)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ellipse(0, 0, 2, 1, rotationDegrees='invalid')
+
+    # Test unimplemented parts.
     with pytest.raises(NotImplementedError):
-        pybresenham.ellipse(0,0)
+        list(pybresenham.ellipse(0, 0, 2, 1, thickness=2))
+
+
+def test_ellipseSpans():
+    for radiusx, radiusy, rotationDegrees in ((7, 3, 0), (40, 25, 0), (8, 3, 30), (30, 11, 160)):
+        outline = list(pybresenham.ellipse(3, -4, radiusx, radiusy, rotationDegrees))
+        assert list(pybresenham.ellipseSpans(3, -4, radiusx, radiusy, rotationDegrees)) == pybresenham.pointsToSpans(outline)
+
+        # A filled ellipse has one span per row.
+        filledSpans = list(pybresenham.ellipseSpans(3, -4, radiusx, radiusy, rotationDegrees, filled=True))
+        assert len(filledSpans) == len({y for x, y in outline})
+        assert list(pybresenham.spansToPoints(filledSpans)) == list(pybresenham.ellipse(3, -4, radiusx, radiusy, rotationDegrees, filled=True))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ellipseSpans(0, 0, -1, 1)
 
 
 def test_ellipseVertices():
-    with pytest.raises(NotImplementedError):
-        pybresenham.ellipseVertices()
+    assert list(pybresenham.ellipseVertices(0, 0, 10, 5, numVertices=4)) == [(10, 0), (0, -5), (-10, 0), (0, 5)]
+    assert list(pybresenham.ellipseVertices(0, 0, 10, 5, rotationDegrees=90, numVertices=4)) == [(0, -10), (-5, 0), (0, 10), (5, 0)]
+    assert list(pybresenham.ellipseVertices(1, 2, 10, 5, numVertices=4)) == [(11, 2), (1, -3), (-9, 2), (1, 7)]
+
+    # Every default vertex is within half a point of the ellipse.
+    vertices = list(pybresenham.ellipseVertices(0, 0, 100, 40))
+    assert len(vertices) > 4
+    for x, y in vertices:
+        assert abs(math.hypot(x / 100.0, y / 40.0) - 1) < 0.03
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.ellipseVertices(0, 0, -1, 1))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.ellipseVertices(0, 0, 1, 1, numVertices=2))
+
+
+def _isInArc(x, y, startAngle, stopAngle):
+    # Returns True if the offset (x, y) from a circle's center is inside the
+    # angles of an arc. There are no int points exactly on the lines of angles
+    # other than multiples of 45 degrees, so atan2() is exact enough.
+    if (x, y) == (0, 0) or abs(stopAngle - startAngle) >= 360:
+        return True
+    angle = math.degrees(math.atan2(-y, x)) % 360
+    return (angle - startAngle) % 360 <= (stopAngle - startAngle) % 360
 
 
 def test_arc():
-    with pytest.raises(NotImplementedError):
-        pybresenham.arc(0,0,0,0,0,0,0,0,0)
+    assert list(pybresenham.arc(0, 0, 5, 0, 90)) == [(5, 0), (5, -1), (5, -2), (4, -3), (3, -4), (2, -5), (1, -5), (0, -5)]
+    assert list(pybresenham.arc(0, 0, 5, 90, 0)) == list(pybresenham.arc(0, 0, 5, 90, 360))
+    assert list(pybresenham.arc(2, 3, 0, 10, 20)) == [(2, 3)]
+
+    for radius in (1, 2, 7, 20, 51):
+        circlePoints = list(pybresenham.circle(3, -4, radius))
+        filledPoints = list(pybresenham.circle(3, -4, radius, filled=True))
+        for startAngle, stopAngle in ((0, 90), (45, 180), (10, 20), (-30, 30), (100, 35), (44.5, 45.5), (90, 90), (0, 360), (30, 390), (200, 0)):
+            points = list(pybresenham.arc(3, -4, radius, startAngle, stopAngle))
+
+            # The arc has the circle's points inside its angles, with no repeats, going counterclockwise.
+            assert len(points) == len(set(points))
+            assert set(points) == {(x, y) for x, y in circlePoints if _isInArc(x - 3, y + 4, startAngle, stopAngle)}
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                assert max(abs(x2 - x1), abs(y2 - y1)) == 1
+
+            # Pie slices have the filled circle's points inside the arc's angles.
+            if startAngle != stopAngle:
+                assert sorted(pybresenham.arc(3, -4, radius, startAngle, stopAngle, filled=True)) == sorted((x, y) for x, y in filledPoints if _isInArc(x - 3, y + 4, startAngle, stopAngle))
+
+            # Thick arcs are the points between the circle and a smaller circle, inside the arc's angles.
+            insideCircle = set(pybresenham.circle(3, -4, radius - 3, filled=True)) if radius >= 3 else set()
+            assert sorted(pybresenham.arc(3, -4, radius, startAngle, stopAngle, thickness=3)) == sorted((x, y) for x, y in filledPoints if (x, y) not in insideCircle and _isInArc(x - 3, y + 4, startAngle, stopAngle))
+
+            # Clipping gives the same points as filtering the unclipped points.
+            clip = (0, -8, 10, 0)
+            assert list(pybresenham.arc(3, -4, radius, startAngle, stopAngle, clip=clip)) == [(x, y) for x, y in points if 0 <= x <= 10 and -8 <= y <= 0]
+
+        # A whole circle starts at the start angle and has every point of the circle.
+        assert sorted(pybresenham.arc(3, -4, radius, 0, 360)) == sorted(circlePoints)
+        assert list(pybresenham.arc(3, -4, radius, 0, 360))[0] == (3 + radius, -4)
+
+    # Make sure invalid arguments are caught.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.arc(0, 0, -1, 0, 90)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.arc(0, 0, 5, 'invalid', 90)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.arc(0, 0, 5, 0, 90, thickness=0)
+
+
+def test_arcSpans():
+    for radius in (0, 3, 12, 40):
+        for startAngle, stopAngle in ((0, 90), (45, 315), (170, 10), (33, 34), (0, 360)):
+            points = list(pybresenham.arc(0, 0, radius, startAngle, stopAngle))
+            assert list(pybresenham.arcSpans(0, 0, radius, startAngle, stopAngle)) == pybresenham.pointsToSpans(points)
+            for filled, thickness in ((True, 1), (False, 4)):
+                spans = list(pybresenham.arcSpans(0, 0, radius, startAngle, stopAngle, filled, thickness))
+                assert list(pybresenham.spansToPoints(spans)) == list(pybresenham.arc(0, 0, radius, startAngle, stopAngle, filled, thickness))
+                assert spans == pybresenham.pointsToSpans(pybresenham.spansToPoints(spans))
+
+    # A pie slice of a whole circle is the filled circle.
+    assert list(pybresenham.arcSpans(0, 0, 30, 0, 360, filled=True)) == list(pybresenham.circleSpans(0, 0, 30, filled=True))
+    assert list(pybresenham.arcSpans(0, 0, 30, 0, 360, filled=True, clip=(-5, -40, 40, 5))) == list(pybresenham.circleSpans(0, 0, 30, filled=True, clip=(-5, -40, 40, 5)))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.arcSpans(0, 0, -1, 0, 90)
 
 
 def test_arcVertices():
-    with pytest.raises(NotImplementedError):
-        pybresenham.arcVertices(0,0,0,0,0,0)
+    assert list(pybresenham.arcVertices(0, 0, 10, 0, 90, numVertices=3)) == [(10, 0), (7, -7), (0, -10)]
+    assert list(pybresenham.arcVertices(0, 0, 10, 90, 0, numVertices=4)) == [(0, -10), (-10, 0), (0, 10), (10, 0)]
+    assert list(pybresenham.arcVertices(5, 5, 10, 0, 90)) == [(15, 5), (14, 0), (10, -4), (5, -5)]
+
+    # Every default vertex is on the circle, and the lines between them stay close to it.
+    vertices = list(pybresenham.arcVertices(0, 0, 100, 30, 150))
+    assert vertices[0] == (87, -50) and vertices[-1] == (-87, -50)
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:]):
+        assert abs(math.hypot(x1, y1) - 100) <= 0.5
+        assert math.hypot((x1 + x2) / 2.0, (y1 + y2) / 2.0) >= 99
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.arcVertices(0, 0, -1, 0, 90))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.arcVertices(0, 0, 10, 0, 90, numVertices=1))
+
+
+def test_bezier():
+    assert list(pybresenham.bezier([(0, 0), (3, 0), (6, 0)])) == [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0)]
+    assert list(pybresenham.bezier([(0, 0), (6, 10), (12, 0)])) == list(pybresenham.lines([(0, 0), (3, 4), (6, 5), (9, 4), (12, 0)]))
+
+    for controlPoints in ([(0, 0), (40, 90), (80, 0)], [(0, 0), (100, 0), (0, 60), (100, 60)], [(0, 0), (90, 90), (-30, 90), (60, 0)]):
+        points = list(pybresenham.bezier(controlPoints))
+        assert points[0] == controlPoints[0]
+        assert points[-1] == controlPoints[-1]
+        assert points == list(pybresenham.lines(pybresenham.bezierVertices(controlPoints)))
+
+        # The points where the lines join aren't repeated.
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            assert max(abs(x2 - x1), abs(y2 - y1)) == 1
+
+        # Clipping gives the same points as filtering the unclipped points.
+        assert list(pybresenham.bezier(controlPoints, clip=(10, 10, 50, 40))) == [(x, y) for x, y in points if 10 <= x <= 50 and 10 <= y <= 40]
+
+    # A curve that fits in one point is just that point.
+    assert list(pybresenham.bezier([(2, 3), (2, 3), (2, 3), (2, 3)])) == [(2, 3)]
+
+    # Thick curves are drawn the same way as thick lines.
+    assert list(pybresenham.bezier([(0, 0), (6, 10), (12, 0)], thickness=3)) == list(pybresenham.lines([(0, 0), (3, 4), (6, 5), (9, 4), (12, 0)], thickness=3))
+
+
+def test_bezierVertices():
+    assert list(pybresenham.bezierVertices([(0, 0), (6, 10), (12, 0)])) == [(0, 0), (3, 4), (6, 5), (9, 4), (12, 0)]
+    assert list(pybresenham.bezierVertices([(0, 0), (6, 10), (12, 0)], maxError=2)) == [(0, 0), (6, 5), (12, 0)]
+    assert list(pybresenham.bezierVertices([(0, 0), (0, 0), (0, 0)])) == [(0, 0), (0, 0)]
+
+    # Every point of the curve is within maxError of the lines through the
+    # vertices, plus up to half a point in each direction for their rounding.
+    for controlPoints, maxError in (([(0, 0), (300, 700), (600, -100)], 0.5), ([(0, 0), (900, 0), (-300, 400), (600, 400)], 0.25), ([(5, 5), (80, -40), (-20, 60), (45, 45)], 2)):
+        vertices = list(pybresenham.bezierVertices(controlPoints, maxError))
+        for i in range(1001):
+            t = i / 1000.0
+            if len(controlPoints) == 3:
+                coefficients = ((1 - t) ** 2, 2 * (1 - t) * t, t ** 2)
+            else:
+                coefficients = ((1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3)
+            x = sum(c * px for c, (px, py) in zip(coefficients, controlPoints))
+            y = sum(c * py for c, (px, py) in zip(coefficients, controlPoints))
+            assert min(_segmentDistance(x, y, x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(vertices, vertices[1:])) <= maxError + math.sqrt(0.5)
+
+    # A long, gentle curve only needs a few vertices.
+    assert len(list(pybresenham.bezierVertices([(0, 0), (50000, 300), (100000, 0)]))) < 50
+
+    # Make sure invalid arguments are caught.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.bezierVertices([(0, 0), (1, 1)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.bezierVertices([(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.bezierVertices([(0, 0), (1, 'invalid'), (2, 2)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.bezierVertices(42)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.bezierVertices([(0, 0), (1, 1), (2, 2)], maxError=0)
+
+
+def test_bezierSegments():
+    assert list(pybresenham.bezierSegments([(0, 0), (6, 10), (12, 0)])) == [(0, 0, 3, 4), (3, 4, 6, 5), (6, 5, 9, 4), (9, 4, 12, 0)]
+    assert list(pybresenham.bezierSegments([(0, 0), (0, 0), (0, 0)])) == [(0, 0, 0, 0)]
+
+
+def _segmentDistance(x, y, x1, y1, x2, y2):
+    # Returns the distance from (x, y) to the line segment from (x1, y1) to (x2, y2).
+    dx, dy = x2 - x1, y2 - y1
+    lengthSquared = dx * dx + dy * dy
+    t = 0 if lengthSquared == 0 else max(0, min(1, ((x - x1) * dx + (y - y1) * dy) / float(lengthSquared)))
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
 
 
 def test_star():
-    with pytest.raises(NotImplementedError):
-        pybresenham.star(0,0,0,0,0,0,0)
+    for points in (3, 5, 8):
+        for radius in (0, 4, 15):
+            vertices = list(pybresenham.starVertices(10, -5, radius, points, 20))
+            assert list(pybresenham.star(10, -5, radius, points, 20)) == list(pybresenham.lines(vertices, closed=True))
+            if radius > 0:
+                assert list(pybresenham.star(10, -5, radius, points, 20, thickness=3)) == list(pybresenham.lines(vertices, closed=True, thickness=3))
+
+            # Filled stars are scan converted, not flood filled.
+            assert list(pybresenham.star(10, -5, radius, points, 20, filled=True)) == list(pybresenham.spansToPoints(pybresenham.fillSpans(vertices)))
+
+    assert list(pybresenham.star(3, 3, 0)) == [(3, 3)]
+    assert list(pybresenham.star(3, 3, 0, filled=True)) == [(3, 3)]
+    assert list(pybresenham.star(0, 0, 10, clip=(0, 0, 20, 20))) == list(pybresenham.lines(pybresenham.starVertices(0, 0, 10), closed=True, clip=(0, 0, 20, 20)))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.star(0, 0, 10, points=2)
+
+
+def test_starSpans():
+    # Small stars come from the cache of spans, and big ones are scan converted each time.
+    for radius in (0, 3, 12, pybresenham.STAR_SPANS_CACHE_MAX_RADIUS, pybresenham.STAR_SPANS_CACHE_MAX_RADIUS + 1):
+        for centerx, centery in ((0, 0), (7, -3), (-11, 20)):
+            for points, rotationDegrees, innerRadius in ((5, 0, None), (6, 15, None), (4, 45, radius / 3.0)):
+                vertices = list(pybresenham.starVertices(centerx, centery, radius, points, rotationDegrees, innerRadius))
+                outline = list(pybresenham.lines(vertices, closed=True))
+                assert list(pybresenham.starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius)) == pybresenham.pointsToSpans(outline)
+                filledSpans = list(pybresenham.starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius, filled=True))
+                assert filledSpans == list(pybresenham.fillSpans(vertices))
+
+                clip = (centerx - 2, centery - radius // 2, centerx + radius, centery + 1)
+                assert list(pybresenham.starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius, clip=clip)) == pybresenham.pointsToSpans(pybresenham.lines(vertices, closed=True, clip=clip))
+                assert list(pybresenham.starSpans(centerx, centery, radius, points, rotationDegrees, innerRadius, filled=True, clip=clip)) == list(pybresenham.fillSpans(vertices, clip=clip))
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.starSpans(0, 0, -1)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.starSpans(0, 0, 10, innerRadius=-1)
+
+
+def test_starSpansCache():
+    pybresenham.clearStarSpansCache()
+    assert pybresenham.starSpansCacheInfo().currsize == 0
+
+    # Stars of the same kind share one cached set of spans, wherever they are.
+    spans = list(pybresenham.starSpans(0, 0, 10, filled=True))
+    assert list(pybresenham.starSpans(5, -5, 10, filled=True)) == [(y - 5, xStart + 5, xEnd + 5) for y, xStart, xEnd in spans]
+    list(pybresenham.star(100, 100, 10, filled=True))
+    list(pybresenham.starSpans(0, 0, 10))
+    cacheInfo = pybresenham.starSpansCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses, cacheInfo.currsize) == (2, 2, 2)
+
+    # Stars bigger than the maximum radius aren't cached.
+    list(pybresenham.starSpans(0, 0, pybresenham.STAR_SPANS_CACHE_MAX_RADIUS + 1))
+    assert pybresenham.starSpansCacheInfo().currsize == 2
+
+    pybresenham.clearStarSpansCache()
+    cacheInfo = pybresenham.starSpansCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses, cacheInfo.currsize) == (0, 0, 0)
+    assert cacheInfo.maxsize == pybresenham.STAR_SPANS_CACHE_SIZE
 
 
 def test_starVertices():
-    with pytest.raises(NotImplementedError):
-        pybresenham.starVertices(0,0,0,0)
-'''
+    assert list(pybresenham.starVertices(10, 10, 8)) == [(10, 2), (8, 8), (2, 8), (7, 11), (5, 16), (10, 13), (15, 16), (13, 11), (18, 8), (12, 8)]
+    assert list(pybresenham.starVertices(0, 0, 10, points=4, innerRadius=3)) == [(0, -10), (-2, -2), (-10, 0), (-2, 2), (0, 10), (2, 2), (10, 0), (2, -2)]
+
+    # The vertices alternate between the outer and inner radius, going counterclockwise from the top.
+    for points in range(3, 12):
+        vertices = list(pybresenham.starVertices(0, 0, 1000, points, innerRadius=400))
+        assert len(vertices) == points * 2
+        assert vertices[0] == (0, -1000)
+        for i, (x, y) in enumerate(vertices):
+            assert abs(math.hypot(x, y) - (1000 if i % 2 == 0 else 400)) <= 1
+            angle = math.degrees(math.atan2(-y, x))
+            assert abs((angle - 90 - 180.0 / points * i + 180) % 360 - 180) < 0.2
+
+    # The default inner radius puts the corners where the lines between every other point cross.
+    x, y = list(pybresenham.starVertices(0, 0, 1000))[1]
+    assert abs(math.hypot(x, y) - 382) <= 1
+
+    # A star has the same shape wherever it's drawn, and a float center is truncated.
+    vertices = list(pybresenham.starVertices(0, 0, 9, 6))
+    assert list(pybresenham.starVertices(3, 8, 9, 6)) == [(x + 3, y + 8) for x, y in vertices]
+    assert list(pybresenham.starVertices(3.7, 8.2, 9, 6)) == [(x + 3, y + 8) for x, y in vertices]
+
+    # Stars with the same number of points share their vertex table with the polygons with twice as many sides.
+    pybresenham.clearPolygonTableCache()
+    list(pybresenham.starVertices(0, 0, 10))
+    list(pybresenham.starVertices(50, 50, 3))
+    cacheInfo = pybresenham.polygonTableCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses) == (1, 1)
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.starVertices(0, 0, 10, points=2))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.starVertices(0, 0, -10))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.starVertices(0, 0, 10, innerRadius=-1))
 
 def test_grid():
     # Test a few different grid configurations.
@@ -313,16 +1027,6 @@ def test_neckerVertices():
         pybresenham.neckerVertices(0,0,0,0,0)
 
 
-def test_bezier():
-    with pytest.raises(NotImplementedError):
-        pybresenham.bezier()
-
-
-def test_bezierVertices():
-    with pytest.raises(NotImplementedError):
-        pybresenham.bezierVertices()
-
-
 def test_roundedBox():
     with pytest.raises(NotImplementedError):
         pybresenham.roundedBox(0,0,0,0,0,0,0,0)
@@ -333,6 +1037,386 @@ def test_roundedBoxVertices():
         pybresenham.roundedBoxVertices(0,0,0,0,0)
 '''
 
+def test_spans():
+    # The *Spans() functions cover exactly the same points as their point-producing counterparts.
+    def assertSameShape(points, spans):
+        points = list(points)
+        spans = list(spans)
+        assert len(points) == len(set(points))
+        assert sorted(points, key=lambda point: (point[1], point[0])) == list(pybresenham.spansToPoints(spans))
+        assert spans == pybresenham.pointsToSpans(points)
+
+    for width in range(1, 6):
+        for height in range(1, 6):
+            for filled in (False, True):
+                assertSameShape(pybresenham.rectangle(-2, 3, width, height, filled), pybresenham.rectangleSpans(-2, 3, width, height, filled))
+        assertSameShape(pybresenham.square(1, 1, width), pybresenham.squareSpans(1, 1, width))
+    for radius in range(0, 6):
+        for filled in (False, True):
+            assertSameShape(pybresenham.diamond(2, -1, radius, filled), pybresenham.diamondSpans(2, -1, radius, filled))
+    for thickness in range(1, 4):
+        assertSameShape(pybresenham.grid(-3, 2, 3, 2, 4, 3, thickness), pybresenham.gridSpans(-3, 2, 3, 2, 4, 3, thickness))
+    for sides in range(3, 8):
+        for filled in (False, True):
+            assertSameShape(pybresenham.polygon(10, 10, 9, sides, 10, filled=filled), pybresenham.polygonSpans(10, 10, 9, sides, 10, filled=filled))
+
+    assert list(pybresenham.rectangleSpans(0, 0, 4000, 4000, filled=True))[-1] == (3999, 0, 3999)
+    assert len(list(pybresenham.rectangleSpans(0, 0, 4000, 4000, filled=True))) == 4000
+
+    assert pybresenham.pointsToSpans([]) == []
+    assert pybresenham.pointsToSpans([(0, 0), (0, 0), (1, 0), (3, 0)]) == [(0, 0, 1), (0, 3, 3)]
+    assert list(pybresenham.spansToPoints([(5, -1, 1)])) == [(-1, 5), (0, 5), (1, 5)]
+    assert list(pybresenham.diamondSpans(1.5, 0.25, 2, filled=True)) == list(pybresenham.diamondSpans(1, 0, 2, filled=True)) # float positions are truncated
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.rectangleSpans(0, 0, 0, 2))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.gridSpans(2, 2, 0, 2, 2, 2))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.polygonSpans(0, 0, 10, 2)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.diamondSpans(0, 'invalid', 2))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.pointsToSpans([(0, 'invalid')])
+
+
+def test_clip():
+    # Clipped shapes have exactly the points of the unclipped shapes that are inside the clip rectangle, in the same order.
+    def assertClipped(shapeFunction, *args, **kwargs):
+        allPoints = list(shapeFunction(*args, **kwargs))
+        for clip in ((-3, -3, 3, 3), (0, -10, 20, 2), (5, 5, 5, 5), (-20, 4, -1, 20), (-50, -50, 50, 50), (100, 100, 200, 200), (3, 3, 2, 2)):
+            left, top, right, bottom = clip
+            clipped = [(x, y) for x, y in allPoints if left <= x <= right and top <= y <= bottom]
+            assert list(shapeFunction(*args, clip=clip, **kwargs)) == clipped
+
+    for x2 in range(-12, 13, 3):
+        for y2 in range(-12, 13, 2):
+            assertClipped(pybresenham.line, 1, -2, x2, y2)
+            assertClipped(pybresenham.line, x2, y2, 1, -2)
+    assertClipped(pybresenham.line, -2, -1, 9, 4, thickness=3)
+    assertClipped(pybresenham.lines, [(0, 0), (10, 3), (5, 5), (-8, -7)])
+    assertClipped(pybresenham.lines, [(0, 0), (10, 3), (5, 5), (-8, -7)], closed=True)
+    assert list(pybresenham.lines(iter([(0, 0), (10, 3), (5, 5)]), clip=(0, 0, 20, 2))) == list(pybresenham.lines([(0, 0), (10, 3), (5, 5)], clip=(0, 0, 20, 2)))
+    for radius in range(0, 12):
+        for filled in (False, True):
+            assertClipped(pybresenham.circle, 1, 0, radius, filled)
+    for sides in range(3, 8):
+        for filled in (False, True):
+            assertClipped(pybresenham.polygon, 1, 2, 9, sides, 10, filled=filled)
+    for filled in (False, True):
+        assertClipped(pybresenham.rectangle, -4, -2, 9, 6, filled)
+        assertClipped(pybresenham.square, 2, 2, 3, filled)
+    assertClipped(pybresenham.grid, -6, -5, 3, 2, 4, 3, 2)
+    for radius in range(0, 8):
+        for filled in (False, True):
+            assertClipped(pybresenham.diamond, -4, -3, radius, filled)
+
+    def assertClippedSpans(spansFunction, *args):
+        clip = (-2, -3, 4, 1)
+        clipped = [(y, max(xStart, -2), min(xEnd, 4)) for y, xStart, xEnd in spansFunction(*args) if -3 <= y <= 1 and xStart <= 4 and xEnd >= -2]
+        assert list(spansFunction(*args + (clip,))) == clipped
+
+    assertClippedSpans(pybresenham.circleSpans, 0, 0, 6, False)
+    assertClippedSpans(pybresenham.circleSpans, 0, 0, 6, True)
+    assertClippedSpans(pybresenham.rectangleSpans, -5, -5, 7, 12, False)
+    assertClippedSpans(pybresenham.diamondSpans, -5, -4, 5, False)
+    assertClippedSpans(pybresenham.diamondSpans, -5, -4, 5, True)
+    assertClippedSpans(pybresenham.squareSpans, -5, -5, 7, False)
+    assertClippedSpans(pybresenham.squareSpans, -1, -6, 3, True)
+    for thickness in (1, 2):
+        assertClippedSpans(pybresenham.gridSpans, -6, -5, 3, 2, 2, 1, thickness)
+    for sides in range(3, 8):
+        for filled in (False, True):
+            assertClippedSpans(pybresenham.polygonSpans, 1, -1, 6, sides, 10, 1.0, 1.0, filled)
+    assertClippedSpans(pybresenham.fillSpans, [(4, 0), (7, 8), (0, 3), (8, 3), (1, 8)], pybresenham.NONZERO)
+    assertClippedSpans(pybresenham.strokeSpans, [(-5, -5), (5, 2), (0, 6)], 3, pybresenham.ROUNDED_CAP, False, pybresenham.MITER_JOIN)
+
+    # Huge shapes cost only as much as their visible part.
+    assert list(pybresenham.line(0, 0, 10**12, 3 * 10**11, clip=(10**11, 0, 10**11 + 3, 10**12))) == [(100000000000, 30000000000), (100000000001, 30000000000), (100000000002, 30000000001), (100000000003, 30000000001)]
+    assert len(list(pybresenham.circle(0, 0, 10**9, clip=(-50, -10**9, 49, 0)))) == 100
+    assert len(list(pybresenham.circle(0, 0, 10**9, filled=True, clip=(0, 0, 99, 99)))) == 10000
+    assert len(list(pybresenham.polygon(0, 0, 10**9, 6, filled=True, clip=(0, 0, 99, 99)))) == 10000
+    assert len(list(pybresenham.rectangle(0, 0, 10**9, 10**9, clip=(-5, -5, 4, 4)))) == 9
+    assert len(list(pybresenham.gridSpans(0, 0, 10**9, 10**9, 3, 3, clip=(0, 0, 99, 99)))) == 1900
+    assert len(list(pybresenham.diamond(0, 0, 10**9, filled=True, clip=(10**9 - 4, 10**9 - 4, 10**9 + 5, 10**9 + 5)))) == 100
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.line(0, 0, 5, 5, clip=(0, 0, 5))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.circle(0, 0, 5, clip=(0, 0, 5, 'invalid'))
+    with pytest.raises(pybresenham.PyBresenhamException):
+        list(pybresenham.rectangle(0, 0, 5, 5, clip=5))
+
+
+def test_numpyKernels():
+    numpy = pytest.importorskip('numpy')
+
+    # The kernels produce the same points as the generators, in the same order.
+    for x2 in range(-6, 7, 2):
+        for y2 in range(-6, 7, 3):
+            assert pybresenham.lineArray(1, 0, x2, y2).tolist() == [list(point) for point in pybresenham.line(1, 0, x2, y2)]
+    for width in range(1, 5):
+        for height in range(1, 5):
+            for filled in (False, True):
+                assert pybresenham.rectangleArray(-2, 3, width, height, filled).tolist() == [list(point) for point in pybresenham.rectangle(-2, 3, width, height, filled)]
+    for radius in range(0, 5):
+        for filled in (False, True):
+            assert pybresenham.diamondArray(2, -1, radius, filled).tolist() == [list(point) for point in pybresenham.diamond(2, -1, radius, filled)]
+    assert pybresenham.lineArray(0, 0, 10**6, 3).shape == (10**6 + 1, 2)
+
+    # The flood fill has the same points as floodFill(), sorted by row.
+    def sortedFloodFill(*args, **kwargs):
+        return sorted(pybresenham.floodFill(*args, **kwargs), key=lambda point: (point[1], point[0]))
+    outline = list(pybresenham.polygon(10, 10, 9, 5)) + list(pybresenham.circle(10, 10, 3)) + list(pybresenham.rectangle(-3, -3, 26, 26))
+    for startx, starty in ((10, 10), (10, 5), (0, 0), (10, 7), (-3, -3), (50, 50)):
+        for connectivity in (4, 8):
+            expected = sortedFloodFill(outline, startx, starty, connectivity=connectivity)
+            assert [tuple(point) for point in pybresenham.floodFillArray(outline, startx, starty, connectivity).tolist()] == expected
+            assert [tuple(point) for point in pybresenham.floodFillArray(numpy.array(outline), startx, starty, connectivity).tolist()] == expected
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.rectangleArray(0, 0, 0, 5)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFillArray([], 0, 0)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFillArray([(0, 0)], 0, 0, connectivity=6)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.floodFillArray([(0, 'invalid')], 0, 0)
+
+
+def test_rasterize():
+    numpy = pytest.importorskip('numpy')
+    import asyncio
+
+    scene = pybresenham.Scene(60, 40)
+    scene.rectangle(-5, -5, 40, 30, filled=True, value=1)
+    scene.rectangle(10, 5, 45, 40, value=2)
+    scene.diamond(30, 10, 12, filled=True, value=3)
+    scene.diamond(-4, 20, 15, value=4)
+    scene.circle(30, 20, 18, value=5)
+    scene.circle(55, 35, 9, filled=True, value=5)
+    scene.polygon(20, 20, 15, 6, 10, filled=True, value=6)
+    scene.polygon(40, 15, 20, 5, value=7)
+    scene.line(-10, 0, 70, 39, value=7)
+    scene.lines([(0, 39), (30, 0), (59, 39)], closed=True, value=7)
+    scene.line(0, 20, 59, 20, value=8)
+    expected = numpy.frombuffer(bytes(scene.render(processes=1)), dtype=numpy.uint8).reshape(40, 60)
+
+    assert (pybresenham.rasterize(scene) == expected).all()
+    image = numpy.full((40, 60), 9, dtype=numpy.int32)
+    assert pybresenham.rasterize(scene, image) is image
+    assert ((image == expected) | ((expected == 0) & (image == 9))).all()
+
+    async def rasterizeScenes():
+        return await asyncio.gather(pybresenham.rasterizeAsync(scene), pybresenham.rasterizeAsync(scene))
+    for image in asyncio.run(rasterizeScenes()):
+        assert (image == expected).all()
+    with pytest.raises(RuntimeError):
+        pybresenham.rasterizeAsync(scene) # (There's no running event loop.)
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.rasterize(scene, numpy.zeros((60, 40)))
+
+    # Only the visible parts of shapes that reach far off of the image are calculated.
+    scene = pybresenham.Scene(100, 100)
+    scene.line(0, 0, 10 ** 8, 5, value=1)
+    scene.line(10 ** 9, -10 ** 9 + 30, -10 ** 9, 10 ** 9 + 50, value=2)
+    scene.lines([(-10 ** 8, 50), (10 ** 8, 60), (50, -10 ** 8)], closed=True, value=3)
+    scene.diamond(-10 ** 7, 20, 10 ** 7 + 50, value=4)
+    scene.diamond(-10 ** 7, -10 ** 7, 10 ** 7 + 50, filled=True, value=5)
+    scene.diamond(40, -10 ** 7, 10 ** 7, value=6)
+    expected = numpy.frombuffer(bytes(scene.render(processes=1)), dtype=numpy.uint8).reshape(100, 100)
+    assert (pybresenham.rasterize(scene) == expected).all()
+
+
+def test_Scene():
+    width, height = 90, 70
+    scene = pybresenham.Scene(width, height)
+    image = bytearray(width * height)
+
+    # Draw the same shapes into a scene and directly into an image, overlapping each other and the image's edges.
+    scene.rectangle(-5, -5, 50, 40, filled=True, value=1)
+    pybresenham.drawRectangle(image, -5, -5, 50, 40, filled=True, value=1, width=width, height=height)
+    scene.circle(45, 35, 30, value=2)
+    pybresenham.drawCircle(image, 45, 35, 30, value=2, width=width, height=height)
+    scene.circle(80, 60, 20, filled=True, value=3)
+    pybresenham.drawCircle(image, 80, 60, 20, filled=True, value=3, width=width, height=height)
+    scene.polygon(30, 40, 25, 5, 10, filled=True, value=4)
+    pybresenham.drawPolygon(image, 30, 40, 25, 5, 10, filled=True, value=4, width=width, height=height)
+    scene.polygon(60, 20, 35, 7, value=5)
+    pybresenham.drawPolygon(image, 60, 20, 35, 7, value=5, width=width, height=height)
+    scene.lines([(0, 69), (45, 0), (89, 69)], closed=True, value=6)
+    pybresenham.drawLines(image, [(0, 69), (45, 0), (89, 69)], closed=True, value=6, width=width, height=height)
+    scene.line(-100, 10, 200, 50, value=7)
+    pybresenham.drawLine(image, -100, 10, 200, 50, value=7, width=width, height=height)
+    scene.rectangle(1000, 1000, 5, 5, value=8) # This is completely outside of the image.
+    assert len(scene) == 8
+
+    # The image is the same for every tile size and number of processes.
+    assert scene.render(processes=1) == image
+    assert scene.render(processes=1, tileSize=7) == image
+    assert scene.render(processes=2, tileSize=16) == image
+
+    tiles = scene.tiles(tileSize=32)
+    assert [clip for clip, shapes in tiles] == [(0, 0, 31, 31), (32, 0, 63, 31), (64, 0, 89, 31), (0, 32, 31, 63), (32, 32, 63, 63), (64, 32, 89, 63), (0, 64, 31, 69), (32, 64, 63, 69), (64, 64, 89, 69)]
+    assert [shape[2] for shape in tiles[0][1]] == [1, 2, 4, 5, 6, 7]
+
+    assert pybresenham.Scene(0, 0).render() == bytearray()
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        scene.line(0, 0, 5, 5, value=256)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        scene.lines([(0, 0)])
+    with pytest.raises(pybresenham.PyBresenhamException):
+        scene.rectangle(0, 0, 0, 5)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        scene.render(processes=0)
+
+
+def test_ShapeCache():
+    cache = pybresenham.ShapeCache()
+
+    # Cached shapes are the same as the uncached ones, wherever they're drawn.
+    for filled in (False, True):
+        for radius in range(0, 20):
+            for x, y in ((0, 0), (3, -7), (-20, 30)):
+                assert list(cache.circle(x, y, radius, filled)) == list(pybresenham.circle(x, y, radius, filled))
+                assert list(cache.diamond(x, y, radius, filled)) == list(pybresenham.diamond(x, y, radius, filled))
+                assert list(cache.circle(x, y, radius, filled).spans()) == list(pybresenham.circleSpans(x, y, radius, filled))
+                assert len(cache.diamond(x, y, radius, filled)) == len(list(pybresenham.diamond(x, y, radius, filled)))
+                if radius > 0:
+                    for stretchVertical in (1.0, 1.5, 2):
+                        assert list(cache.polygon(x, y, radius, 5, 10, 1.3, stretchVertical, filled)) == list(pybresenham.polygon(x, y, radius, 5, 10, 1.3, stretchVertical, filled))
+
+    # Polygons with float centers are stored at their exact position, since they're truncated differently at each one.
+    import random
+    random.seed(42)
+    for i in range(200):
+        x, y = random.uniform(-50, 50), random.uniform(-50, 50)
+        radius, sides, filled = random.randint(1, 20), random.randint(3, 8), random.random() < 0.5
+        assert list(cache.polygon(x, y, radius, sides, 17.5, filled=filled)) == list(pybresenham.polygon(x, y, radius, sides, 17.5, filled=filled))
+    cache = pybresenham.ShapeCache()
+    list(cache.polygon(10.5, 3.25, 8, 5))
+    list(cache.polygon(10.5, 3.25, 8, 5))
+    list(cache.polygon(11.5, 3.25, 8, 5))
+    list(cache.polygon(11.0, 3.0, 8, 5))
+    assert cache.cacheInfo()[:2] == (1, 3)
+
+    # Diamonds truncate float positions to ints, so they can be cached at the origin.
+    for i in range(200):
+        x, y = random.uniform(-50, 50), random.uniform(-50, 50)
+        radius, filled = random.randint(0, 20), random.random() < 0.5
+        assert list(cache.diamond(x, y, radius, filled)) == list(pybresenham.diamond(x, y, radius, filled)) == list(pybresenham.diamond(int(x), int(y), radius, filled))
+    assert list(cache.diamond(1.5, 0.25, 2)) == list(pybresenham.diamond(1.5, 0.25, 2)) == [(4, 0), (3, 1), (5, 1), (2, 2), (6, 2), (3, 3), (5, 3), (4, 4)]
+
+    # Only the first drawing of each shape is a miss.
+    cache = pybresenham.ShapeCache()
+    for x in range(10):
+        list(cache.circle(x, 0, 5))
+    list(cache.circle(0, 0, 5, filled=True))
+    assert cache.cacheInfo()[:3] == (9, 2, 0)
+
+    # The least recently used shapes are evicted when the byte budget is exceeded.
+    cache = pybresenham.ShapeCache(maxBytes=1000)
+    list(cache.circle(0, 0, 5, filled=True))  # 11 spans, 132 bytes
+    list(cache.circle(0, 0, 10))              # 56 points, 448 bytes
+    list(cache.circle(0, 0, 5, filled=True))
+    list(cache.circle(0, 0, 11))              # 64 points, 512 bytes, which evicts circle(0, 0, 10)
+    assert cache.cacheInfo() == (1, 3, 1, 644, 1000)
+    assert list(cache.circle(0, 0, 40)) == list(pybresenham.circle(0, 0, 40)) # too big to cache
+    assert cache.cacheInfo() == (1, 4, 1, 644, 1000)
+    cache.clear()
+    assert cache.cacheInfo() == (0, 0, 0, 0, 1000)
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        cache.circle('invalid', 0, 5)
+    with pytest.raises(pybresenham.PyBresenhamException):
+        cache.circle(0, 0, 'invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.ShapeCache(maxBytes=-1)
+
+
+def test_drawToBuffer():
+    import array
+
+    def bufferPoints(buffer, width, stride=None):
+        stride = width if stride is None else stride
+        return set((i % stride, i // stride) for i, value in enumerate(buffer) if value == 7 and i % stride < width)
+
+    # Draw into a flat bytearray with a stride larger than the width.
+    image = bytearray(12 * 10)
+    assert pybresenham.drawLine(image, 0, 0, 9, 4, value=7, width=10, stride=12) == 10
+    assert bufferPoints(image, 10, 12) == set(pybresenham.line(0, 0, 9, 4))
+
+    # Draw each shape and compare it to the points of its generator.
+    shapes = [(pybresenham.drawLines, pybresenham.lines, ([(1, 1), (8, 3), (4, 8)], True)),
+              (pybresenham.drawCircle, pybresenham.circle, (10, 10, 6)),
+              (pybresenham.drawCircle, pybresenham.circle, (10, 10, 6, True)),
+              (pybresenham.drawRectangle, pybresenham.rectangle, (2, 3, 9, 5)),
+              (pybresenham.drawRectangle, pybresenham.rectangle, (2, 3, 9, 5, True)),
+              (pybresenham.drawDiamond, pybresenham.diamond, (3, 3, 4, True)),
+              (pybresenham.drawPolygon, pybresenham.polygon, (10, 10, 7, 5)),
+              (pybresenham.drawPolygon, pybresenham.polygon, (10, 10, 7, 6, 0, 1.0, 1.0, True)),
+              (pybresenham.drawStar, pybresenham.star, (10, 10, 8)),
+              (pybresenham.drawStar, pybresenham.star, (10, 10, 8, 6, 15, None, True)),
+              (pybresenham.drawGrid, pybresenham.grid, (1, 1, 3, 2, 3, 3, 2))]
+    for drawFunction, shapeFunction, args in shapes:
+        expected = set(shapeFunction(*args))
+        for buffer in (bytearray(20 * 20), array.array('i', [0] * 400), memoryview(bytearray(400))):
+            assert drawFunction(buffer, *args, value=7, width=20) == len(expected)
+            assert bufferPoints(buffer, 20) == expected
+
+        buffer = memoryview(bytearray(400)).cast('B', (20, 20))
+        assert drawFunction(buffer, *args, value=7) == len(expected)
+        assert bufferPoints(buffer.cast('B'), 20) == expected
+
+    # Points outside of the buffer are clipped.
+    image = bytearray(5 * 5)
+    assert pybresenham.drawRectangle(image, -2, -2, 4, 10, filled=True, value=7, width=5) == 10
+    assert bufferPoints(image, 5) == set((x, y) for x in range(2) for y in range(5))
+    image = bytearray(5 * 5)
+    assert pybresenham.drawLine(image, -10, 2, 10, 2, value=7, width=5) == 5
+    assert pybresenham.drawCircle(image, 100, 100, 5, value=7, width=5) == 0
+
+    # Huge shapes are clipped to the buffer before their points are calculated, so they only cost as much as their visible part.
+    image = bytearray(100 * 100)
+    assert pybresenham.drawCircle(image, 50, 50, 10 ** 9, width=100) == 0
+    assert pybresenham.drawCircle(image, 50, 50, 10 ** 9, filled=True, width=100) == 10000
+    assert pybresenham.drawLine(image, 0, 0, 10 ** 12, 3, width=100) == 100
+    assert pybresenham.drawLines(image, [(0, 0), (10 ** 12, 3), (5, 10 ** 12)], True, width=100) == 199
+    assert pybresenham.drawRectangle(image, -10 ** 12, -10 ** 12, 3 * 10 ** 12, 3 * 10 ** 12, width=100) == 0
+    assert pybresenham.drawDiamond(image, -10 ** 12, -10 ** 12, 10 ** 12 + 50, filled=True, width=100) == 10000
+    assert pybresenham.drawPolygon(image, 50, 50, 10 ** 12, 7, width=100) == 0
+    assert pybresenham.drawStar(image, 50, 50, 10 ** 12, filled=True, width=100) == 10000
+    assert pybresenham.drawGrid(image, 0, 0, 10 ** 9, 10 ** 9, 3, 3, width=100) == 4375
+    assert pybresenham.drawCircle(bytearray(0), 0, 0, 5, width=0) == 0
+
+    # Test invalid arguments.
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.drawLine(bytearray(25), 0, 0, 1, 1) # no width for a flat buffer
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.drawLine(bytearray(25), 0, 0, 1, 1, width=5, height=6) # buffer is too small
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.drawLine(bytearray(25), 0, 0, 1, 1, width=5, stride=4) # stride is less than width
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.drawLine(bytearray(25), 0, 0, 1, 1, value=256, width=5) # value doesn't fit in a byte
+
+
+def test_drawToNumpyBuffer():
+    numpy = pytest.importorskip('numpy')
+    image = numpy.zeros((20, 30), dtype=numpy.uint8)
+    assert pybresenham.drawPolygon(image, 15, 10, 8, 5, filled=True, value=3) == len(list(pybresenham.polygon(15, 10, 8, 5, filled=True)))
+    assert set(zip(*reversed(numpy.nonzero(image)))) == set(pybresenham.polygon(15, 10, 8, 5, filled=True))
+
+    flatImage = numpy.zeros(20 * 30, dtype=numpy.int32)
+    pybresenham.drawGrid(flatImage, 0, 0, 2, 2, 5, 5, value=-1, width=30)
+    assert set((int(i) % 30, int(i) // 30) for i in numpy.nonzero(flatImage)[0]) == set(pybresenham.grid(0, 0, 2, 2, 5, 5))
+
+
 def test_translatePoints():
     assert list(pybresenham.translatePoints([(0, 0), (10, 0), (0, 10), (10, 10)], 0, 0)) == [(0, 0), (10, 0), (0, 10), (10, 10)]
     assert list(pybresenham.translatePoints([(0, 0), (10, 0), (0, 10), (10, 10)], 3, 0)) == [(3, 0), (13, 0), (3, 10), (13, 10)]
@@ -347,5 +1431,133 @@ def test_translatePoints():
         list(pybresenham.translatePoints([(0, 0), (10, 0), (0, 'invalid'), (10, 10)], 0, 0))
 
 
+def test_instrumentation():
+    originalCircle = pybresenham.circle
+    calls = []
+    pybresenham.clearInstrumentationStats()
+    pybresenham.enableInstrumentation(callback=lambda *args: calls.append(args))
+    try:
+        assert pybresenham.circle is not originalCircle
+        assert list(pybresenham.circle(0, 0, 10)) == list(originalCircle(0, 0, 10))
+        assert len(pybresenham.circle(0, 0, 10, asPointSet=True)) == 56
+
+        # A generator that is closed early only counts the points it produced.
+        points = pybresenham.line(0, 0, 10, 0)
+        next(points)
+        next(points)
+        points.close()
+
+        # polygon() calls polygonVertices() and fillSpans(), so they are measured too.
+        numPolygonPoints = len(list(pybresenham.polygon(0, 0, 20, 6, filled=True)))
+    finally:
+        pybresenham.disableInstrumentation()
+    assert pybresenham.circle is originalCircle
+
+    stats = pybresenham.instrumentationStats()
+    assert stats['circle'].calls == 2 and stats['circle'].points == 112
+    assert stats['line'].calls == 1 and stats['line'].points == 2
+    assert stats['polygon'].points == numPolygonPoints
+    assert stats['polygonVertices'].calls == 1 and stats['fillSpans'].calls == 1
+    assert stats['polygon'].seconds >= stats['fillSpans'].seconds >= 0
+    assert 'rectangle' not in stats
+
+    assert calls[0] == ('circle', (0, 0, 10), {}, 56, calls[0][4])
+    assert calls[1][:4] == ('circle', (0, 0, 10), {'asPointSet': True}, 56)
+    assert calls[2][:4] == ('line', (0, 0, 10, 0), {}, 2)
+    assert [call[0] for call in calls].count('polygon') == 1
+
+    # The totals are kept until they are cleared.
+    list(pybresenham.circle(0, 0, 10))
+    assert pybresenham.instrumentationStats()['circle'].calls == 2
+    pybresenham.clearInstrumentationStats()
+    assert pybresenham.instrumentationStats() == {}
+
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.enableInstrumentation(callback='invalid')
+    with pytest.raises(pybresenham.PyBresenhamException):
+        pybresenham.enableInstrumentation(callback=print, monitoring=True)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='sys.monitoring requires Python 3.12 or later')
+def test_instrumentationMonitoring():
+    seenNames = []
+
+    def onStart(code, instructionOffset):
+        seenNames.append(code.co_name)
+
+    # Another sys.monitoring tool sees the calls under the names of the measured functions.
+    sys.monitoring.use_tool_id(sys.monitoring.DEBUGGER_ID, 'test')
+    sys.monitoring.register_callback(sys.monitoring.DEBUGGER_ID, sys.monitoring.events.PY_START, onStart)
+    pybresenham.clearInstrumentationStats()
+    pybresenham.enableInstrumentation(monitoring=True)
+    try:
+        for code in pybresenham._instrumentation._monitoredCodes:
+            sys.monitoring.set_local_events(sys.monitoring.DEBUGGER_ID, code, sys.monitoring.events.PY_START)
+        assert len(list(pybresenham.circle(0, 0, 10))) == 56
+        points = pybresenham.lines([(0, 0), (10, 0), (10, 10)])
+        next(points)
+        points.close()
+        with pytest.raises(pybresenham.PyBresenhamException):
+            list(pybresenham.line(0, 0, 'invalid', 0))
+    finally:
+        pybresenham.disableInstrumentation()
+        sys.monitoring.register_callback(sys.monitoring.DEBUGGER_ID, sys.monitoring.events.PY_START, None)
+        sys.monitoring.free_tool_id(sys.monitoring.DEBUGGER_ID)
+
+    assert seenNames[:2] == ['circle', 'lines']
+    stats = pybresenham.instrumentationStats()
+    assert stats['circle'] == (1, 56, stats['circle'].seconds)
+    assert stats['lines'].calls == 1 and stats['lines'].points == 1
+    assert stats['line'].calls == 1 and stats['line'].points == 0
+    assert pybresenham._instrumentation._monitoringThreadState.startTimes == []
+    assert sys.monitoring.get_tool(3) is None
+
+
+# The most time that `import pybresenham` may take, in seconds.
+IMPORT_TIME_BUDGET = 0.025
+
+
+def test_importTime():
+    # Run a fresh interpreter that can write the bytecode cache, so that the
+    # time isn't spent compiling the module.
+    repoFolder = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPATH'] = repoFolder
+
+    def importTimes():
+        # Returns the seconds that `import pybresenham` took, as measured by -X importtime.
+        output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import pybresenham'], env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+        for line in output.splitlines():
+            selfTime, cumulativeTime, name = line.split(':', 1)[1].split('|')
+            if name.strip() == 'pybresenham':
+                return int(cumulativeTime) / 1000000.0
+
+    assert min(importTimes() for i in range(5)) < IMPORT_TIME_BUDGET
+
+    # Only the core rasterizers are loaded, not doctest, NumPy, or the submodules.
+    def loadedModules(code):
+        output = subprocess.run([sys.executable, '-c', code + 'import sys; print(" ".join(sys.modules))'], env=env, stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+        return set(output.split())
+    newModules = loadedModules('import pybresenham; ') - loadedModules('')
+    assert 'pybresenham' in newModules
+    for moduleName in ('doctest', 'numpy', 're', 'concurrent.futures', 'multiprocessing', 'pybresenham._arrays', 'pybresenham._scene', 'pybresenham._cache', 'pybresenham._instrumentation'):
+        assert moduleName not in newModules
+
+
+def test_lazyNames():
+    for name in ('Scene', 'ShapeCache', 'lineArray', 'rasterize', 'enableInstrumentation'):
+        assert name in dir(pybresenham)
+        assert getattr(pybresenham, name).__name__ == name
+    assert pybresenham.Scene is pybresenham._scene.Scene
+    assert pybresenham.INSTRUMENTED_FUNCTIONS == pybresenham._instrumentation.INSTRUMENTED_FUNCTIONS
+    from pybresenham import ShapeCache, linesBatch
+
+    with pytest.raises(AttributeError):
+        pybresenham.invalidName
+    with pytest.raises(AttributeError):
+        pybresenham._privateName
+
+
 if __name__ == '__main__':
     pytest.main()